@@ -0,0 +1,47 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""
+Measures the overhead of validating coroutine functions under a local event
+loop, compared to the undecorated coroutine function.
+
+Run: python benchmarks/bench_async.py
+"""
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from paramvalidator import ParameterValidator
+
+
+async def handler(num, name, items):
+    return num
+
+
+validated_handler = ParameterValidator((int, False, (0, 100)), (str, False), (list, True))(handler)
+
+
+async def run(func, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        await func(42, "name", None)
+    return (time.perf_counter() - start) / calls * 1e9
+
+
+def main(calls=200000):
+    loop = asyncio.new_event_loop()
+    try:
+        baseline = min(loop.run_until_complete(run(handler, calls)) for _ in range(5))
+        validated = min(loop.run_until_complete(run(validated_handler, calls)) for _ in range(5))
+    finally:
+        loop.close()
+    print("{:<14} {:>10.1f} ns/call".format("undecorated", baseline))
+    print("{:<14} {:>10.1f} ns/call".format("validated", validated))
+    print("{:<14} {:>10.1f} ns/call".format("overhead", validated - baseline))
+
+
+if __name__ == "__main__":
+    main()
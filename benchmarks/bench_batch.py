@@ -0,0 +1,75 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""
+Compares validating records one decorated call at a time with the batch
+APIs ParameterValidator.validate_many and ParameterValidator.validate_columns.
+
+Run: python benchmarks/bench_batch.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from paramvalidator import ParameterValidator, ParameterValidationException
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+SPEC = ((int, False, (0, 1000)), (float, False, (0.0, 1.0)), (str, True))
+
+
+def make_rows(count, failure_rate=0.05):
+    rng = random.Random(42)
+    rows = []
+    for _ in range(count):
+        num = rng.randint(0, 1000) if rng.random() > failure_rate else 5000
+        rows.append((num, rng.random(), "name"))
+    return rows
+
+
+def per_call(rows):
+    @ParameterValidator(*SPEC)
+    def ingest(num, ratio, name):
+        pass
+
+    failed = []
+    for index, row in enumerate(rows):
+        try:
+            ingest(*row)
+        except ParameterValidationException:
+            failed.append(index)
+    return failed
+
+
+def timed(label, callable_, *args):
+    start = time.perf_counter()
+    result = callable_(*args)
+    print("{:<24} {:>10.1f} ms".format(label, (time.perf_counter() - start) * 1e3))
+    return result
+
+
+def main(count=200000):
+    rows = make_rows(count)
+    validator = ParameterValidator(*SPEC)
+    expected = timed("per-call try/except", per_call, rows)
+    report = timed("validate_many", validator.validate_many, rows)
+    assert report.failed_indices == expected
+
+    columns = [list(column) for column in zip(*rows)]
+    report = timed("validate_columns (lists)", validator.validate_columns, columns)
+    assert report.failed_indices == expected
+
+    if numpy is not None:
+        columns = [numpy.array(columns[0]), numpy.array(columns[1]), columns[2]]
+        report = timed("validate_columns (numpy)", validator.validate_columns, columns)
+        assert report.failed_indices == expected
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""
+Memory and time of validating large mmap backed arguments with Buffer specs.
+
+Maps a temporary file of --size MB and validates it with a Buffer spec that
+accepts it, and one that rejects it, rendering the message of the failure.
+Both only create a memoryview of the mapping, the peak of Python allocations
+(tracemalloc) and the process peak RSS stay flat whatever the size. For
+comparison, copying the mapping to bytes and rendering it, as a message
+showing the whole value would, allocates several times its size.
+
+Run: python benchmarks/bench_buffers.py [--size MB]
+"""
+import argparse
+import mmap
+import os
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from paramvalidator import ParameterValidator, Buffer
+from paramvalidator.exceptions import ParameterValidationException
+
+
+def measure(call, number):
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(number):
+        call()
+    elapsed = (time.perf_counter() - start) / number
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Buffer spec memory benchmark")
+    parser.add_argument("--size", type=int, default=256, help="size of the mapped file in MB")
+    options = parser.parse_args(argv)
+    size = options.size << 20
+
+    accepted = ParameterValidator((mmap.mmap, False, Buffer(max_size=size, readonly=True)))(len)
+    rejected = ParameterValidator((mmap.mmap, False, Buffer(max_size=size // 2)))(len)
+
+    with tempfile.TemporaryFile() as handle:
+        handle.truncate(size)
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            def reject():
+                try:
+                    rejected(mapped)
+                except ParameterValidationException as ex:
+                    return str(ex)
+
+            cases = [
+                ("accepted", lambda: accepted(mapped), 10000),
+                ("rejected + message", reject, 10000),
+                ("copy to bytes", lambda: bytes(mapped), 3),
+                ("copy + str()", lambda: str(bytes(mapped)), 1),
+            ]
+            print("mapped {} MB, message: {}".format(options.size, reject()))
+            print("{:<20} {:>12} {:>16} {:>14}".format("case", "us/call", "peak alloc KB", "peak RSS MB"))
+            for label, call, number in cases:
+                elapsed, peak = measure(call, number)
+                rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+                print("{:<20} {:>12.1f} {:>16.1f} {:>14.1f}".format(label, elapsed * 1e6, peak / 1024, rss))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""
+Compares the compiled validation plan used by ParameterValidator with the
+original interpreted path, which walked the validation tuples on every call
+through _validate_args_arguments and _validate_kwargs_arguments.
+
+Run: python benchmarks/bench_compiled.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from paramvalidator import ParameterValidator
+from paramvalidator.exceptions import ParameterCountValidationException
+
+ARGS_SPEC = ((int, False, (0, 100)), (str, False), (list, True), (float, False, (0.0, 1.0)))
+KWARGS_SPEC = dict(age=(int, False, (0, 150)), name=(str, False), addresses=(list, True))
+
+
+def interpreted(validator):
+    """
+    Builds a wrapper equivalent to the pre-compilation ParameterValidator.__call__.
+    """
+    def decorate(func):
+        def wrapper(*args, **kwargs):
+            args_to_validate = args
+            if len(args) and func.__qualname__.startswith(args[0].__class__.__name__):
+                args_to_validate = args[1:]
+            if len(args_to_validate) and (len(args) != func.__code__.co_argcount):
+                raise ParameterCountValidationException(func, len(args))
+            validate_kwargs = False
+            if len(args_to_validate):
+                validate_kwargs = len(validator.validation_kwargs) > 0
+                validator._validate_args_arguments(func, args_to_validate, validator.validation_args)
+            elif len(validator.validation_kwargs):
+                validate_kwargs = True
+            else:
+                raise ParameterCountValidationException(func, 0)
+            if validate_kwargs:
+                if not kwargs:
+                    kwargs = {}
+                validator._validate_kwargs_arguments(func, kwargs, validator.validation_kwargs)
+            return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def target_args(num, name, items, ratio):
+    return num
+
+
+def target_kwargs(**kwargs):
+    return kwargs
+
+
+def main(number=100000):
+    cases = [
+        ("args", target_args, ARGS_SPEC, {}, (42, "name", None, 0.5), {}),
+        ("kwargs", target_kwargs, (), KWARGS_SPEC, (), dict(age=30, name="Fred", addresses=[])),
+    ]
+    print("{:<8} {:>14} {:>14} {:>8}".format("case", "interpreted ns", "compiled ns", "speedup"))
+    for name, target, spec_args, spec_kwargs, call_args, call_kwargs in cases:
+        old = interpreted(ParameterValidator(*spec_args, **spec_kwargs))(target)
+        new = ParameterValidator(*spec_args, **spec_kwargs)(target)
+        old_ns = min(timeit.repeat(lambda: old(*call_args, **call_kwargs), number=number, repeat=9)) / number * 1e9
+        new_ns = min(timeit.repeat(lambda: new(*call_args, **call_kwargs), number=number, repeat=9)) / number * 1e9
+        print("{:<8} {:>14.1f} {:>14.1f} {:>7.2f}x".format(name, old_ns, new_ns, old_ns / new_ns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""
+Concurrency stress and scaling benchmark.
+
+Runs a decorated function, with telemetry and a memo cache enabled, from
+1..N threads and 1..N processes. Every worker makes the same mix of valid and
+invalid calls, so the number of accepted calls, of each exception and of the
+calls counted by the telemetry is known and checked. The throughput of each
+run is reported with its scaling relative to one worker.
+
+With the GIL, threads are not expected to scale, processes are. On a free
+threaded build (python3.13t and later) threads are expected to scale too.
+
+Run: python benchmarks/bench_concurrency.py [--workers N] [--calls N] [--min-scaling F]
+
+    --min-scaling F  exit with an error if the scaling at N workers is below
+                     F, for processes, and for threads on free threaded builds
+"""
+import argparse
+import multiprocessing
+import multiprocessing.pool
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from paramvalidator import ParameterValidator, Items, stats
+from paramvalidator.exceptions import ParameterRangeValidationException, ParameterTypeValidationException
+
+
+validator = ParameterValidator(
+    (str, False, frozenset({"read", "write"})),
+    (int, False, (0, 100)),
+    (tuple, False, Items((int, False, (0, 9)))),
+    timeout=(float, True, (0.0, 60.0))).with_stats().with_memo()
+
+
+@validator
+def handle(mode, size, shape, **kwargs):
+    return size
+
+
+STATS_NAME = __name__ + ".handle"
+
+# One round of calls: (args, kwargs, expected outcome)
+ROUND = [
+    (("read", 10, (1, 2, 3)), {"timeout": 1.0}, "ok"),
+    (("write", 99, (9,)), {}, "ok"),
+    (("read", 101, (1,)), {}, "ParameterRangeValidationException"),
+    (("write", 1, (1, 10)), {}, "ParameterRangeValidationException"),
+    (("read", "1", ()), {}, "ParameterTypeValidationException"),
+    (("read", 0, (0,) * 8), {"timeout": 30.0}, "ok"),
+]
+
+
+def worker(calls: int) -> dict:
+    """
+    Makes calls rounds of calls, returns the number of each outcome.
+    """
+    outcomes = dict.fromkeys(outcome for (_, _, outcome) in ROUND)
+    for key in outcomes:
+        outcomes[key] = 0
+    for _ in range(calls):
+        for (args, kwargs, expected) in ROUND:
+            try:
+                handle(*args, **kwargs)
+                outcome = "ok"
+            except (ParameterRangeValidationException, ParameterTypeValidationException) as ex:
+                outcome = type(ex).__name__
+            if outcome != expected:
+                raise AssertionError("{} returned {}, expected {}".format(args, outcome, expected))
+            outcomes[outcome] += 1
+    return outcomes
+
+
+def process_worker(calls: int) -> dict:
+    before = stats(STATS_NAME).calls
+    outcomes = worker(calls)
+    outcomes["telemetry calls"] = stats(STATS_NAME).calls - before
+    return outcomes
+
+
+def expected_outcomes(workers: int, calls: int) -> dict:
+    expected = {}
+    for (_, _, outcome) in ROUND:
+        expected[outcome] = expected.get(outcome, 0) + workers * calls
+    return expected
+
+
+def merge(results):
+    merged = {}
+    for result in results:
+        for key, count in result.items():
+            merged[key] = merged.get(key, 0) + count
+    return merged
+
+
+def run_threads(workers: int, calls: int) -> float:
+    before = stats(STATS_NAME).calls
+    barrier = threading.Barrier(workers + 1)
+
+    def start():
+        barrier.wait()
+        return worker(calls)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(start) for _ in range(workers)]
+        barrier.wait()
+        begin = time.perf_counter()
+        results = [future.result() for future in futures]
+        elapsed = time.perf_counter() - begin
+
+    if merge(results) != expected_outcomes(workers, calls):
+        raise AssertionError("thread results {} != {}".format(merge(results), expected_outcomes(workers, calls)))
+    counted = stats(STATS_NAME).calls - before
+    if counted != workers * calls * len(ROUND):
+        raise AssertionError("telemetry counted {} calls, expected {}".format(counted, workers * calls * len(ROUND)))
+    return elapsed
+
+
+def run_processes(pool: multiprocessing.pool.Pool, workers: int, calls: int) -> float:
+    begin = time.perf_counter()
+    results = pool.map(process_worker, [calls] * workers, chunksize=1)
+    elapsed = time.perf_counter() - begin
+    telemetry_calls = sum(result.pop("telemetry calls") for result in results)
+    if merge(results) != expected_outcomes(workers, calls):
+        raise AssertionError("process results {} != {}".format(merge(results), expected_outcomes(workers, calls)))
+    if telemetry_calls != workers * calls * len(ROUND):
+        raise AssertionError("telemetry counted {} calls in the workers, expected {}".format(
+            telemetry_calls, workers * calls * len(ROUND)))
+    return elapsed
+
+
+def report(label, workers, calls, elapsed, baseline):
+    throughput = workers * calls * len(ROUND) / elapsed
+    scaling = throughput / baseline if baseline else 1.0
+    print("{:<10} {:>8} {:>16.0f} {:>9.2f}x".format(label, workers, throughput, scaling))
+    return throughput, scaling
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--min-scaling", type=float, default=None)
+    options = parser.parse_args(argv)
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print("python {} gil={} cpus={}".format(sys.version.split()[0], gil, os.cpu_count()))
+    print("{:<10} {:>8} {:>16} {:>10}".format("runner", "workers", "calls/s", "scaling"))
+    counts = sorted({1, 2, 4, options.workers} - {count for count in (2, 4) if count > options.workers})
+
+    scaling = {}
+    baseline = None
+    for workers in counts:
+        throughput, scaling["threads"] = report(
+            "threads", workers, options.calls, run_threads(workers, options.calls), baseline)
+        baseline = baseline or throughput
+
+    baseline = None
+    with multiprocessing.Pool(max(counts)) as pool:
+        run_processes(pool, max(counts), 1)  # start the workers
+        for workers in counts:
+            throughput, scaling["processes"] = report(
+                "processes", workers, options.calls, run_processes(pool, workers, options.calls), baseline)
+            baseline = baseline or throughput
+    print("results and telemetry counts verified")
+
+    if options.min_scaling is not None:
+        checked = ["processes"] if gil else ["processes", "threads"]
+        failed = [runner for runner in checked if scaling[runner] < options.min_scaling]
+        if failed:
+            print("scaling below {} for {}".format(options.min_scaling, ", ".join(failed)))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""
+Compares Constraints checks with the same checks written by hand in the
+function body after validating only the type, for lengths, bounds, finite
+floats, membership, patterns and predicates.
+
+Run: python benchmarks/bench_constraints.py
+"""
+import math
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from paramvalidator import ParameterValidator, Constraints
+
+NAME = re.compile(r"[a-z_][a-z0-9_]*")
+MODES = frozenset({"read", "write", "append"})
+
+
+def is_even(value):
+    return value % 2 == 0
+
+
+CASES = {
+    "length": ((str, False, Constraints(min_length=1, max_length=64)), "parameter_name",
+               lambda value: 1 <= len(value) <= 64),
+    "bounds": ((float, False, Constraints(gt=0.0, lt=1.0)), 0.5,
+               lambda value: 0.0 < value < 1.0),
+    "finite": ((float, False, Constraints(finite=True)), 0.5,
+               math.isfinite),
+    "allowed": ((str, False, Constraints(allowed=MODES)), "write",
+                MODES.__contains__),
+    "pattern": ((str, False, NAME), "parameter_name",
+                lambda value: NAME.fullmatch(value) is not None),
+    "predicate": ((int, False, Constraints(predicate=is_even)), 42,
+                  is_even),
+}
+
+
+def main(number=200000):
+    print("{:<10} {:>12} {:>12} {:>8}".format("case", "by hand ns", "spec ns", "ratio"))
+    for label, (spec, value, test) in CASES.items():
+        @ParameterValidator((spec[0], False))
+        def by_hand(argument):
+            if not test(argument):
+                raise ValueError(argument)
+            return argument
+
+        constrained = ParameterValidator(spec)(lambda argument: argument)
+
+        hand_ns = min(timeit.repeat(lambda: by_hand(value), number=number, repeat=7)) / number * 1e9
+        spec_ns = min(timeit.repeat(lambda: constrained(value), number=number, repeat=7)) / number * 1e9
+        print("{:<10} {:>12.1f} {:>12.1f} {:>7.2f}x".format(label, hand_ns, spec_ns, spec_ns / hand_ns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""
+Compares a chain of decorated functions passing the same arguments down,
+and a decorated recursive function, validated at every level and in validate
+once mode, where only the outermost call validates.
+
+Run: python benchmarks/bench_context.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from paramvalidator import ParameterValidator, Items
+
+SPEC = ((str, False), (int, False, (0, 100)), (list, False, Items((float, False, (0.0, 1.0)))))
+ARGS = ("name", 42, [0.5] * 8)
+
+
+def build_chain(depth, once):
+    def leaf(name, num, values):
+        return num
+
+    func = ParameterValidator(*SPEC).with_validate_once(once)(leaf)
+    for _ in range(depth - 1):
+        def layer(name, num, values, call=func):
+            return call(name, num, values)
+        func = ParameterValidator(*SPEC).with_validate_once(once)(layer)
+    return func
+
+
+def build_recursive(once):
+    validator = ParameterValidator(*SPEC, depth=(int, False)).with_validate_once(once)
+
+    @validator
+    def recurse(name, num, values, **kwargs):
+        depth = kwargs["depth"]
+        return num if depth == 0 else recurse(name, num, values, depth=depth - 1)
+    return recurse
+
+
+def main(number=10000):
+    print("{:<14} {:>14} {:>14} {:>8}".format("case", "every call ns", "once ns", "speedup"))
+    for depth in (2, 5, 10):
+        every = build_chain(depth, False)
+        once = build_chain(depth, True)
+        every_ns = min(timeit.repeat(lambda: every(*ARGS), number=number, repeat=7)) / number * 1e9
+        once_ns = min(timeit.repeat(lambda: once(*ARGS), number=number, repeat=7)) / number * 1e9
+        print("{:<14} {:>14.1f} {:>14.1f} {:>7.2f}x".format("chain {}".format(depth), every_ns, once_ns, every_ns / once_ns))
+
+    every, once = build_recursive(False), build_recursive(True)
+    every_ns = min(timeit.repeat(lambda: every(*ARGS, depth=10), number=number, repeat=7)) / number * 1e9
+    once_ns = min(timeit.repeat(lambda: once(*ARGS, depth=10), number=number, repeat=7)) / number * 1e9
+    print("{:<14} {:>14.1f} {:>14.1f} {:>7.2f}x".format("recursion 10", every_ns, once_ns, every_ns / once_ns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""
+Measures a failure heavy workload where every call fails validation and the
+exception is caught and handled without being displayed. Compares the lazily
+rendered exceptions with rendering the message for every failure, which is
+what the exceptions did eagerly in their constructors before.
+
+Run: python benchmarks/bench_exceptions.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from paramvalidator import ParameterValidator, ParameterValidationException
+
+
+@ParameterValidator((int, False, (0, 10)), (list, False))
+def handler(num, items):
+    pass
+
+
+def failing_calls(calls, render):
+    for (num, items) in calls:
+        try:
+            handler(num, items)
+        except ParameterValidationException as ex:
+            if render:
+                ex.message
+
+
+def main(number=20):
+    big = list(range(100000))
+    workloads = {
+        "range failure": [(10 ** 6, big)] * 1000,
+        "type failure": [(5, tuple(big))] * 1000,
+        "none failure": [(None, big)] * 1000,
+    }
+    print("{:<14} {:>12} {:>12} {:>8}".format("workload", "eager us", "lazy us", "speedup"))
+    for name, calls in workloads.items():
+        eager = min(timeit.repeat(lambda: failing_calls(calls, True), number=number, repeat=5)) / number / len(calls) * 1e6
+        lazy = min(timeit.repeat(lambda: failing_calls(calls, False), number=number, repeat=5)) / number / len(calls) * 1e6
+        print("{:<14} {:>12.2f} {:>12.2f} {:>7.2f}x".format(name, eager, lazy, eager / lazy))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""
+Measures the startup cost of paramvalidator in a service whose modules
+decorate many functions on import.
+
+    - import: the cumulative time of "import paramvalidator" and of importing
+      ParameterValidator, as reported by python -X importtime, and whether
+      the optional NumPy dependency was imported.
+    - decoration: time to import a synthetic module of 10k decorated
+      functions, see bench_schema.py, with checkers compiled on decoration
+      (eager) and on first call (lazy), and the cost of the first calls.
+
+Each measurement runs in a fresh interpreter so no module or cache is warm.
+
+Run: python benchmarks/bench_import.py
+"""
+import os
+import subprocess
+import sys
+
+from bench_schema import SPECS, module_source
+
+# A valid argument for each of bench_schema.SPECS
+VALUES = ["a", 1, 0.5, [], {}, True]
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+DECORATION_SCRIPT = """
+import sys, time
+sys.path.insert(0, {src!r})
+start = time.perf_counter()
+from paramvalidator import ParameterValidator
+ParameterValidator.set_lazy_compile({lazy})
+imported = time.perf_counter()
+namespace = {{"__name__": "synthetic"}}
+code = compile({source!r}, "<synthetic>", "exec")
+compiled = time.perf_counter()
+exec(code, namespace)
+decorated = time.perf_counter()
+values = {values!r}
+for index in range({count}):
+    args = [values[(index + offset) % len(values)] for offset in range(3)]
+    namespace["func_" + str(index)](*args, name="n")
+called = time.perf_counter()
+print(imported - start, decorated - compiled, called - decorated)
+"""
+
+
+def run(args, env=None, script=None):
+    return subprocess.run([sys.executable] + args, input=script, capture_output=True, text=True, check=True, env=env)
+
+
+def import_time(statement):
+    env = dict(os.environ, PYTHONPATH=SRC)
+    output = run(["-X", "importtime", "-c", statement + "; import sys; print('numpy' in sys.modules)"], env=env)
+    cumulative = 0
+    for line in output.stderr.splitlines():
+        # Top level imports only, nested imports are part of their cumulative time.
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2][:2] != "  " and parts[2].strip().startswith("paramvalidator"):
+            cumulative += int(parts[1])
+    return cumulative, output.stdout.strip() == "True"
+
+
+def decoration_time(count, lazy):
+    script = DECORATION_SCRIPT.format(src=SRC, lazy=lazy, source=module_source(count), count=count, values=VALUES)
+    return [float(value) for value in run(["-"], script=script).stdout.split()]
+
+
+def main(count=10000):
+    assert len(VALUES) == len(SPECS)
+    print("python -X importtime, cumulative")
+    for statement in ("import paramvalidator", "from paramvalidator import ParameterValidator"):
+        microseconds, numpy_imported = import_time(statement)
+        print("  {:<48} {:>8.1f} ms, numpy imported: {}".format(statement, microseconds / 1e3, numpy_imported))
+
+    print("{} decorated functions".format(count))
+    for lazy in (False, True):
+        imported, decorated, called = decoration_time(count, lazy)
+        print("  {:<6} decorate {:>8.1f} ms ({:.1f} us/function), first calls {:>8.1f} ms".format(
+            "lazy" if lazy else "eager", decorated * 1e3, decorated / count * 1e6, called * 1e3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""
+Compares calls validated with and without the memo cache of accepted values,
+for frozen configuration tuples repeated from a small set, with element range
+and membership checks.
+
+Run: python benchmarks/bench_memo.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from paramvalidator import ParameterValidator, Items, memo_stats
+
+MODES = frozenset({"read", "write", "append"})
+
+CASES = {
+    "ranges": ((tuple, False, Items((int, False, (0, 100)))),),
+    "members": ((tuple, False, Items((str, False, MODES))),),
+}
+
+ARGUMENTS = {
+    "ranges": [(1, 2, 3), tuple(range(16)), tuple(range(32))],
+    "members": [("read", "write", "append") * 4],
+}
+
+
+def target(value):
+    return value
+
+
+def main(number=100000):
+    print("{:<12} {:>12} {:>12} {:>8} {:>10}".format("argument", "checked ns", "memo ns", "speedup", "hit rate"))
+    for label, spec in CASES.items():
+        checked = ParameterValidator(*spec)(target)
+        memoized = ParameterValidator(*spec).with_memo()(target)
+        values = ARGUMENTS[label]
+
+        def call_all(func):
+            for value in values:
+                func(value)
+
+        checked_ns = min(timeit.repeat(lambda: call_all(checked), number=number, repeat=7)) / number / len(values) * 1e9
+        memo_ns = min(timeit.repeat(lambda: call_all(memoized), number=number, repeat=7)) / number / len(values) * 1e9
+        stats = memo_stats(__name__ + ".target")
+        print("{:<12} {:>12.1f} {:>12.1f} {:>7.2f}x {:>9.1%}".format(
+            label, checked_ns, memo_ns, checked_ns / memo_ns, stats.hits / (stats.hits + stats.misses)))
+
+
+if __name__ == "__main__":
+    main()
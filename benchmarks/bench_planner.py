@@ -0,0 +1,89 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""
+Reject path latency by check order, declared and cost, for a
+request handler with container, pattern, range and type checks and a
+required kwarg, on several failure distributions. The accept path is
+reported too, valid calls run every check whatever the order.
+
+Run: python benchmarks/bench_planner.py
+"""
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from paramvalidator import ParameterValidator, Items, Constraints
+from paramvalidator.exceptions import ParameterValidationException
+
+ORDERS = ("declared", "cost")
+
+SPECS = (
+    (list, False, Items((int, False, (0, 1000)))),
+    (str, False, Constraints(pattern=r"[a-z][a-z0-9_]{2,31}")),
+    (int, False, (1, 100)),
+    (str, False),
+)
+KWARGS = dict(token=(str, False), timeout=(float, True, (0.0, 60.0)))
+
+VALID = (list(range(200)), "user_name", 10, "name")
+
+
+def call_with(position, value, missing_token=False):
+    args = list(VALID)
+    if position is not None:
+        args[position] = value
+    kwargs = {} if missing_token else {"token": "t"}
+    return tuple(args), kwargs
+
+
+FAILURES = {
+    "bad count": [call_with(2, "10")],
+    "None name": [call_with(3, None)],
+    "missing token": [call_with(None, None, missing_token=True)],
+    "bad element": [call_with(0, list(range(199)) + [5000])],
+    # 60% wrong types, 25% None, 10% missing kwarg, 5% bad elements
+    "mixed": [call_with(2, "10")] * 12 + [call_with(3, None)] * 5 + [call_with(None, None, True)] * 2 +
+             [call_with(0, list(range(199)) + [5000])],
+}
+
+
+def handler(payload, user, count, name, **kwargs):
+    return count
+
+
+def main(number=2000):
+    functions = {order: ParameterValidator(*SPECS, **KWARGS).with_check_order(order)(handler) for order in ORDERS}
+    print("{:<14}".format("case") + "".join("{:>12}".format(order + " us") for order in ORDERS))
+
+    valid_args, valid_kwargs = call_with(None, None)
+    row = []
+    for order in ORDERS:
+        func = functions[order]
+        row.append(min(timeit.repeat(lambda: func(*valid_args, **valid_kwargs), number=number, repeat=5)) / number)
+    print("{:<14}".format("accepted") + "".join("{:>12.2f}".format(seconds * 1e6) for seconds in row))
+
+    shuffle = random.Random(7)
+    for label, calls in FAILURES.items():
+        calls = list(calls)
+        shuffle.shuffle(calls)
+        row = []
+        for order in ORDERS:
+            func = functions[order]
+
+            def reject_all():
+                for (args, kwargs) in calls:
+                    try:
+                        func(*args, **kwargs)
+                    except ParameterValidationException:
+                        pass
+            reject_all()
+            row.append(min(timeit.repeat(reject_all, number=number // len(calls) or 1, repeat=5)) / (number // len(calls) or 1) / len(calls))
+        print("{:<14}".format(label) + "".join("{:>12.2f}".format(seconds * 1e6) for seconds in row))
+
+
+if __name__ == "__main__":
+    main()
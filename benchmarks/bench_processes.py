@@ -0,0 +1,77 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""
+Throughput of decorated functions dispatched to worker processes.
+
+Submits an undecorated function and the same function decorated, pickled by
+name, and decorated under another name, pickled by value and rebuilt in the
+worker, to a ProcessPoolExecutor. Reports the tasks per second of each, for
+single tasks and for map() with chunks, and the pickled size of each
+function.
+
+Run: python benchmarks/bench_processes.py [--workers N] [--tasks N]
+"""
+import argparse
+import os
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from paramvalidator import ParameterValidator
+
+
+def score(name, count, weight):
+    return len(name) * count * weight
+
+
+@ParameterValidator((str, False), (int, False, (0, 1000)), (float, False, (0.0, 1.0)))
+def validated_score(name, count, weight):
+    return len(name) * count * weight
+
+
+# Pickled by value, score is found by name and wrapped again in the worker
+rebuilt_score = ParameterValidator((str, False), (int, False, (0, 1000)), (float, False, (0.0, 1.0)))(score)
+
+FUNCTIONS = {
+    "undecorated": score,
+    "by name": validated_score,
+    "by value": rebuilt_score,
+}
+
+
+def run(pool, func, tasks, chunksize):
+    names, counts, weights = ["item"] * tasks, list(range(tasks)), [0.5] * tasks
+    start = time.perf_counter()
+    if chunksize is None:
+        futures = [pool.submit(func, name, count % 1000, weight) for name, count, weight in zip(names, counts, weights)]
+        results = [future.result() for future in futures]
+    else:
+        results = list(pool.map(func, names, [count % 1000 for count in counts], weights, chunksize=chunksize))
+    elapsed = time.perf_counter() - start
+    assert len(results) == tasks
+    return tasks / elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Decorated functions in worker processes")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--tasks", type=int, default=20000)
+    options = parser.parse_args(argv)
+
+    print("{:<12} {:>10} {:>14} {:>14}".format("function", "bytes", "submit/s", "map(chunk)/s"))
+    with ProcessPoolExecutor(max_workers=options.workers) as pool:
+        # Start the workers before timing
+        list(pool.map(score, ["warm"] * options.workers, [1] * options.workers, [1.0] * options.workers))
+        for label, func in FUNCTIONS.items():
+            size = len(pickle.dumps(func))
+            submitted = run(pool, func, options.tasks // 10, None)
+            mapped = run(pool, func, options.tasks, 500)
+            print("{:<12} {:>10} {:>14.0f} {:>14.0f}".format(label, size, submitted, mapped))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""
+Measures the memory and decoration time of a synthetic module with 10k
+decorated functions using a small vocabulary of repeated validation tuples.
+
+    - spec memory: the validation tuples stored per decorator, as separate
+      copies (what every ParameterValidator held before interning) and as
+      interned Schema objects.
+    - decoration: time to import the synthetic module with a baseline
+      decorator that keeps its tuples and returns a closure, as
+      ParameterValidator did before interning, and with ParameterValidator,
+      the first time (cold caches) and again as a second module (warm
+      Spec/Schema/checker caches). The garbage collector is disabled while
+      timing, as timeit does, so each run pays only for its own objects.
+
+Run: python benchmarks/bench_schema.py
+"""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from paramvalidator import Schema
+
+SPECS = [
+    "(str, False)",
+    "(int, False, (0, 65535))",
+    "(float, True, (0.0, 1.0))",
+    "(list, True)",
+    "(dict, False)",
+    "(bool, False)",
+]
+
+
+def spec_source(index):
+    args = ", ".join(SPECS[(index + offset) % len(SPECS)] for offset in range(3))
+    return "{}, name=(str, False), timeout=(float, True)".format(args)
+
+
+def module_source(count):
+    lines = ["from paramvalidator import ParameterValidator", ""]
+    for index in range(count):
+        lines.append("@ParameterValidator({})".format(spec_source(index)))
+        lines.append("def func_{}(a, b, c, **kwargs):".format(index))
+        lines.append("    return a")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def measure_specs(count):
+    build = [compile("(lambda *args, **kwargs: (args, kwargs))({})".format(spec_source(index)), "<spec>", "eval")
+             for index in range(count)]
+
+    tracemalloc.start()
+    copies = [eval(source) for source in build]
+    copies_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    schemas = [Schema(*args, **kwargs) for (args, kwargs) in (eval(source) for source in build)]
+    schemas_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return copies_bytes, schemas_bytes, len(set(map(id, schemas)))
+
+
+class BaselineValidator:
+    """
+    Stores the validation tuples of each decorator and returns a closure.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.validation_args = args
+        self.validation_kwargs = kwargs
+
+    def __call__(self, func):
+        def wrapper(*args, **kwargs):
+            return func(*args, **kwargs)
+        return wrapper
+
+
+def timed_exec(source, namespace):
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        exec(source, namespace)
+        return time.perf_counter() - start
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def measure_decoration(count):
+    source = compile(module_source(count), "<synthetic>", "exec")
+    # The import line of module_source() binds ParameterValidator, rebind it
+    # for the baseline by running the module body without it.
+    baseline_source = compile(module_source(count).split("\n", 1)[1], "<synthetic>", "exec")
+    baseline = timed_exec(baseline_source, {"__name__": "baseline", "ParameterValidator": BaselineValidator})
+    timings = [timed_exec(source, {"__name__": "synthetic_{}".format(index)}) for index in range(2)]
+    gc.collect()
+    return [baseline] + timings
+
+
+def main(count=10000):
+    baseline, cold, warm = measure_decoration(count)
+    print("decorating {} functions".format(count))
+    print("  baseline decorator   {:>10.1f} ms ({:.1f} us/function)".format(baseline * 1e3, baseline / count * 1e6))
+    print("  cold caches          {:>10.1f} ms ({:.1f} us/function)".format(cold * 1e3, cold / count * 1e6))
+    print("  warm caches          {:>10.1f} ms ({:.1f} us/function)".format(warm * 1e3, warm / count * 1e6))
+    copies_bytes, schemas_bytes, distinct = measure_specs(count)
+    print("spec memory, {} decorators".format(count))
+    print("  per-decorator copies {:>10.1f} KiB".format(copies_bytes / 1024))
+    print("  interned schemas     {:>10.1f} KiB ({} distinct)".format(schemas_bytes / 1024, distinct))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""
+Measures streaming validation of JSON lines payloads: throughput in this
+process and in a process pool, and the peak memory traced while consuming
+streams of increasing length, which should not grow with the stream.
+
+Run: python benchmarks/bench_stream.py
+"""
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from paramvalidator import ParameterValidator, Items
+
+VALIDATOR = ParameterValidator(
+    id=(int, False, (0, 10 ** 9)),
+    user=(str, False),
+    score=(float, True, (0.0, 1.0)),
+    tags=(list, True, Items((str, False))),
+    status=(str, False, frozenset({"new", "open", "closed"})))
+
+
+def json_lines(count):
+    """Generates count JSON lines, every tenth invalid."""
+    for index in range(count):
+        record = {"id": index, "user": "user{}".format(index % 100), "score": (index % 10) / 10,
+                  "tags": ["a", "b"], "status": "open"}
+        if index % 10 == 0:
+            record["score"] = 2.0
+        yield json.dumps(record)
+
+
+def consume(count, **options):
+    valid = 0
+    for _ in VALIDATOR.validate_stream(map(json.loads, json_lines(count)), only_valid=True, **options):
+        valid += 1
+    assert valid == count - (count + 9) // 10
+    return valid
+
+
+def main():
+    print("{:<26} {:>10} {:>14}".format("mode", "records", "records/s"))
+    for label, options in (("in process", {}), ("processes=2", {"processes": 2})):
+        count = 100000
+        start = time.perf_counter()
+        consume(count, **options)
+        elapsed = time.perf_counter() - start
+        print("{:<26} {:>10} {:>14.0f}".format(label, count, count / elapsed))
+
+    print("{:<26} {:>10} {:>14}".format("peak memory", "records", "KiB"))
+    consume(1000)
+    for count in (10000, 100000, 300000):
+        tracemalloc.start()
+        consume(count, chunk_size=1000)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print("{:<26} {:>10} {:>14.1f}".format("in process, chunk 1000", count, peak / 1024))
+
+
+if __name__ == "__main__":
+    main()
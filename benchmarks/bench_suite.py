@@ -0,0 +1,157 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""
+Benchmark suite of the per call cost of ParameterValidator across call shapes
+and argument counts, with machine readable results.
+
+Every case is measured for 1, 2, 5, 10 and 20 arguments:
+
+    baseline - the undecorated function
+    args     - positional arguments, (int, False) each
+    kwargs   - arguments passed in **kwargs, validated by name
+    mixed    - half positional, half kwargs
+    range    - positional arguments with a range, (int, False, (0, 100))
+    method   - positional arguments of a method, called on an instance
+    failure  - positional arguments, the last one of the wrong type, the
+               exception is caught
+
+Each case reports the minimum time per call over several repeats (timeit
+disables the garbage collector while timing) and its ratio to the baseline
+of the same argument count, which is less sensitive to the speed of the
+machine than the time itself.
+
+Run: python benchmarks/bench_suite.py [--output results.json] [--quick]
+Compare: python benchmarks/check_regression.py baseline.json results.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from paramvalidator import ParameterValidator, ParameterValidationException
+
+COUNTS = (1, 2, 5, 10, 20)
+SHAPES = ("baseline", "args", "kwargs", "mixed", "range", "method", "failure")
+FORMAT_VERSION = 1
+
+
+def _names(count):
+    return ["a{}".format(index) for index in range(count)]
+
+
+def build_case(shape, count):
+    """
+    Returns a function taking no arguments that makes one call of the case.
+    """
+    names = _names(count)
+    values = list(range(1, count + 1))
+    positional = count if shape != "mixed" else (count + 1) // 2
+    keyword_names = names[positional:] if shape == "mixed" else (names if shape == "kwargs" else [])
+    positional_names = [] if shape == "kwargs" else names[:positional]
+
+    parameters = ", ".join(positional_names + (["**kwargs"] if keyword_names else []))
+    namespace = {}
+    if shape == "method":
+        exec("class Target:\n    def call(self, {}):\n        return None".format(parameters), namespace)
+    else:
+        exec("def target({}):\n    return None".format(parameters), namespace)
+
+    spec = (int, False, (0, 100)) if shape == "range" else (int, False)
+    validator = ParameterValidator(*[spec] * len(positional_names), **{name: spec for name in keyword_names})
+    args = tuple(values[:len(positional_names)])
+    kwargs = dict(zip(keyword_names, values[len(positional_names):]))
+
+    if shape == "baseline":
+        target = namespace["target"]
+        return lambda: target(*args)
+    if shape == "method":
+        target_class = namespace["Target"]
+        target_class.call = validator(target_class.call)
+        call = target_class().call
+        return lambda: call(*args)
+
+    target = validator(namespace["target"])
+    if shape == "failure":
+        args = args[:-1] + ("wrong",)
+
+        def fail():
+            try:
+                target(*args)
+            except ParameterValidationException:
+                pass
+        return fail
+    if kwargs:
+        return lambda: target(*args, **kwargs)
+    return lambda: target(*args)
+
+
+def measure(call, number, repeat):
+    return min(timeit.repeat(call, number=number, repeat=repeat)) / number * 1e9
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(number, repeat):
+    results = {}
+    for count in COUNTS:
+        baseline_ns = None
+        for shape in SHAPES:
+            ns = measure(build_case(shape, count), number, repeat)
+            if shape == "baseline":
+                baseline_ns = ns
+            results["{}[{}]".format(shape, count)] = {
+                "shape": shape,
+                "count": count,
+                "ns": round(ns, 1),
+                "ratio": round(ns / baseline_ns, 3),
+            }
+    return {
+        "version": FORMAT_VERSION,
+        "meta": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "commit": _commit(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "number": number,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ParameterValidator call cost benchmark suite")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--number", type=int, default=20000, help="calls per repeat")
+    parser.add_argument("--repeat", type=int, default=7, help="repeats, the minimum is kept")
+    parser.add_argument("--quick", action="store_true", help="fewer calls, for a smoke test")
+    options = parser.parse_args(argv)
+    if options.quick:
+        options.number, options.repeat = 1000, 3
+
+    report = run(options.number, options.repeat)
+    print("{:<14} {:>12} {:>8}".format("case", "ns/call", "ratio"))
+    for name, result in report["results"].items():
+        print("{:<14} {:>12.1f} {:>7.2f}x".format(name, result["ns"], result["ratio"]))
+    if options.output:
+        with open(options.output, "w") as output:
+            json.dump(report, output, indent=2)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""
+Compares two result files of bench_suite.py and fails if any case got slower
+by more than a threshold.
+
+By default the ratio to the undecorated baseline of the same run is compared,
+so results taken on machines, or at times, of different speed remain
+comparable. --metric ns compares the raw time per call.
+
+Run: python benchmarks/check_regression.py baseline.json current.json [--threshold 0.10] [--metric ratio|ns]
+
+Exit status 0 if no case regressed, 1 otherwise.
+"""
+import argparse
+import json
+import sys
+
+
+def load(path):
+    with open(path) as source:
+        report = json.load(source)
+    if report.get("version") != 1:
+        raise ValueError("{} is not a bench_suite.py version 1 result file".format(path))
+    return report
+
+
+def compare(baseline, current, threshold, metric):
+    """
+    Returns a list of (case, baseline value, current value, change, regressed)
+    for the cases present in both reports.
+    """
+    rows = []
+    for case, before in baseline["results"].items():
+        after = current["results"].get(case)
+        if after is None or (metric == "ratio" and before["shape"] == "baseline"):
+            continue
+        change = after[metric] / before[metric] - 1.0
+        rows.append((case, before[metric], after[metric], change, change > threshold))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compares two bench_suite.py result files")
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown, 0.10 is 10%%")
+    parser.add_argument("--metric", choices=("ratio", "ns"), default="ratio")
+    options = parser.parse_args(argv)
+
+    rows = compare(load(options.baseline), load(options.current), options.threshold, options.metric)
+    print("{:<14} {:>12} {:>12} {:>9}".format("case", "baseline", "current", "change"))
+    for (case, before, after, change, regressed) in rows:
+        print("{:<14} {:>12.2f} {:>12.2f} {:>+8.1%}{}".format(case, before, after, change, "  REGRESSION" if regressed else ""))
+
+    regressions = [row[0] for row in rows if row[4]]
+    if regressions:
+        print("{} case(s) slower by more than {:.0%}: {}".format(len(regressions), options.threshold, ", ".join(regressions)))
+        return 1
+    print("no regression above {:.0%} in {} cases".format(options.threshold, len(rows)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
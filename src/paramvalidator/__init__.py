@@ -1,4 +1,46 @@
 """
 (c) Microsoft. All rights reserved.
+
+The public names are loaded on first access, so importing the package only
+imports the modules that are actually used.
 """
-from paramvalidator.validator import ParameterValidator, ParameterValidationException
+import importlib
+
+_MODULES = {
+    "ParameterValidator": "validator",
+    "ValidatedFunction": "validated",
+    "ValidatedMethod": "validated",
+    "ParameterValidationException": "exceptions",
+    "BatchValidationReport": "batch",
+    "ValidationMode": "mode",
+    "sample": "mode",
+    "stats": "telemetry",
+    "reset_stats": "telemetry",
+    "enable_stats": "telemetry",
+    "disable_stats": "telemetry",
+    "add_hook": "telemetry",
+    "remove_hook": "telemetry",
+    "memo_stats": "memo",
+    "clear_memo": "memo",
+    "in_validated_call": "context",
+    "Items": "specs",
+    "Constraints": "specs",
+    "Buffer": "specs",
+    "Spec": "schema",
+    "Schema": "schema",
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module("{}.{}".format(__name__, module_name)), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
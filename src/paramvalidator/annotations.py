@@ -0,0 +1,199 @@
+"""
+(c) Microsoft. All rights reserved.
+
+Translates typing annotations into validation tuples.
+
+ParameterValidator.from_annotations() reads the annotations of a function
+once, on its first call, and translates each into the validation tuple a
+user would otherwise have written by hand:
+
+    int                         (int, False)
+    Optional[str]               (str, True)
+    Union[int, float]           ((int, float), False)
+    List[int]                   (list, False, Items((int, False)))
+    Dict[str, List[int]]        (dict, False, Items((list, False, Items((int, False))), keys=(str, False)))
+    Literal["a", "b"]           ((str,), False, frozenset({"a", "b"}))
+    Annotated[int, (0, 10)]     (int, False, (0, 10))
+    Annotated[str, Constraints(max_length=8)]
+                                (str, False, Constraints(max_length=8))
+    Any, or no annotation       (object, True)
+
+Reading them on the first call lets annotations name classes defined later,
+i.e. a method annotated with its own class, or any annotation under
+"from __future__ import annotations". Annotations that still name undefined
+classes on the first call accept anything.
+
+The translations are cached by annotation and the resulting tuples compile to
+checkers shared by every function using them, see compiler.get_checker().
+"""
+import functools
+import inspect
+import types
+import typing
+from paramvalidator.specs import Items, Constraints, Buffer, PATTERN_TYPE
+
+_ANY = (object, True)
+_NONE_TYPE = type(None)
+_Literal = getattr(typing, "Literal", None)
+_Annotated = getattr(typing, "Annotated", None)
+_UnionType = getattr(types, "UnionType", None)
+
+# Origins of generic aliases whose parameter describes every element.
+_ELEMENT_CONTAINERS = (list, set, frozenset)
+
+
+def _origin(annotation: object) -> object:
+    return getattr(annotation, "__origin__", None)
+
+
+def _type_args(annotation: object) -> typing.Tuple[object, ...]:
+    return getattr(annotation, "__args__", None) or ()
+
+
+def _is_range(metadata: object) -> bool:
+    return (isinstance(metadata, tuple) and len(metadata) == 2
+            and all(isinstance(bound, (int, float)) for bound in metadata))
+
+
+def _is_constraint(metadata: object) -> bool:
+    return _is_range(metadata) or isinstance(metadata, (Constraints, Buffer, frozenset, PATTERN_TYPE))
+
+
+def _runtime_type(annotation: object) -> object:
+    """
+    Returns the class an annotation checks isinstance against, used for the
+    members of a Union.
+    """
+    spec = annotation_to_validation(annotation)
+    return spec[0]
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_validation(annotation: object) -> tuple:
+    return _to_validation(annotation)
+
+
+def annotation_to_validation(annotation: object) -> tuple:
+    """
+    Translates a typing annotation into a validation tuple.
+
+    Parameters:
+    annotation: A class or typing annotation
+
+    Returns:
+    The validation tuple.
+    """
+    try:
+        return _cached_validation(annotation)
+    except TypeError:
+        # Unhashable annotations, i.e. Annotated with list metadata
+        return _to_validation(annotation)
+
+
+def _to_validation(annotation: object) -> tuple:
+    if annotation is typing.Any or annotation is inspect.Parameter.empty or annotation is object:
+        return _ANY
+    if annotation is None or annotation is _NONE_TYPE:
+        return (_NONE_TYPE, True)
+
+    # Annotated must be checked before the origin, it reports the inner type.
+    if _Annotated is not None and hasattr(annotation, "__metadata__"):
+        spec = annotation_to_validation(annotation.__origin__)
+        constraint = next((metadata for metadata in annotation.__metadata__ if _is_constraint(metadata)), None)
+        if constraint is not None and len(spec) == 2:
+            return spec + (constraint,)
+        return spec
+
+    origin = _origin(annotation)
+    args = _type_args(annotation)
+
+    if origin is typing.Union or (_UnionType is not None and isinstance(annotation, _UnionType)):
+        allow_none = _NONE_TYPE in args
+        members = [arg for arg in args if arg is not _NONE_TYPE]
+        if len(members) == 1:
+            spec = annotation_to_validation(members[0])
+            return (spec[0], spec[1] or allow_none) + spec[2:]
+        member_types = tuple(_runtime_type(member) for member in members)
+        if object in member_types:
+            return _ANY
+        return (member_types, allow_none)
+
+    if _Literal is not None and origin is _Literal:
+        values = [value for value in args if value is not None]
+        value_types = tuple(sorted({type(value) for value in values}, key=lambda cls: cls.__name__))
+        return (value_types, None in args, frozenset(values))
+
+    if origin in _ELEMENT_CONTAINERS:
+        if args and not isinstance(args[0], typing.TypeVar) and args[0] is not typing.Any:
+            return (origin, False, Items(annotation_to_validation(args[0])))
+        return (origin, False)
+
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis and args[0] is not typing.Any:
+            return (tuple, False, Items(annotation_to_validation(args[0])))
+        return (tuple, False)
+
+    if origin is dict:
+        if len(args) == 2:
+            keys = None if args[0] is typing.Any else annotation_to_validation(args[0])
+            values = None if args[1] is typing.Any else annotation_to_validation(args[1])
+            if keys is not None or values is not None:
+                return (dict, False, Items(values, keys=keys))
+        return (dict, False)
+
+    if isinstance(origin, type):
+        # Other generics, i.e. typing.Sequence[int] or type[int], by their class
+        return (origin, False)
+    if isinstance(annotation, type):
+        return (annotation, False)
+    # TypeVar, Callable and other annotations that cannot be checked with isinstance
+    return _ANY
+
+
+def _type_hints(func: typing.Callable[..., object]) -> typing.Dict[str, object]:
+    try:
+        return typing.get_type_hints(func, include_extras=True)
+    except TypeError:
+        # Python < 3.9 has no include_extras
+        return typing.get_type_hints(func)
+
+
+def function_validations(func: typing.Callable[..., object], skip_receiver: bool) -> typing.Tuple[typing.List[tuple], typing.Dict[str, tuple]]:
+    """
+    Builds the positional and kwargs validation tuples of a function from its
+    annotations.
+
+    Positional parameters become positional validation tuples, keyword only
+    parameters become kwargs validation tuples. Keyword only parameters with
+    a default may be omitted, so they are allowed to be missing (and None).
+
+    Parameters:
+    func: The function
+    skip_receiver: True to skip the first parameter, self or cls
+
+    Returns:
+    Tuple of (validation_args, validation_kwargs)
+    """
+    try:
+        hints = _type_hints(func)
+    except NameError:
+        # Forward references to classes not defined, the other annotations
+        # are still checked.
+        hints = {name: annotation for name, annotation in getattr(func, "__annotations__", {}).items()
+                 if not isinstance(annotation, str)}
+
+    validation_args = []
+    validation_kwargs = {}
+    parameters = list(inspect.signature(func).parameters.values())
+    if skip_receiver:
+        parameters = parameters[1:]
+
+    for parameter in parameters:
+        spec = annotation_to_validation(hints.get(parameter.name, inspect.Parameter.empty))
+        if parameter.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD):
+            validation_args.append(spec)
+        elif parameter.kind == inspect.Parameter.KEYWORD_ONLY:
+            if parameter.default is not inspect.Parameter.empty and not spec[1]:
+                spec = (spec[0], True) + spec[2:]
+            validation_kwargs[parameter.name] = spec
+    return validation_args, validation_kwargs
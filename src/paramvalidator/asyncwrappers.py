@@ -0,0 +1,67 @@
+"""
+(c) Microsoft. All rights reserved.
+
+Wrappers for coroutine functions and async generator functions.
+
+The wrappers are themselves async def functions, so inspect.iscoroutinefunction
+and inspect.isasyncgenfunction report the same as for the original function.
+The arguments are validated synchronously, inside the wrapper, before the
+original function is awaited or iterated. No task or event loop hop is added.
+"""
+import typing
+
+
+def wrap_coroutine_function(func: typing.Callable[..., typing.Awaitable[object]], check: typing.Callable[..., None]) -> typing.Callable[..., typing.Awaitable[object]]:
+    """
+    Returns a coroutine function that validates the arguments then awaits func.
+
+    Parameters:
+    func: The coroutine function
+    check: Callable taking the call arguments that raises if they are invalid
+
+    Returns:
+    The validating coroutine function.
+    """
+    async def coroutine_wrapper(*args, **kwargs):
+        check(*args, **kwargs)
+        return await func(*args, **kwargs)
+    return coroutine_wrapper
+
+
+def wrap_async_generator_function(func: typing.Callable[..., typing.AsyncGenerator], check: typing.Callable[..., None]) -> typing.Callable[..., typing.AsyncGenerator]:
+    """
+    Returns an async generator function that validates the arguments then
+    delegates to the generator func returns, including asend(), athrow()
+    and aclose().
+
+    Parameters:
+    func: The async generator function
+    check: Callable taking the call arguments that raises if they are invalid
+
+    Returns:
+    The validating async generator function.
+    """
+    async def async_generator_wrapper(*args, **kwargs):
+        check(*args, **kwargs)
+        generator = func(*args, **kwargs)
+        try:
+            value = await generator.__anext__()
+        except StopAsyncIteration:
+            return
+        while True:
+            try:
+                sent = yield value
+            except GeneratorExit:
+                await generator.aclose()
+                raise
+            except BaseException as ex:
+                try:
+                    value = await generator.athrow(ex)
+                except StopAsyncIteration:
+                    return
+            else:
+                try:
+                    value = await generator.asend(sent)
+                except StopAsyncIteration:
+                    return
+    return async_generator_wrapper
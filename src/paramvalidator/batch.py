@@ -0,0 +1,194 @@
+"""
+(c) Microsoft. All rights reserved.
+
+Batch validation of many argument sets against one ParameterValidator spec.
+
+Rather than raising on the first bad value, every row is validated and the
+first failure of each row is collected into a BatchValidationReport. Rows can
+be given one at a time (tuples for positional specs, dicts for kwargs specs)
+or as columns, one sequence per parameter. When NumPy is installed, numeric
+columns held in NumPy arrays have their type and range checks performed as
+vectorized comparisons.
+"""
+import sys
+import typing
+from paramvalidator.compiler import DTYPE_SAMPLES, compile_args, compile_kwargs, ndarray_type
+from paramvalidator.exceptions import (
+    ParameterValidationException,
+    ParameterKwargValidationException,
+    ParameterCountValidationException,
+    ParameterRangeValidationException
+)
+
+
+def validate_many(*args, **kwargs):
+    """
+    Stand-in function named in exceptions collected by batch validation when
+    no function is supplied.
+    """
+
+
+class BatchValidationReport:
+    """
+    Result of validating a batch of rows.
+
+    Attributes:
+    count : Number of rows validated
+    failures : Dictionary of row index to the first exception found for that row
+    """
+    __slots__ = ("count", "failures")
+
+    def __init__(self, count: int, failures: typing.Dict[int, ParameterValidationException]):
+        self.count = count
+        self.failures = failures
+
+    @property
+    def valid(self) -> bool:
+        """True if no row failed validation."""
+        return not self.failures
+
+    @property
+    def failed_indices(self) -> typing.List[int]:
+        """Sorted list of the indices of rows that failed validation."""
+        return sorted(self.failures)
+
+    def __repr__(self):
+        return "BatchValidationReport(count={}, failed={})".format(self.count, len(self.failures))
+
+
+def validate_rows(validation_args: typing.Sequence[tuple], validation_kwargs: typing.Dict[str, tuple], rows: typing.Iterable[object], func: typing.Callable[..., None] = None) -> BatchValidationReport:
+    """
+    Validates each row against the validation tuples.
+
+    Parameters:
+    validation_args: Positional validation tuples, used for tuple/list rows.
+    validation_kwargs: Kwargs validation tuples, used for dict rows.
+    rows: Iterable of argument tuples or kwargs dictionaries.
+    func: Function named in collected exceptions, defaults to a stand-in.
+
+    Returns:
+    BatchValidationReport
+    """
+    func = func or validate_many
+    arg_checks = compile_args(validation_args)
+    kwarg_checks = compile_kwargs(validation_kwargs)
+    expected_count = len(arg_checks)
+    failures = {}
+    count = 0
+
+    for row_index, row in enumerate(rows):
+        count += 1
+        try:
+            if isinstance(row, dict):
+                for (name, param_index, allow_missing, check) in kwarg_checks:
+                    if name in row:
+                        check(func, param_index, row[name])
+                    elif not allow_missing:
+                        raise ParameterKwargValidationException(func, name)
+            else:
+                if len(row) != expected_count:
+                    raise ParameterCountValidationException(func, len(row), expected_count)
+                for (argument, (param_index, check)) in zip(row, arg_checks):
+                    check(func, param_index, argument)
+        except ParameterValidationException as ex:
+            failures[row_index] = ex
+
+    return BatchValidationReport(count, failures)
+
+
+def validate_columns(validation_args: typing.Sequence[tuple], validation_kwargs: typing.Dict[str, tuple], columns: typing.Union[typing.Sequence[typing.Sequence[object]], typing.Dict[str, typing.Sequence[object]]], func: typing.Callable[..., None] = None) -> BatchValidationReport:
+    """
+    Validates rows given as columns, one sequence per parameter.
+
+    A sequence of columns is validated against the positional validation
+    tuples, a dictionary of columns against the kwargs validation tuples. All
+    columns must have the same length. Where a row fails in more than one
+    column the failure of the first column, in declaration order, is kept.
+
+    Parameters:
+    validation_args: Positional validation tuples, used for a sequence of columns.
+    validation_kwargs: Kwargs validation tuples, used for a dictionary of columns.
+    columns: Sequence or dictionary of columns.
+    func: Function named in collected exceptions, defaults to a stand-in.
+
+    Returns:
+    BatchValidationReport
+    """
+    func = func or validate_many
+    if isinstance(columns, dict):
+        plan = [
+            (param_index, validation, check, columns.get(name), name, allow_missing)
+            for (name, param_index, allow_missing, check), validation
+            in zip(compile_kwargs(validation_kwargs), validation_kwargs.values())
+        ]
+    else:
+        if len(columns) != len(validation_args):
+            raise ParameterCountValidationException(func, len(columns), len(validation_args))
+        plan = [
+            (param_index, validation, check, column, None, False)
+            for (param_index, check), validation, column
+            in zip(compile_args(validation_args), validation_args, columns)
+        ]
+
+    lengths = {len(column) for (_, _, _, column, _, _) in plan if column is not None}
+    if len(lengths) > 1:
+        raise ValueError("All columns must have the same length, found lengths {}".format(sorted(lengths)))
+    count = lengths.pop() if lengths else 0
+
+    failures = {}
+    for (param_index, validation, check, column, name, allow_missing) in plan:
+        if column is None:
+            # Kwarg column not supplied, every row is missing the value.
+            if not allow_missing:
+                for row_index in range(count):
+                    if row_index not in failures:
+                        failures[row_index] = ParameterKwargValidationException(func, name)
+            continue
+
+        if _validate_numpy_column(func, param_index, validation, column, failures):
+            continue
+
+        for row_index, argument in enumerate(column):
+            if row_index in failures:
+                continue
+            try:
+                check(func, param_index, argument)
+            except ParameterValidationException as ex:
+                failures[row_index] = ex
+
+    return BatchValidationReport(count, failures)
+
+
+def _validate_numpy_column(func: typing.Callable[..., None], param_index: int, validation: tuple, column: object, failures: typing.Dict[int, ParameterValidationException]) -> bool:
+    """
+    Validates a numeric NumPy column with vectorized comparisons.
+
+    Parameters:
+    func: Function named in collected exceptions
+    param_index: Index of the parameter the column holds
+    validation: The validation tuple for the column
+    column: The column values
+    failures: Dictionary of row index to exception, updated in place
+
+    Returns:
+    True if the column was handled, False if it must be checked element-wise.
+    """
+    ndarray = ndarray_type()
+    if ndarray is None or not isinstance(column, ndarray) or column.ndim != 1:
+        return False
+
+    # The isinstance check is decided once per column from the dtype.
+    sample = DTYPE_SAMPLES.get(column.dtype.kind)
+    if sample is None or not isinstance(sample, validation[0]):
+        return False
+    if len(validation) == 3 and not isinstance(validation[2], tuple):
+        # Constraints and membership are checked element-wise
+        return False
+
+    if len(validation) == 3 and isinstance(validation[2], tuple) and isinstance(sample, (int, float)):
+        value_range = validation[2]
+        out_of_range = (column < value_range[0]) | (column > value_range[1])
+        for row_index in sys.modules["numpy"].flatnonzero(out_of_range).tolist():
+            if row_index not in failures:
+                failures[row_index] = ParameterRangeValidationException(func, param_index, value_range, column[row_index].item())
+    return True
@@ -0,0 +1,92 @@
+"""
+(c) Microsoft. All rights reserved.
+
+Maps the validation tuples of a ParameterValidator onto the parameters of the
+decorated function.
+
+The signature of the function is analysed once, when it is decorated, from
+its code object. The result is a Binding holding the slot and name of every
+positional parameter and which of them have defaults, so that a call can be
+matched to the validation tuples with plain tuple indexing and dict lookups.
+inspect.Signature.bind is never called per call, and inspect.signature is
+only used for functions that are not plain Python functions, or that wrap
+another function (functools.wraps), whose signature it resolves.
+
+    - Positional validation tuples line up with the positional parameters in
+      declaration order (after self/cls). Tuples beyond the named positional
+      parameters validate the values collected by *args.
+    - A positional parameter may be passed by keyword, its value is then taken
+      from kwargs.
+    - A positional parameter with a default may be omitted, the default is not
+      validated.
+    - A kwargs validation tuple naming a positional parameter validates that
+      parameter whether it is passed positionally or by keyword.
+"""
+import typing
+
+# co_flags bit of a code object accepting *args
+_CO_VARARGS = 0x04
+
+
+class Binding:
+    """
+    Positional parameter layout of a function, excluding any receiver.
+
+    Attributes:
+    names : Names of the positional parameters, by slot
+    has_default : For each slot, True if the parameter has a default
+    required : Number of leading slots that must be supplied
+    var_positional : True if the function accepts *args
+    receiver_offset : 1 if the first parameter is self/cls, otherwise 0
+    """
+    __slots__ = ("names", "has_default", "required", "var_positional", "receiver_offset")
+
+    def __init__(self, func: typing.Callable[..., None], has_receiver: bool):
+        code = getattr(func, "__code__", None)
+        if code is None or hasattr(func, "__wrapped__"):
+            names, has_default, var_positional = _signature_layout(func)
+        else:
+            # Plain functions, read directly from the code object which is
+            # much cheaper than building an inspect.Signature.
+            count = code.co_argcount
+            names = code.co_varnames[:count]
+            defaults = len(func.__defaults__ or ())
+            has_default = (False,) * (count - defaults) + (True,) * defaults
+            var_positional = bool(code.co_flags & _CO_VARARGS)
+        if has_receiver:
+            names = names[1:]
+            has_default = has_default[1:]
+
+        self.names = names
+        self.has_default = has_default
+        self.required = sum(1 for default in has_default if not default)
+        self.var_positional = var_positional
+        self.receiver_offset = 1 if has_receiver else 0
+
+    def slot_of(self, name: str) -> typing.Optional[int]:
+        """
+        Returns the slot of the positional parameter called name, or None.
+        """
+        try:
+            return self.names.index(name)
+        except ValueError:
+            return None
+
+
+def _signature_layout(func: typing.Callable[..., None]) -> typing.Tuple[typing.Tuple[str, ...], typing.Tuple[bool, ...], bool]:
+    """
+    Returns the positional parameter names, which of them have defaults and
+    whether *args is accepted, using inspect.signature.
+    """
+    import inspect
+
+    positional = []
+    var_positional = False
+    for parameter in inspect.signature(func).parameters.values():
+        if parameter.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD):
+            positional.append(parameter)
+        elif parameter.kind == inspect.Parameter.VAR_POSITIONAL:
+            var_positional = True
+    names = tuple(parameter.name for parameter in positional)
+    has_default = tuple(parameter.default is not inspect.Parameter.empty for parameter in positional)
+    return names, has_default, var_positional
@@ -0,0 +1,505 @@
+"""
+(c) Microsoft. All rights reserved.
+
+Compiles validation tuples into specialized check functions.
+
+The ParameterValidator originally interpreted each validation tuple on every
+call, branching on its length and contents to work out what had to be
+checked. The functions here perform that interpretation once, at decoration
+time, and return a small closure that only performs the None/isinstance/range
+comparisons that the tuple actually requires.
+
+Every compiled checker has the same signature
+
+    checker(func, param_index, argument) -> None
+
+and raises the same exceptions, with the same content, as
+ParameterValidator._validate_argument does for the same tuple. Failures on
+the elements of a container argument carry an ElementParameter, naming the
+element, as their parameter.
+"""
+import array
+import itertools
+import random
+import sys
+import typing
+from paramvalidator.specs import Items, Constraints, Buffer, PATTERN_TYPE
+from paramvalidator.schema import Spec, intern_spec
+from paramvalidator.exceptions import (
+    ParameterValidationException,
+    ParameterNoneValidationException,
+    ParameterTypeValidationException,
+    ParameterRangeValidationException,
+    ParameterConstraintValidationException
+)
+
+# Python scalars standing in for the elements of homogeneous arrays, by NumPy
+# dtype kind and array.array typecode. The element type of an array is checked
+# once by testing the stand-in against the expected type.
+DTYPE_SAMPLES = {"b": True, "i": 0, "u": 0, "f": 0.0, "U": ""}
+TYPECODE_SAMPLES = dict(
+    [(typecode, 0) for typecode in "bBhHiIlLqQ"] + [("f", 0.0), ("d", 0.0), ("u", ""), ("w", "")])
+
+_INFINITY = float("inf")
+
+
+class ElementParameter:
+    """
+    Identifies the failing element of a container argument in exceptions,
+    i.e. parameter 2[5]['name'] is the 'name' entry of the sixth element of
+    the second parameter.
+    """
+    __slots__ = ("param", "path")
+
+    def __init__(self, param: object, path: typing.Tuple[object, ...]):
+        self.param = param
+        self.path = path
+
+    def __eq__(self, other):
+        return isinstance(other, ElementParameter) and (self.param, self.path) == (other.param, other.path)
+
+    def __hash__(self):
+        return hash((self.param, self.path))
+
+    def __str__(self):
+        return "{}{}".format(self.param, "".join("[{!r}]".format(position) for position in self.path))
+
+    __repr__ = __str__
+
+
+class _KeyPosition:
+    """
+    Position of a failing dict key in an ElementParameter path.
+    """
+    __slots__ = ("key",)
+
+    def __init__(self, key: object):
+        self.key = key
+
+    def __eq__(self, other):
+        return isinstance(other, _KeyPosition) and self.key == other.key
+
+    def __hash__(self):
+        return hash((_KeyPosition, self.key))
+
+    def __repr__(self):
+        return "key {!r}".format(self.key)
+
+
+class _AllElements:
+    """
+    Position used when every element of an array fails, i.e. on its dtype.
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        return "*"
+
+
+ALL_ELEMENTS = _AllElements()
+
+
+def ndarray_type() -> typing.Optional[type]:
+    """
+    Returns numpy.ndarray, or None if NumPy has not been imported. NumPy is
+    optional and slow to import, it is never imported here: an argument can
+    only be a NumPy array once the caller has imported NumPy.
+    """
+    numpy = sys.modules.get("numpy")
+    return getattr(numpy, "ndarray", None)
+
+# Compiled checkers by id of interned Spec, see get_checker()
+_spec_checkers = {}
+
+
+def _relabel(ex: ParameterValidationException, param_index: object, position: object):
+    """
+    Rewrites the parameter of an exception raised for the element at position
+    of parameter param_index. Element checkers are called with the position as
+    their parameter so that labels are only built on failure.
+    """
+    inner = ex.param
+    if isinstance(inner, ElementParameter):
+        path = (position,) + inner.path
+    else:
+        path = (position,)
+    ex.param = ElementParameter(param_index, path)
+
+
+def compile_validation(validation: tuple) -> typing.Callable[[typing.Callable[..., None], object, object], None]:
+    """
+    Compiles a single validation tuple into a checker function.
+
+    Parameters:
+    validation : Tuple with type, None type acceptance and optional range,
+                 Items, Constraints, Buffer, frozenset of allowed values or
+                 compiled re pattern
+
+    Returns:
+    A function taking (func, param_index, argument) that raises on failure.
+    """
+    expected_type = validation[0]
+    allow_none = validation[1]
+    value_range = None
+    if len(validation) == 3 and isinstance(validation[2], tuple):
+        value_range = validation[2]
+    elif len(validation) == 3 and isinstance(validation[2], Items):
+        return _compile_contents(expected_type, allow_none, _compile_items(validation[2]))
+    elif len(validation) == 3 and isinstance(validation[2], frozenset):
+        return _compile_contents(expected_type, allow_none, _compile_membership(validation[2]))
+    elif len(validation) == 3 and isinstance(validation[2], Constraints):
+        tests = _constraint_tests(validation[2])
+        if not tests:
+            return compile_validation((expected_type, allow_none))
+        return _compile_tests(expected_type, allow_none, tests)
+    elif len(validation) == 3 and isinstance(validation[2], Buffer):
+        return _compile_contents(expected_type, allow_none, _compile_buffer(validation[2]))
+    elif len(validation) == 3 and isinstance(validation[2], PATTERN_TYPE):
+        return _compile_tests(expected_type, allow_none, (("pattern", validation[2], validation[2].fullmatch),))
+
+    if value_range is None:
+        if allow_none:
+            def check(func, param_index, argument):
+                if argument is not None and not isinstance(argument, expected_type):
+                    raise ParameterTypeValidationException(func, param_index, type(argument), expected_type)
+        else:
+            def check(func, param_index, argument):
+                if argument is None:
+                    raise ParameterNoneValidationException(func, param_index)
+                if not isinstance(argument, expected_type):
+                    raise ParameterTypeValidationException(func, param_index, type(argument), expected_type)
+        return check
+
+    low, high = value_range[0], value_range[1]
+    if _numeric_only(expected_type):
+        # Every accepted argument is a number, the range applies to all.
+        def check_numeric_range(func, param_index, argument):
+            if argument is None:
+                if not allow_none:
+                    raise ParameterNoneValidationException(func, param_index)
+                return
+            if not isinstance(argument, expected_type):
+                raise ParameterTypeValidationException(func, param_index, type(argument), expected_type)
+            if argument < low or argument > high:
+                raise ParameterRangeValidationException(func, param_index, value_range, argument)
+        return check_numeric_range
+
+    def check_range(func, param_index, argument):
+        if argument is None:
+            if not allow_none:
+                raise ParameterNoneValidationException(func, param_index)
+            return
+        if not isinstance(argument, expected_type):
+            raise ParameterTypeValidationException(func, param_index, type(argument), expected_type)
+        if isinstance(argument, (int, float)) and (argument < low or argument > high):
+            raise ParameterRangeValidationException(func, param_index, value_range, argument)
+    return check_range
+
+
+def _numeric_only(expected_type: object) -> bool:
+    """
+    Returns True if every instance of expected_type is an int or float.
+    """
+    types = expected_type if isinstance(expected_type, tuple) else (expected_type,)
+    return all(isinstance(member, type) and issubclass(member, (int, float)) for member in types)
+
+
+def _compile_contents(expected_type: object, allow_none: bool, check_contents: typing.Callable[..., None]) -> typing.Callable[..., None]:
+    """
+    Compiles a checker that validates None/type and then the argument contents.
+    """
+    def check(func, param_index, argument):
+        if argument is None:
+            if not allow_none:
+                raise ParameterNoneValidationException(func, param_index)
+            return
+        if not isinstance(argument, expected_type):
+            raise ParameterTypeValidationException(func, param_index, type(argument), expected_type)
+        check_contents(func, param_index, argument)
+    return check
+
+
+def _compile_membership(allowed: frozenset) -> typing.Callable[..., None]:
+    """
+    Compiles an O(1) check that the argument is one of a set of allowed values.
+    """
+    def check_membership(func, param_index, argument):
+        try:
+            found = argument in allowed
+        except TypeError:
+            # Unhashable values cannot be members
+            found = False
+        if not found:
+            raise ParameterRangeValidationException(func, param_index, allowed, argument)
+    return check_membership
+
+
+def _constraint_tests(constraints: Constraints) -> typing.Tuple[typing.Tuple[str, object, typing.Callable[[object], object]], ...]:
+    """
+    Returns (name, limit, test) for each constraint that is set, cheapest
+    first. A test returns a true value if the argument meets the constraint.
+    """
+    tests = []
+    if constraints.min_length is not None:
+        minimum = constraints.min_length
+        tests.append(("min_length", minimum, lambda argument: len(argument) >= minimum))
+    if constraints.max_length is not None:
+        maximum = constraints.max_length
+        tests.append(("max_length", maximum, lambda argument: len(argument) <= maximum))
+    if constraints.gt is not None:
+        gt = constraints.gt
+        tests.append(("gt", gt, lambda argument: argument > gt))
+    if constraints.ge is not None:
+        ge = constraints.ge
+        tests.append(("ge", ge, lambda argument: argument >= ge))
+    if constraints.lt is not None:
+        lt = constraints.lt
+        tests.append(("lt", lt, lambda argument: argument < lt))
+    if constraints.le is not None:
+        le = constraints.le
+        tests.append(("le", le, lambda argument: argument <= le))
+    if constraints.finite:
+        # NaN is the only value not equal to itself
+        tests.append(("finite", True,
+                      lambda argument: argument == argument and argument != _INFINITY and argument != -_INFINITY))
+    if constraints.allowed is not None:
+        tests.append(("allowed", constraints.allowed, constraints.allowed.__contains__))
+    if constraints.pattern is not None:
+        tests.append(("pattern", constraints.pattern, constraints.pattern.fullmatch))
+    for predicate in constraints.predicate or ():
+        tests.append(("predicate", predicate, predicate))
+    return tuple(tests)
+
+
+def _compile_tests(expected_type: object, allow_none: bool, tests: typing.Tuple[tuple, ...]) -> typing.Callable[..., None]:
+    """
+    Compiles a checker that validates None/type and then each constraint test,
+    in one function. A test that cannot be applied to the argument, i.e. len()
+    of an int or a str pattern on bytes, raises TypeError and fails.
+    """
+    if len(tests) == 1:
+        ((name, limit, test),) = tests
+
+        def check_constraint(func, param_index, argument):
+            if argument is None:
+                if not allow_none:
+                    raise ParameterNoneValidationException(func, param_index)
+                return
+            if not isinstance(argument, expected_type):
+                raise ParameterTypeValidationException(func, param_index, type(argument), expected_type)
+            try:
+                passed = test(argument)
+            except TypeError:
+                passed = False
+            if not passed:
+                raise ParameterConstraintValidationException(func, param_index, name, limit, argument)
+        return check_constraint
+
+    def check_constraints(func, param_index, argument):
+        if argument is None:
+            if not allow_none:
+                raise ParameterNoneValidationException(func, param_index)
+            return
+        if not isinstance(argument, expected_type):
+            raise ParameterTypeValidationException(func, param_index, type(argument), expected_type)
+        for (name, limit, test) in tests:
+            try:
+                passed = test(argument)
+            except TypeError:
+                passed = False
+            if not passed:
+                raise ParameterConstraintValidationException(func, param_index, name, limit, argument)
+    return check_constraints
+
+
+def _compile_buffer(buffer: Buffer) -> typing.Callable[..., None]:
+    """
+    Compiles the checks of a Buffer that are set into one check of the
+    memoryview of the argument. Each test takes the memoryview.
+    """
+    tests = []
+    if buffer.min_size is not None:
+        minimum = buffer.min_size
+        tests.append(("min_size", minimum, lambda view: view.nbytes >= minimum))
+    if buffer.max_size is not None:
+        maximum = buffer.max_size
+        tests.append(("max_size", maximum, lambda view: view.nbytes <= maximum))
+    if buffer.format is not None:
+        formats = frozenset(buffer.format)
+        tests.append(("format", buffer.format, lambda view: view.format in formats))
+    if buffer.contiguous:
+        tests.append(("contiguous", True, lambda view: view.c_contiguous))
+    if buffer.readonly is not None:
+        readonly = buffer.readonly
+        tests.append(("readonly", readonly, lambda view: view.readonly == readonly))
+    tests = tuple(tests)
+
+    def check_buffer(func, param_index, argument):
+        try:
+            view = memoryview(argument)
+        except (TypeError, ValueError):
+            # No buffer protocol, or a released memoryview or closed mmap
+            raise ParameterConstraintValidationException(func, param_index, "buffer", "protocol", argument) from None
+        with view:
+            for (name, limit, test) in tests:
+                if not test(view):
+                    raise ParameterConstraintValidationException(func, param_index, name, limit, argument)
+    return check_buffer
+
+
+def _compile_items(items: Items) -> typing.Callable[..., None]:
+    """
+    Compiles the element validation of a container argument.
+
+    Parameters:
+    items : The Items spec
+
+    Returns:
+    A function taking (func, param_index, argument) that raises on failure.
+    """
+    check_value = get_checker(items.values) if items.values is not None else None
+    check_key = get_checker(items.keys) if items.keys is not None else None
+    limit = items.first if items.first is not None else items.sample
+    sample = items.sample is not None
+    element_type = items.values[0] if items.values is not None else None
+    element_constraint = items.values[2] if items.values is not None and len(items.values) == 3 else None
+    element_range = element_constraint if isinstance(element_constraint, tuple) else None
+
+    def positions(length):
+        if limit is None or limit >= length:
+            return range(length)
+        if sample:
+            return sorted(random.sample(range(length), limit))
+        return range(limit)
+
+    def check_array(func, param_index, argument, sample_value, dtype):
+        # Homogeneous arrays: the element type follows from the dtype/typecode.
+        if sample_value is None or not isinstance(sample_value, element_type):
+            raise ParameterTypeValidationException(
+                func, ElementParameter(param_index, (ALL_ELEMENTS,)), dtype, element_type)
+        if element_constraint is None or element_range is not None and not isinstance(sample_value, (int, float)):
+            return
+        ndarray = ndarray_type()
+        if ndarray is not None and isinstance(argument, ndarray):
+            flat = argument.ravel()
+            if element_range is not None and (limit is None or limit >= len(flat)):
+                out_of_range = sys.modules["numpy"].flatnonzero((flat < element_range[0]) | (flat > element_range[1]))
+                if len(out_of_range):
+                    position = int(out_of_range[0])
+                    raise ParameterRangeValidationException(
+                        func, ElementParameter(param_index, (position,)), element_range, flat[position].item())
+                return
+            values = ((position, flat[position].item()) for position in positions(len(flat)))
+        else:
+            values = ((position, argument[position]) for position in positions(len(argument)))
+        for (position, value) in values:
+            try:
+                check_value(func, position, value)
+            except ParameterValidationException as ex:
+                _relabel(ex, param_index, position)
+                raise
+
+    def check_mapping(func, param_index, argument):
+        pairs = argument.items()
+        if limit is not None:
+            pairs = itertools.islice(pairs, limit)
+        for (key, value) in pairs:
+            if check_key is not None:
+                try:
+                    check_key(func, key, key)
+                except ParameterValidationException as ex:
+                    _relabel(ex, param_index, _KeyPosition(key))
+                    raise
+            if check_value is not None:
+                try:
+                    check_value(func, key, value)
+                except ParameterValidationException as ex:
+                    _relabel(ex, param_index, key)
+                    raise
+
+    def check_items(func, param_index, argument):
+        if isinstance(argument, dict):
+            check_mapping(func, param_index, argument)
+            return
+        if check_value is None:
+            return
+        if isinstance(argument, (list, tuple)):
+            if limit is None:
+                elements = enumerate(argument)
+            else:
+                elements = ((position, argument[position]) for position in positions(len(argument)))
+        elif isinstance(argument, array.array):
+            check_array(func, param_index, argument, TYPECODE_SAMPLES.get(argument.typecode), argument.typecode)
+            return
+        elif isinstance(argument, ndarray_type() or ()):
+            check_array(func, param_index, argument, DTYPE_SAMPLES.get(argument.dtype.kind), argument.dtype)
+            return
+        else:
+            # Sets and other iterables cannot be indexed, sample is first K.
+            elements = enumerate(argument if limit is None else itertools.islice(argument, limit))
+        for (position, element) in elements:
+            try:
+                check_value(func, position, element)
+            except ParameterValidationException as ex:
+                _relabel(ex, param_index, position)
+                raise
+    return check_items
+
+
+def get_checker(validation: tuple) -> typing.Callable[[typing.Callable[..., None], object, object], None]:
+    """
+    Returns the compiled checker for a validation tuple. Checkers are cached
+    by interned Spec, see schema.intern_spec(), so every function using the
+    same tuple shares one checker. Tuples that are not interned, unhashable
+    or holding a predicate function, are compiled without caching. Checkers hold no
+    mutable state; threads compiling the same tuple at once may each store
+    an equivalent checker.
+
+    Parameters:
+    validation : Tuple with type, None type acceptance and optional range or Items
+
+    Returns:
+    A function taking (func, param_index, argument) that raises on failure.
+    """
+    spec = intern_spec(validation)
+    if type(spec) is not Spec:
+        return compile_validation(validation)
+    # Interned, the identity is the key.
+    checker = _spec_checkers.get(id(spec))
+    if checker is None:
+        checker = _spec_checkers[id(spec)] = compile_validation(spec)
+    return checker
+
+
+def compile_args(validation_args: typing.Sequence[tuple]) -> typing.List[tuple]:
+    """
+    Compiles the positional validation tuples.
+
+    Parameters:
+    validation_args: The list of tuples for positional validation.
+
+    Returns:
+    List of (param_index, checker) pairs in declaration order.
+    """
+    return [
+        (param_index, get_checker(validation))
+        for param_index, validation in enumerate(validation_args, 1)
+    ]
+
+
+def compile_kwargs(validation_kwargs: typing.Dict[str, tuple]) -> typing.List[tuple]:
+    """
+    Compiles the kwargs validation tuples.
+
+    Parameters:
+    validation_kwargs: The kwargs validation tuples passed to ParameterValidator.
+
+    Returns:
+    List of (name, param_index, allow_missing, checker) in declaration order.
+    The param_index of a kwarg is its name, so its failures are told apart
+    from those of the positional parameters.
+    """
+    return [
+        (name, name, bool(validation[1]), get_checker(validation))
+        for name, validation in validation_kwargs.items()
+    ]
@@ -0,0 +1,139 @@
+"""
+(c) Microsoft. All rights reserved.
+
+Validate once: skipping the validation of decorated functions called from
+within another validated call.
+
+A public decorated function often passes the objects it just validated on to
+other decorated functions, and a recursive decorated function validates the
+same kind of arguments at every level. With validate once enabled, globally
+with ParameterValidator.set_validate_once() or per decorator with
+with_validate_once(), a call that validated its arguments marks the current
+context while it runs. Decorated calls made within it, directly or deeper in
+the call stack, skip their validation. Calls to functions decorated with
+with_validate_once(strict=True) always validate.
+
+The mark is held in a contextvars.ContextVar, so it follows the flow of
+control rather than the thread:
+
+    - Threads start with an empty context, calls in a thread pool validate
+      unless the pool was given the caller's context, i.e. asyncio.to_thread.
+    - asyncio tasks run in a copy of the context of the code that created
+      them, each task is marked independently of the others.
+    - The mark is cleared when the marking call returns. Tasks, or contexts
+      copied while it ran, that outlive the call validate again.
+
+Generator and async generator functions skip validation within a validated
+call but do not mark the context themselves: their body runs interleaved
+with the code consuming them.
+"""
+import contextvars
+import typing
+
+_current = contextvars.ContextVar("paramvalidator_validated_call", default=None)
+
+
+class _ValidatedCall:
+    """
+    The mark of a running validated call, shared with every context copied
+    from the context it was set in.
+    """
+    __slots__ = ("active",)
+
+    def __init__(self):
+        self.active = True
+
+
+def in_validated_call() -> bool:
+    """
+    Returns True if called from within a call that validated its arguments in
+    validate once mode.
+    """
+    call = _current.get()
+    return call is not None and call.active
+
+
+def validate_once(func: typing.Callable[..., object], check: typing.Callable[..., None], strict: bool) -> typing.Callable[..., object]:
+    """
+    Returns a wrapper that runs check on the arguments, unless within another
+    validated call, and then calls func with the context marked.
+
+    Parameters:
+    func: The decorated function
+    check: Callable taking the call arguments that raises if they are invalid
+    strict: True to run check within another validated call too
+
+    Returns:
+    The wrapper.
+    """
+    get = _current.get
+    set_call = _current.set
+    reset = _current.reset
+
+    def once_wrapper(*args, **kwargs):
+        outer = get()
+        if outer is not None and outer.active:
+            if strict:
+                check(*args, **kwargs)
+            return func(*args, **kwargs)
+        check(*args, **kwargs)
+        call = _ValidatedCall()
+        token = set_call(call)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            call.active = False
+            reset(token)
+    return once_wrapper
+
+
+def validate_once_coroutine(func: typing.Callable[..., typing.Awaitable[object]], check: typing.Callable[..., None], strict: bool) -> typing.Callable[..., typing.Awaitable[object]]:
+    """
+    Returns a coroutine function that runs check on the arguments, unless
+    within another validated call, and then awaits func with the context of
+    the awaiting task marked.
+
+    Parameters:
+    func: The coroutine function
+    check: Callable taking the call arguments that raises if they are invalid
+    strict: True to run check within another validated call too
+
+    Returns:
+    The validating coroutine function.
+    """
+    async def once_coroutine_wrapper(*args, **kwargs):
+        outer = _current.get()
+        if outer is not None and outer.active:
+            if strict:
+                check(*args, **kwargs)
+            return await func(*args, **kwargs)
+        check(*args, **kwargs)
+        call = _ValidatedCall()
+        token = _current.set(call)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            call.active = False
+            _current.reset(token)
+    return once_coroutine_wrapper
+
+
+def skip_within_validated_call(check: typing.Callable[..., None], strict: bool) -> typing.Callable[..., None]:
+    """
+    Returns a check that does nothing within another validated call, used for
+    generator functions, which do not mark the context.
+
+    Parameters:
+    check: Callable taking the call arguments that raises if they are invalid
+    strict: True to run check within another validated call too
+
+    Returns:
+    The check.
+    """
+    if strict:
+        return check
+
+    def once_check(*args, **kwargs):
+        if not in_validated_call():
+            check(*args, **kwargs)
+    return once_check
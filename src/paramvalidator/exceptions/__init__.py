@@ -1,9 +1,33 @@
 """
 (c) Microsoft. All rights reserved.
+
+The exception classes are loaded on first access, so importing the package
+only imports the exception modules that are actually used.
 """
-from paramvalidator.exceptions.validation_exception import ParameterValidationException
-from paramvalidator.exceptions.none_validation_exception import ParameterNoneValidationException
-from paramvalidator.exceptions.type_validation_exception import ParameterTypeValidationException
-from paramvalidator.exceptions.kwarg_validation_exception import ParameterKwargValidationException
-from paramvalidator.exceptions.count_validation_exception import ParameterCountValidationException
-from paramvalidator.exceptions.range_validation_exception import ParameterRangeValidationException
\ No newline at end of file
+import importlib
+
+_MODULES = {
+    "ParameterValidationException": "validation_exception",
+    "ParameterNoneValidationException": "none_validation_exception",
+    "ParameterTypeValidationException": "type_validation_exception",
+    "ParameterKwargValidationException": "kwarg_validation_exception",
+    "ParameterCountValidationException": "count_validation_exception",
+    "ParameterRangeValidationException": "range_validation_exception",
+    "ParameterConstraintValidationException": "constraint_validation_exception",
+    "ParameterAggregateValidationException": "aggregate_validation_exception",
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module("{}.{}".format(__name__, module_name)), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
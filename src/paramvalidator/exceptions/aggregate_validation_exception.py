@@ -0,0 +1,60 @@
+"""
+(c) Microsoft. All rights reserved.
+"""
+import json
+import math
+import typing
+from .validation_exception import ParameterValidationException
+
+
+class ParameterAggregateValidationException(ParameterValidationException):
+    """
+    Exception holding every validation failure of a call, raised when the
+    ParameterValidator collects all errors rather than stopping at the first.
+    """
+    __slots__ = ("func", "failures")
+
+    def __init__(self, func: typing.Callable[..., None], failures: typing.List[ParameterValidationException]):
+        super().__init__()
+        self.func = func
+        self.failures = failures
+
+    def _render(self) -> str:
+        return "{} invalid parameters in func {} in module {}: {}".format(
+            len(self.failures),
+            self.func.__qualname__,
+            self.func.__module__,
+            " ".join(failure.message for failure in self.failures)
+        )
+
+    def to_dict(self) -> typing.Dict[str, object]:
+        return {
+            "error": "aggregate",
+            "func": self.func.__qualname__,
+            "failures": [failure.to_dict() for failure in self.failures]
+        }
+
+    def to_json(self) -> str:
+        """
+        Serializes the failures to JSON, i.e. for an error response. Values
+        that are not finite, i.e. an out of range inf, are written as the
+        strings "inf", "-inf" and "nan", JSON has no literal for them.
+        """
+        fields = self.to_dict()
+        try:
+            return json.dumps(fields, default=str, separators=(",", ":"), allow_nan=False)
+        except ValueError:
+            return json.dumps(_finite(fields), default=str, separators=(",", ":"), allow_nan=False)
+
+
+def _finite(value: object) -> object:
+    """
+    Returns value with the floats that are not finite replaced by their string.
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else str(value)
+    if isinstance(value, dict):
+        return {key: _finite(member) for key, member in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(member) for member in value]
+    return value
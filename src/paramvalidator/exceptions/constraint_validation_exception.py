@@ -0,0 +1,48 @@
+"""
+(c) Microsoft. All rights reserved.
+"""
+import typing
+from .validation_exception import ParameterValidationException, json_value, json_preview, preview
+
+
+class ParameterConstraintValidationException(ParameterValidationException):
+    """
+    Exception when incoming value does not meet a Constraints constraint,
+    i.e. constraint "max_length" with limit 64.
+    """
+    __slots__ = ("func", "param", "constraint", "limit", "value")
+
+    def __init__(self, func: typing.Callable[..., None], param: int, constraint: str, limit: object, value: object):
+        super().__init__()
+        self.func = func
+        self.param = param
+        self.constraint = constraint
+        self.limit = limit
+        self.value = value
+
+    def _render(self) -> str:
+        return "Constraint failed for parameter {} in func {} in module {} , value {} does not meet {} {}.".format(
+            self.param,
+            self.func.__qualname__,
+            self.func.__module__,
+            preview(self.value, repr),
+            self.constraint,
+            preview(_describe(self.limit))
+        )
+
+    def to_dict(self) -> typing.Dict[str, object]:
+        return {
+            "error": "constraint",
+            "param": json_value(self.param),
+            "constraint": self.constraint,
+            "limit": json_value(_describe(self.limit)),
+            "value": json_preview(self.value)
+        }
+
+
+def _describe(limit: object) -> object:
+    # Patterns and predicates by their source and name rather than their repr
+    pattern = getattr(limit, "pattern", None)
+    if isinstance(pattern, str):
+        return pattern
+    return getattr(limit, "__qualname__", limit)
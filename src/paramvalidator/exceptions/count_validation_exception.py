@@ -7,13 +7,23 @@ from .validation_exception import ParameterValidationException
 
 class ParameterCountValidationException(ParameterValidationException):
     """
-    Exception when an expected kwarg is not present
+    Exception when the number of arguments does not match the function
     """
-    def __init__(self, func: typing.Callable[..., None], recieved: int):
-        err = "Expected {} args in func {} in module {} but {} were given.".format(
-            func.__code__.co_argcount,
-            func.__qualname__,
-            func.__module__,
-            recieved
+    __slots__ = ("func", "received", "expected")
+
+    def __init__(self, func: typing.Callable[..., None], recieved: int, expected: int = None):
+        super().__init__()
+        self.func = func
+        self.received = recieved
+        self.expected = expected if expected is not None else func.__code__.co_argcount
+
+    def _render(self) -> str:
+        return "Expected {} args in func {} in module {} but {} were given.".format(
+            self.expected,
+            self.func.__qualname__,
+            self.func.__module__,
+            self.received
         )
-        super().__init__(err)
+
+    def to_dict(self) -> typing.Dict[str, object]:
+        return {"error": "count", "expected": self.expected, "received": self.received}
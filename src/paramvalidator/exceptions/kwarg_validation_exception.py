@@ -9,10 +9,19 @@ class ParameterKwargValidationException(ParameterValidationException):
     """
     Exception when an expected kwarg is not present
     """
+    __slots__ = ("func", "expected")
+
     def __init__(self, func: typing.Callable[..., None], expected: str):
-        err = "Missing required kwarg - {} - in func {} in module {}.".format(
-            expected,
-            func.__qualname__,
-            func.__module__
+        super().__init__()
+        self.func = func
+        self.expected = expected
+
+    def _render(self) -> str:
+        return "Missing required kwarg - {} - in func {} in module {}.".format(
+            self.expected,
+            self.func.__qualname__,
+            self.func.__module__
         )
-        super().__init__(err)
+
+    def to_dict(self) -> typing.Dict[str, object]:
+        return {"error": "missing", "param": self.expected}
@@ -2,17 +2,26 @@
 (c) Microsoft. All rights reserved.
 """
 import typing
-from .validation_exception import ParameterValidationException
+from .validation_exception import ParameterValidationException, json_value
 
 
 class ParameterNoneValidationException(ParameterValidationException):
     """
     Exception when incoming value is None but None is not allowed.
     """
+    __slots__ = ("func", "param")
+
     def __init__(self, func: typing.Callable[..., None], param: int):
-        err = "Unexpected None value found in func {} in module {}, parameter {}.".format(
-            func.__qualname__,
-            func.__module__,
-            param
+        super().__init__()
+        self.func = func
+        self.param = param
+
+    def _render(self) -> str:
+        return "Unexpected None value found in func {} in module {}, parameter {}.".format(
+            self.func.__qualname__,
+            self.func.__module__,
+            self.param
         )
-        super().__init__(err)
+
+    def to_dict(self) -> typing.Dict[str, object]:
+        return {"error": "none", "param": json_value(self.param)}
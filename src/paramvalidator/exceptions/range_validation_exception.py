@@ -2,19 +2,35 @@
 (c) Microsoft. All rights reserved.
 """
 import typing
-from .validation_exception import ParameterValidationException
+from .validation_exception import ParameterValidationException, json_value, json_preview, preview
 
 
 class ParameterRangeValidationException(ParameterValidationException):
     """
-    Exception when incoming value is None but None is not allowed.
+    Exception when incoming value is outside of the accepted range.
     """
+    __slots__ = ("func", "param", "value_range", "value")
+
     def __init__(self, func: typing.Callable[..., None], param: int, range : tuple, value : object):
-        err = "Out of range parameter {} in func {} in module {} , value {} not in range {}.".format(
-            param,
-            func.__qualname__,
-            func.__module__,
-            str(value),
-            range
+        super().__init__()
+        self.func = func
+        self.param = param
+        self.value_range = range
+        self.value = value
+
+    def _render(self) -> str:
+        return "Out of range parameter {} in func {} in module {} , value {} not in range {}.".format(
+            self.param,
+            self.func.__qualname__,
+            self.func.__module__,
+            preview(self.value),
+            preview(self.value_range)
         )
-        super().__init__(err)
+
+    def to_dict(self) -> typing.Dict[str, object]:
+        return {
+            "error": "range",
+            "param": json_value(self.param),
+            "range": json_value(self.value_range),
+            "value": json_preview(self.value)
+        }
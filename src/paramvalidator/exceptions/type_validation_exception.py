@@ -2,19 +2,35 @@
 (c) Microsoft. All rights reserved.
 """
 import typing
-from .validation_exception import ParameterValidationException
+from .validation_exception import ParameterValidationException, json_value, type_name
 
 
 class ParameterTypeValidationException(ParameterValidationException):
     """
     Exception when the incoming type does not match the expected type
     """
+    __slots__ = ("func", "param", "input_type", "expected_type")
+
     def __init__(self, func: typing.Callable[..., None], param: int, input_type: object, expected_type: object):
-        err = "Arg type mismatch in func {} in module {}, parameter {} type does not match expected {} != {}.".format(
-            func.__qualname__,
-            func.__module__,
-            param,
-            str(input_type),
-            str(expected_type)
+        super().__init__()
+        self.func = func
+        self.param = param
+        self.input_type = input_type
+        self.expected_type = expected_type
+
+    def _render(self) -> str:
+        return "Arg type mismatch in func {} in module {}, parameter {} type does not match expected {} != {}.".format(
+            self.func.__qualname__,
+            self.func.__module__,
+            self.param,
+            str(self.input_type),
+            str(self.expected_type)
         )
-        super().__init__(err)
+
+    def to_dict(self) -> typing.Dict[str, object]:
+        return {
+            "error": "type",
+            "param": json_value(self.param),
+            "expected": type_name(self.expected_type),
+            "actual": type_name(self.input_type)
+        }
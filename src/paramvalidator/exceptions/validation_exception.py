@@ -1,14 +1,189 @@
 """
 (c) Microsoft. All rights reserved.
 """
+import typing
+
+# Longest str, in characters, or bytes-like value, in bytes, shown in full in
+# messages. Longer values, and containers of more than PREVIEW_ITEMS items,
+# are shown as a bounded preview, of PREVIEW_BYTES bytes for buffers.
+PREVIEW_LENGTH = 64
+PREVIEW_ITEMS = 16
+PREVIEW_BYTES = 16
 
 
 class ParameterValidationException(Exception):
     """
     Base exception for parameter validation
+
+    Derived exceptions only store the structured fields describing the failure,
+    the message is rendered by _render() the first time it is requested. Many
+    failures are caught and handled without ever being displayed.
     """
-    def __init__(self, message):
-        self.message = message
+    __slots__ = ("_message",)
+
+    def __init__(self, message: str = None):
+        self._message = message
+
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            self._message = self._render()
+        return self._message
+
+    @message.setter
+    def message(self, message: str):
+        self._message = message
+
+    def _render(self) -> str:
+        """
+        Renders the message from the structured fields of the exception.
+        """
+        return ""
+
+    def to_dict(self) -> typing.Dict[str, object]:
+        """
+        Returns the structured fields of the failure as a compact dictionary of
+        JSON compatible values, without rendering the message.
+        """
+        return {"error": "validation", "message": self.message}
 
     def __str__(self):
         return self.message
+
+    def __reduce__(self):
+        # Exception pickling only restores args, the fields are slots and may
+        # have changed since construction, i.e. the parameter of element failures.
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__ for name in getattr(cls, "__slots__", ())
+            if hasattr(self, name)
+        }
+        args = self.args
+        func = state.get("func")
+        if func is not None:
+            state["func"] = _WrappedFunction.of(func)
+            args = tuple(state["func"] if arg is func else arg for arg in args)
+        return (_restore, (type(self), args, state))
+
+
+class _WrappedFunction:
+    """
+    Pickles a decorated function's original function, which cannot pickle by
+    name as its name refers to the wrapper, as a reference to the wrapper.
+    """
+    __slots__ = ("module", "qualname")
+
+    def __init__(self, module: str, qualname: str):
+        self.module = module
+        self.qualname = qualname
+
+    @staticmethod
+    def of(func: typing.Callable[..., None]) -> object:
+        """
+        Returns a _WrappedFunction for the original function of a wrapper
+        found by name, otherwise func itself.
+        """
+        from paramvalidator.validated import find_qualified
+        module, qualname = getattr(func, "__module__", None), getattr(func, "__qualname__", None)
+        if module is None or qualname is None:
+            return func
+        found = find_qualified(module, qualname)
+        if found is not func and getattr(found, "__wrapped__", None) is func:
+            return _WrappedFunction(module, qualname)
+        return func
+
+    def __reduce__(self):
+        return (_resolve_wrapped, (self.module, self.qualname))
+
+
+def _resolve_wrapped(module: str, qualname: str) -> typing.Callable[..., None]:
+    import importlib
+    from paramvalidator.validated import find_qualified
+    importlib.import_module(module)
+    return find_qualified(module, qualname).__wrapped__
+
+
+def _restore(cls: type, args: tuple, state: typing.Dict[str, object]) -> ParameterValidationException:
+    exception = cls.__new__(cls, *args)
+    exception.args = args
+    for name, value in state.items():
+        setattr(exception, name, value)
+    return exception
+
+
+def type_name(expected_type: object) -> object:
+    """
+    Returns the name, or list of names for a tuple, of types in to_dict().
+    """
+    if isinstance(expected_type, tuple):
+        return [type_name(member) for member in expected_type]
+    return getattr(expected_type, "__name__", str(expected_type))
+
+
+def json_value(value: object) -> object:
+    """
+    Returns value if it can be written to JSON as is, otherwise its string,
+    or preview.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (tuple, list)):
+        return [json_value(member) for member in value]
+    if isinstance(value, (frozenset, set)):
+        return sorted((json_value(member) for member in value), key=repr)
+    return preview(value)
+
+
+def json_preview(value: object) -> object:
+    """
+    Returns the failing value of an exception for to_dict(), bounded like
+    preview().
+    """
+    if isinstance(value, str):
+        if len(value) > PREVIEW_LENGTH:
+            return preview(value)
+    elif isinstance(value, (tuple, list, frozenset, set, dict)) and len(value) > PREVIEW_ITEMS:
+        return preview(value)
+    return json_value(value)
+
+
+def preview(value: object, render: typing.Callable[[object], str] = str) -> str:
+    """
+    Returns render(value), or for long strings, large bytes-like values and
+    containers a preview of bounded length. Buffers are read through a
+    memoryview, only the bytes shown are copied.
+
+    Parameters:
+    value : The value to show
+    render : str or repr, applied to values, or the shown part of values, of
+             bounded length
+
+    Returns:
+    The text to show in a message.
+    """
+    if value is None or isinstance(value, (bool, int, float, complex)):
+        return render(value)
+    if isinstance(value, str):
+        if len(value) <= PREVIEW_LENGTH:
+            return render(value)
+        return "{}... ({} characters)".format(render(value[:PREVIEW_LENGTH]), len(value))
+    if isinstance(value, (tuple, list, frozenset, set, dict)):
+        import reprlib
+        bounded = reprlib.Repr()
+        bounded.maxstring = bounded.maxother = PREVIEW_LENGTH
+        bounded.maxlist = bounded.maxtuple = bounded.maxset = bounded.maxfrozenset = bounded.maxdict = PREVIEW_ITEMS
+        return bounded.repr(value)
+    try:
+        view = memoryview(value)
+    except TypeError:
+        # Not a buffer
+        return render(value)
+    except ValueError:
+        # i.e. a released memoryview or closed mmap
+        return "<{}, released>".format(type(value).__name__)
+    with view:
+        if view.nbytes <= PREVIEW_LENGTH and not isinstance(value, memoryview):
+            return render(value)
+        head = view.cast("B")[:PREVIEW_BYTES].tobytes() if view.c_contiguous else b""
+        return "<{} of {} bytes, format {!r}{}>".format(
+            type(value).__name__, view.nbytes, view.format, ", starting {!r}".format(head) if head else "")
@@ -0,0 +1,259 @@
+"""
+(c) Microsoft. All rights reserved.
+
+Opt-in memoization of accepted arguments.
+
+Hot functions often receive the same few immutable values over and over,
+i.e. frozen configuration tuples. With ParameterValidator.with_memo() a value
+that passed the element checks of a parameter, see Items, once is remembered
+and later calls with an equal value of the same types skip those checks.
+
+    - Each parameter slot has a bounded LRU cache, functools.lru_cache, of
+      maxsize entries keyed by the type and value of the argument. Tuples and
+      frozensets are keyed by the type of every element too, so that (1,) and
+      (True,) are told apart.
+    - Only immutable values are cached: tuples and frozensets of exact int,
+      float, complex, bool, str, bytes, None and nested tuples and frozensets.
+      Containers of more than MAX_LENGTH elements or holding more than
+      MAX_BYTES characters of str and bytes, or nested deeper than MAX_DEPTH,
+      are not cached, so a cache never holds large values.
+    - Failures are never cached, an invalid value is checked, and raises,
+      every time.
+    - Only parameters whose elements have range or membership checks are
+      memoized, see benchmarks/bench_memo.py. The type, range or membership
+      check of a scalar, and the type check of elements, is a single
+      isinstance, comparison or hash lookup, about as cheap as the cache
+      lookup. Nested containers are keyed element by element, which costs
+      about as much as checking them.
+
+The caches are thread-safe. Hits and misses are reported by memo_stats(),
+keyed by "module.qualname" like the telemetry. Every decoration has its own
+caches, registered weakly, so a function decorated again, i.e. a module
+reloaded or a validator built at runtime, frees the caches of the previous
+wrapper with it, and only the caches of live wrappers are reported.
+"""
+import functools
+import threading
+import typing
+import weakref
+from paramvalidator.specs import Items
+
+MAX_LENGTH = 64
+MAX_BYTES = 4096
+MAX_DEPTH = 4
+
+_SCALARS = frozenset((int, float, complex, bool, str, bytes, type(None)))
+_SIZED = frozenset((str, bytes))
+_NUMBERS = frozenset((int, float, complex, bool))
+
+_registry_lock = threading.Lock()
+_registry = {}
+
+
+class MemoStats(typing.NamedTuple):
+    """
+    Snapshot of the memo caches of one decorated function.
+
+    hits : Number of arguments accepted from the cache
+    misses : Number of cacheable arguments that were checked
+    size : Number of cached values, over all parameters
+    maxsize : Maximum number of cached values, over all parameters
+    """
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class MemoCache:
+    """
+    The per parameter caches of one decoration of a function. The memoized
+    checks hold it, it lives as long as the wrapper using them.
+    """
+    __slots__ = ("name", "maxsize", "_caches", "_lock", "__weakref__")
+
+    def __init__(self, name: str, maxsize: int):
+        self.name = name
+        self.maxsize = maxsize
+        self._caches = []
+        self._lock = threading.Lock()
+
+    def memoize(self, func: typing.Callable[..., None], param_index: object, check: typing.Callable[..., None]) -> typing.Callable[..., None]:
+        """
+        Returns a checker that remembers the arguments check accepted.
+
+        Parameters:
+        func: The decorated function, named in exceptions
+        param_index: The parameter index, named in exceptions
+        check: The compiled checker of the parameter
+
+        Returns:
+        A function taking (func, param_index, argument) that raises on failure.
+        """
+        @functools.lru_cache(maxsize=self.maxsize)
+        def accepted(key):
+            # Raises for invalid values, which lru_cache does not cache.
+            check(func, param_index, key[1])
+
+        with self._lock:
+            self._caches.append(accepted)
+
+        def memo_check(func, param_index, argument):
+            key = memo_key(argument)
+            if key is None:
+                check(func, param_index, argument)
+            else:
+                accepted(key)
+        # Keeps this cache registered while the check is in use
+        memo_check.memo_cache = self
+        return memo_check
+
+    def snapshot(self) -> MemoStats:
+        with self._lock:
+            infos = [accepted.cache_info() for accepted in self._caches]
+        return MemoStats(
+            sum(info.hits for info in infos),
+            sum(info.misses for info in infos),
+            sum(info.currsize for info in infos),
+            self.maxsize * len(infos))
+
+    def clear(self):
+        with self._lock:
+            for accepted in self._caches:
+                accepted.cache_clear()
+
+
+def memo_key(argument: object, depth: int = 0) -> typing.Optional[tuple]:
+    """
+    Returns the cache key of an argument, (type, value) or for tuples and
+    frozensets (type, value, element keys), or None if it must not be cached.
+    """
+    cls = type(argument)
+    if cls in _SCALARS:
+        if cls in _SIZED and len(argument) > MAX_BYTES:
+            return None
+        return (cls, argument)
+    if (cls is tuple or cls is frozenset) and depth < MAX_DEPTH and len(argument) <= MAX_LENGTH:
+        kinds = set(map(type, argument))
+        if kinds <= _SCALARS:
+            # Flat containers of scalars, keyed by the value and element types.
+            # Values of different types only compare equal between numeric
+            # types, i.e. (1, True) == (True, 1), so only then is the type of
+            # every element needed.
+            if kinds & _SIZED:
+                if kinds <= _SIZED:
+                    size = sum(map(len, argument))
+                else:
+                    size = sum(len(element) for element in argument if type(element) in _SIZED)
+                if size > MAX_BYTES:
+                    return None
+            if len(kinds & _NUMBERS) < 2:
+                return (cls, argument, frozenset(kinds))
+            if cls is tuple:
+                return (cls, argument, tuple(map(type, argument)))
+            return (cls, argument, frozenset(zip(map(type, argument), argument)))
+        keys = []
+        for element in argument:
+            key = memo_key(element, depth + 1)
+            if key is None:
+                return None
+            keys.append(key)
+        return (cls, argument, tuple(keys) if cls is tuple else frozenset(keys))
+    return None
+
+
+def memoize_checks(func: typing.Callable[..., None], schema: object, maxsize: int) -> typing.Tuple[tuple, tuple]:
+    """
+    Returns the compiled positional and kwargs checks of a schema, with the
+    checks of parameters whose elements have range or membership checks
+    memoized for func.
+
+    Parameters:
+    func: The decorated function, stats are recorded under its name
+    schema: The Schema of the ParameterValidator
+    maxsize: Maximum number of cached values per parameter
+
+    Returns:
+    Tuple of (arg_checks, kwarg_checks) in the form of Schema.compiled_args()
+    and Schema.compiled_kwargs(). Without any check worth memoizing, those
+    of the schema, and func has no memo cache.
+    """
+    if not any(map(_worth_memoizing, schema.args)) and not any(map(_worth_memoizing, schema.kwargs.values())):
+        return schema.compiled_args(), schema.compiled_kwargs()
+    cache = _new_memo_cache(func, maxsize)
+    arg_checks = tuple(
+        (param_index, cache.memoize(func, param_index, check) if _worth_memoizing(spec) else check)
+        for (param_index, check), spec in zip(schema.compiled_args(), schema.args))
+    kwarg_checks = tuple(
+        (name, param_index, allow_missing, cache.memoize(func, param_index, check) if _worth_memoizing(spec) else check)
+        for (name, param_index, allow_missing, check), spec in zip(schema.compiled_kwargs(), schema.kwargs.values()))
+    return arg_checks, kwarg_checks
+
+
+def _worth_memoizing(spec: tuple) -> bool:
+    # Elements with only a type check are checked as fast as they are keyed,
+    # nested containers are keyed element by element like they are checked.
+    if len(spec) != 3 or not isinstance(spec[2], Items):
+        return False
+    items = spec[2]
+    return any(element is not None and len(element) > 2 and not isinstance(element[2], Items)
+               for element in (items.values, items.keys))
+
+
+def _new_memo_cache(func: typing.Callable[..., None], maxsize: int) -> MemoCache:
+    name = "{}.{}".format(func.__module__, func.__qualname__)
+    cache = MemoCache(name, maxsize)
+    with _registry_lock:
+        caches = _registry.get(name)
+        if caches is None:
+            caches = _registry[name] = weakref.WeakSet()
+        caches.add(cache)
+    return cache
+
+
+def _live_caches() -> typing.Dict[str, typing.List[MemoCache]]:
+    """
+    Returns the caches of live wrappers by name, forgetting names left
+    without any.
+    """
+    with _registry_lock:
+        live = {name: list(caches) for name, caches in _registry.items()}
+        for name, caches in live.items():
+            if not caches:
+                del _registry[name]
+    return {name: caches for name, caches in live.items() if caches}
+
+
+def _combined(caches: typing.List[MemoCache]) -> MemoStats:
+    snapshots = [cache.snapshot() for cache in caches]
+    return MemoStats(*(sum(field) for field in zip(*snapshots)))
+
+
+def memo_stats(name: str = None) -> typing.Union[MemoStats, typing.Dict[str, MemoStats]]:
+    """
+    Returns the memo cache stats of memoized functions.
+
+    Parameters:
+    name: Optional "module.qualname" of one function.
+
+    Returns:
+    MemoStats for the named function, or a dictionary of all of them keyed
+    by "module.qualname". A function decorated more than once, with live
+    wrappers, reports their caches together.
+
+    Throws:
+    KeyError if the named function is not memoized
+    """
+    live = _live_caches()
+    if name is not None:
+        return _combined(live[name])
+    return {key: _combined(caches) for key, caches in live.items()}
+
+
+def clear_memo():
+    """
+    Empties the memo caches, and zeroes the stats, of all memoized functions.
+    """
+    for caches in _live_caches().values():
+        for cache in caches:
+            cache.clear()
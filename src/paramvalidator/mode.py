@@ -0,0 +1,224 @@
+"""
+(c) Microsoft. All rights reserved.
+
+Validation modes control whether a decorated function validates its
+parameters:
+
+    always       - every call is validated (default)
+    never        - no call is validated, the decorator returns the original
+                   function so there is no overhead at all
+    sample(rate) - a random fraction, rate between 0.0 and 1.0, of calls
+                   are validated
+
+The mode is resolved when a function is decorated. It is taken from the
+ParameterValidator instance if one was set with with_mode(), otherwise from
+the global mode. The global mode is read from the PARAMVALIDATOR_MODE
+environment variable on import, i.e. PARAMVALIDATOR_MODE="sample(0.05)",
+and can be changed with ParameterValidator.set_mode(). Set it before the
+modules holding decorated functions are imported.
+
+Decoration analyses the signature of the function and compiles its checkers.
+With lazy compilation, enabled with ParameterValidator.set_lazy_compile(), the
+PARAMVALIDATOR_LAZY_COMPILE=1 environment variable or with_lazy_compile(),
+that work is deferred to the first call of each function, so functions that
+are never called cost close to nothing at import.
+
+With validate once, enabled with ParameterValidator.set_validate_once(), the
+PARAMVALIDATOR_VALIDATE_ONCE=1 environment variable or with_validate_once(),
+decorated functions called from within another validated call skip their
+validation, see paramvalidator.context.
+
+The check order, declared or cost, set with
+ParameterValidator.set_check_order(), the PARAMVALIDATOR_CHECK_ORDER
+environment variable or with_check_order(), orders the checks of a call, see
+paramvalidator.planner.
+"""
+import os
+import re
+import typing
+
+ENVIRONMENT_VARIABLE = "PARAMVALIDATOR_MODE"
+LAZY_COMPILE_ENVIRONMENT_VARIABLE = "PARAMVALIDATOR_LAZY_COMPILE"
+VALIDATE_ONCE_ENVIRONMENT_VARIABLE = "PARAMVALIDATOR_VALIDATE_ONCE"
+CHECK_ORDER_ENVIRONMENT_VARIABLE = "PARAMVALIDATOR_CHECK_ORDER"
+
+CHECK_ORDERS = ("declared", "cost")
+
+_SAMPLE_PATTERN = re.compile(r"^sample\(\s*([0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)\s*\)$")
+
+
+class ValidationMode:
+    """
+    An immutable validation mode, one of always, never or sample(rate).
+    """
+    __slots__ = ("name", "rate")
+
+    def __init__(self, name: str, rate: float = 1.0):
+        if name not in ("always", "never", "sample"):
+            raise ValueError("Unknown validation mode {}".format(name))
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError("Sample rate must be between 0.0 and 1.0, got {}".format(rate))
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "rate", float(rate))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ValidationMode is immutable")
+
+    def __reduce__(self):
+        return (ValidationMode, (self.name, self.rate))
+
+    def __eq__(self, other):
+        return isinstance(other, ValidationMode) and (self.name, self.rate) == (other.name, other.rate)
+
+    def __hash__(self):
+        return hash((self.name, self.rate))
+
+    def __repr__(self):
+        if self.name == "sample":
+            return "sample({})".format(self.rate)
+        return self.name
+
+    @staticmethod
+    def parse(mode: typing.Union[str, "ValidationMode"]) -> "ValidationMode":
+        """
+        Parses a mode given as a string, i.e. "always", "never" or "sample(0.1)".
+
+        Parameters:
+        mode: String or ValidationMode
+
+        Returns:
+        ValidationMode
+
+        Throws:
+        ValueError if the mode is not recognized
+        """
+        if isinstance(mode, ValidationMode):
+            return mode
+        text = str(mode).strip().lower()
+        if text in ("always", "never"):
+            return ALWAYS if text == "always" else NEVER
+        match = _SAMPLE_PATTERN.match(text)
+        if match is None:
+            raise ValueError("Unknown validation mode {}, expected always, never or sample(rate)".format(mode))
+        return sample(float(match.group(1)))
+
+
+def sample(rate: float) -> ValidationMode:
+    """
+    Returns a mode that validates a random fraction, rate, of calls.
+    """
+    return ValidationMode("sample", rate)
+
+
+ALWAYS = ValidationMode("always")
+NEVER = ValidationMode("never", 0.0)
+
+_global_mode = ValidationMode.parse(os.environ.get(ENVIRONMENT_VARIABLE, "always"))
+
+
+def _environment_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+_lazy_compile = _environment_flag(LAZY_COMPILE_ENVIRONMENT_VARIABLE)
+_validate_once = _environment_flag(VALIDATE_ONCE_ENVIRONMENT_VARIABLE)
+
+
+def parse_check_order(order: str) -> str:
+    """
+    Returns the check order named order, ignoring case and spaces.
+
+    Throws:
+    ValueError if order is unknown
+    """
+    parsed = str(order).strip().lower()
+    if parsed not in CHECK_ORDERS:
+        raise ValueError("Unknown check order {}, expected one of {}".format(order, ", ".join(CHECK_ORDERS)))
+    return parsed
+
+
+_check_order = parse_check_order(os.environ.get(CHECK_ORDER_ENVIRONMENT_VARIABLE, "declared"))
+
+
+def get_global_mode() -> ValidationMode:
+    """
+    Returns the mode used by decorators that were not given one.
+    """
+    return _global_mode
+
+
+def set_global_mode(mode: typing.Union[str, ValidationMode]) -> ValidationMode:
+    """
+    Sets the mode used by decorators that were not given one.
+
+    Returns:
+    The previous global mode.
+    """
+    global _global_mode
+    previous = _global_mode
+    _global_mode = ValidationMode.parse(mode)
+    return previous
+
+
+def get_lazy_compile() -> bool:
+    """
+    Returns True if decorators not configured otherwise defer compilation to
+    the first call.
+    """
+    return _lazy_compile
+
+
+def set_lazy_compile(enabled: bool) -> bool:
+    """
+    Sets whether decorators not configured otherwise defer compilation to the
+    first call.
+
+    Returns:
+    The previous setting.
+    """
+    global _lazy_compile
+    previous = _lazy_compile
+    _lazy_compile = bool(enabled)
+    return previous
+
+
+def get_validate_once() -> bool:
+    """
+    Returns True if decorators not configured otherwise skip validation
+    within another validated call.
+    """
+    return _validate_once
+
+
+def set_validate_once(enabled: bool) -> bool:
+    """
+    Sets whether decorators not configured otherwise skip validation within
+    another validated call.
+
+    Returns:
+    The previous setting.
+    """
+    global _validate_once
+    previous = _validate_once
+    _validate_once = bool(enabled)
+    return previous
+
+
+def get_check_order() -> str:
+    """
+    Returns the check order of decorators not configured otherwise.
+    """
+    return _check_order
+
+
+def set_check_order(order: str) -> str:
+    """
+    Sets the check order of decorators not configured otherwise.
+
+    Returns:
+    The previous setting.
+    """
+    global _check_order
+    previous = _check_order
+    _check_order = parse_check_order(order)
+    return previous
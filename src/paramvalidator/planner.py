@@ -0,0 +1,112 @@
+"""
+(c) Microsoft. All rights reserved.
+
+Orders the checks of a call so that failing calls fail as early as possible.
+
+By default the parameters of a call are checked in declaration order,
+positional parameters and then kwargs. With a check order, set with
+ParameterValidator.with_check_order(), set_check_order() or the
+PARAMVALIDATOR_CHECK_ORDER environment variable, the checks are planned when
+the function is decorated:
+
+    declared - declaration order (default)
+    cost     - cheapest first. Required kwargs are tested for presence, and
+               positional parameters that must not be None for None, before
+               any other check. The checks follow by estimated cost: type
+               only, then scalar ranges, membership and buffer checks, then
+               patterns and predicates, then the elements of containers.
+               Checks of the same cost keep declaration order.
+
+Valid calls run every check whatever the order. Only calls matching the
+parameters exactly, positional parameters passed positionally, are planned,
+the others are checked in declaration order.
+
+A call with a single failing parameter raises the same exception in every
+order. When several parameters fail, the exception raised is that of the
+first failing check in declaration order for declared, in cost order for
+cost. with_collect_all() reports every failure, in declaration order,
+whatever the check order.
+
+There is no order following the failures observed: to raise the same
+exception for the same call, a plan re-sorted by failures would have to run
+every check preceding the failing one in cost order, no fewer than cost
+order runs.
+"""
+import typing
+from paramvalidator.specs import Items, Constraints, Buffer, PATTERN_TYPE
+from paramvalidator.exceptions import ParameterKwargValidationException, ParameterNoneValidationException
+
+# Estimated check costs, by spec
+COST_TYPE = 1
+COST_VALUE = 2
+COST_CUSTOM = 3
+COST_CONTAINER = 4
+
+
+def check_cost(spec: tuple) -> int:
+    """
+    Returns the estimated cost of checking a validation tuple.
+    """
+    constraint = spec[2] if len(spec) > 2 else None
+    if constraint is None:
+        return COST_TYPE
+    if isinstance(constraint, Items):
+        return COST_CONTAINER
+    if isinstance(constraint, PATTERN_TYPE) or (
+            isinstance(constraint, Constraints) and (constraint.pattern is not None or constraint.predicate)):
+        return COST_CUSTOM
+    if isinstance(constraint, (tuple, frozenset, Constraints, Buffer)):
+        return COST_VALUE
+    return COST_CUSTOM
+
+
+def plan_checks(positional: typing.Sequence[typing.Tuple[int, int, typing.Callable[..., None], tuple]], keyword: typing.Sequence[typing.Tuple[str, int, bool, typing.Callable[..., None], tuple]]) -> typing.Tuple[tuple, tuple, tuple]:
+    """
+    Plans the checks of a call in cost order.
+
+    Parameters:
+    positional: (slot, param_index, checker, spec) of the positional parameters
+    keyword: (name, param_index, allow_missing, checker, spec) of the kwargs
+
+    Returns:
+    Tuple of (required kwarg names, (slot, param_index) of positional
+    parameters that must not be None, checks) where checks are (cost,
+    (slot, name, param_index, checker)) in cost order, slot None for kwargs.
+    """
+    required = tuple(name for (name, _, allow_missing, _, _) in keyword if not allow_missing)
+    not_none = tuple((slot, param_index) for (slot, param_index, _, spec) in positional if not spec[1])
+    declared = [(check_cost(spec), (slot, None, param_index, check)) for (slot, param_index, check, spec) in positional]
+    declared += [(check_cost(spec), (None, name, param_index, check)) for (name, param_index, _, check, spec) in keyword]
+    # sorted() is stable, checks of the same cost keep declaration order
+    return required, not_none, tuple(sorted(declared, key=lambda planned: planned[0]))
+
+
+def planned_validator(func: typing.Callable[..., None], positional: typing.Sequence[tuple], keyword: typing.Sequence[tuple]) -> typing.Callable[[tuple, dict], None]:
+    """
+    Returns a function validating the (args, kwargs) of a call, args matching
+    the positional parameters exactly, in cost order.
+
+    Parameters:
+    func: The calling function
+    positional: (slot, param_index, checker, spec) of the positional parameters
+    keyword: (name, param_index, allow_missing, checker, spec) of the kwargs
+
+    Returns:
+    Function taking (args, kwargs) that raises on the first failure found.
+    """
+    required, not_none, planned_costs = plan_checks(positional, keyword)
+    checks = tuple(planned for (_, planned) in planned_costs)
+
+    def validate(args, kwargs):
+        for name in required:
+            if name not in kwargs:
+                raise ParameterKwargValidationException(func, name)
+        for (slot, param_index) in not_none:
+            if args[slot] is None:
+                raise ParameterNoneValidationException(func, param_index)
+        for (slot, name, param_index, check) in checks:
+            if slot is not None:
+                check(func, param_index, args[slot])
+            elif name in kwargs:
+                check(func, param_index, kwargs[name])
+    return validate
@@ -0,0 +1,239 @@
+"""
+(c) Microsoft. All rights reserved.
+
+Immutable, interned validation specs.
+
+Large code bases repeat identical validation tuples, i.e. (str, False), on
+thousands of decorated functions. Every ParameterValidator interns its
+validation tuples as Spec objects and the whole set as a Schema, so identical
+tuples and identical decorators share one object, and one compiled checker.
+
+    Spec   - a validation tuple. It is a tuple, so it can be used anywhere a
+             validation tuple can, i.e. Spec(int, False, (0, 10)).
+    Schema - the positional and kwargs specs of a ParameterValidator. A Schema
+             can be defined once and passed to ParameterValidator in place of
+             the tuples, i.e.
+
+                 PORT = Schema((str, False), (int, False, (0, 65535)))
+
+                 @ParameterValidator(PORT)
+                 def connect(host, port):
+
+Interned Specs, Schemas and their checkers are kept for the life of the
+process. Only validation tuples that can be found again are interned: plain
+values, and types and functions reachable by module and qualified name. A
+tuple holding a lambda, or a class defined in a factory function, is tied to
+that object and is neither interned nor its checker cached, so validators
+built at runtime around new types and functions are freed with them.
+"""
+import enum
+import operator
+import sys
+import threading
+import types
+import typing
+from paramvalidator.specs import Items, Constraints, Buffer, PATTERN_TYPE
+
+_lock = threading.Lock()
+_specs = {}
+_schemas = {}
+
+# Values kept by value, see retainable()
+_VALUE_TYPES = frozenset((int, float, complex, bool, str, bytes, type(None)))
+
+
+def retainable(value: object) -> bool:
+    """
+    Returns True if a value is identified by value, or reachable by module
+    and qualified name, and can be kept for the life of the process. Types
+    and functions created at runtime, i.e. a class defined in a factory or a
+    lambda, are not, neither are objects of any other kind.
+    """
+    kind = type(value)
+    if kind in _VALUE_TYPES or kind is PATTERN_TYPE:
+        return True
+    if kind is tuple or kind is frozenset:
+        return all(map(retainable, value))
+    if kind is Items or kind is Constraints or kind is Buffer:
+        return all(map(retainable, value._key()))
+    if isinstance(value, (type, types.FunctionType, types.BuiltinFunctionType)):
+        return _reachable(value)
+    if isinstance(kind, enum.EnumMeta):
+        return _reachable(kind)
+    return False
+
+
+def _reachable(value: object) -> bool:
+    module = sys.modules.get(getattr(value, "__module__", None))
+    for name in getattr(value, "__qualname__", "<locals>").split("."):
+        module = getattr(module, name, None)
+    return module is value
+
+
+def _same(spec: "Spec", key: tuple) -> bool:
+    """
+    Returns True if an interned Spec, already found equal to key, also renders
+    alike in exception messages. Ranges (0, 1) and (0.0, 1.0) are equal, and
+    hash alike, but are kept apart. Members are mostly the same objects, the
+    repr is only compared when they are not.
+    """
+    return all(map(operator.is_, spec, key)) or repr(spec) == repr(key)
+
+
+def _schema_key(args: typing.Tuple[object, ...], kwargs: typing.Dict[str, object]) -> object:
+    # Interned Specs live as long as the process, their identity is the key.
+    # Schemas holding other specs, unhashable or not retainable, are not shared.
+    if all(type(spec) is Spec for spec in args) and all(type(spec) is Spec for spec in kwargs.values()):
+        return (tuple(map(id, args)), tuple((name, id(spec)) for name, spec in kwargs.items()))
+    return None
+
+
+class Spec(tuple):
+    """
+    An interned validation tuple (type, allow None[, range or constraint]).
+    """
+    __slots__ = ()
+
+    def __new__(cls, expected_type: object, allow_none: bool = False, *constraint: object):
+        return intern_spec((expected_type, allow_none) + constraint)
+
+    def __reduce__(self):
+        return (intern_spec, (tuple(self),))
+
+    @property
+    def expected_type(self) -> object:
+        return self[0]
+
+    @property
+    def allow_none(self) -> bool:
+        return self[1]
+
+    @property
+    def constraint(self) -> object:
+        """The third element of the tuple, or None."""
+        return self[2] if len(self) > 2 else None
+
+
+def intern_spec(validation: object) -> object:
+    """
+    Returns the interned Spec equal to a validation tuple. Values that are not
+    tuples, cannot be hashed or are not retainable() are returned unchanged.
+
+    Parameters:
+    validation : Validation tuple
+
+    Returns:
+    The shared Spec instance, or validation itself.
+    """
+    if type(validation) is Spec or not isinstance(validation, tuple):
+        return validation
+    # Keyed by the tuple itself, equal tuples that render differently share
+    # the key and are told apart by _same().
+    key = tuple(validation)
+    try:
+        candidates = _specs.get(key, ())
+    except TypeError:
+        return validation
+    for spec in candidates:
+        if _same(spec, key):
+            return spec
+    if not retainable(key):
+        return validation
+    with _lock:
+        candidates = _specs.setdefault(key, [])
+        for spec in candidates:
+            if _same(spec, key):
+                return spec
+        spec = tuple.__new__(Spec, key)
+        candidates.append(spec)
+    return spec
+
+
+class Schema:
+    """
+    The interned positional and kwargs specs of a ParameterValidator.
+
+    Attributes:
+    args : Tuple of positional Specs
+    kwargs : Read only mapping of kwarg name to Spec, in declaration order
+    """
+    __slots__ = ("args", "kwargs", "_key", "_compiled_args", "_compiled_kwargs")
+
+    def __new__(cls, *args: tuple, **kwargs: tuple):
+        args = tuple(intern_spec(validation) for validation in args)
+        kwargs = {name: intern_spec(validation) for name, validation in kwargs.items()}
+        key = _schema_key(args, kwargs)
+        if key is None:
+            # Unhashable or not retainable specs, not shared
+            return cls._create(args, kwargs, None)
+
+        schema = _schemas.get(key)
+        if schema is None:
+            with _lock:
+                schema = _schemas.get(key)
+                if schema is None:
+                    schema = _schemas[key] = cls._create(args, kwargs, key)
+        return schema
+
+    @classmethod
+    def _create(cls, args: typing.Tuple[object, ...], kwargs: typing.Dict[str, object], key: object) -> "Schema":
+        schema = object.__new__(cls)
+        object.__setattr__(schema, "args", args)
+        object.__setattr__(schema, "kwargs", types.MappingProxyType(kwargs))
+        object.__setattr__(schema, "_key", key)
+        object.__setattr__(schema, "_compiled_args", None)
+        object.__setattr__(schema, "_compiled_kwargs", None)
+        return schema
+
+    def compiled_args(self) -> typing.Tuple[tuple, ...]:
+        """
+        Returns the (param_index, checker) pairs of the positional specs. They
+        are compiled once and shared by every function using this schema.
+        """
+        compiled = self._compiled_args
+        if compiled is None:
+            # Threads racing here compile equivalent tuples, the last one
+            # stored wins. No lock is needed, with or without the GIL.
+            from paramvalidator.compiler import compile_args
+            compiled = tuple(compile_args(self.args))
+            object.__setattr__(self, "_compiled_args", compiled)
+        return compiled
+
+    def compiled_kwargs(self) -> typing.Tuple[tuple, ...]:
+        """
+        Returns the (name, param_index, allow_missing, checker) tuples of the
+        kwargs specs, compiled once like compiled_args().
+        """
+        compiled = self._compiled_kwargs
+        if compiled is None:
+            from paramvalidator.compiler import compile_kwargs
+            compiled = tuple(compile_kwargs(self.kwargs))
+            object.__setattr__(self, "_compiled_kwargs", compiled)
+        return compiled
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Schema is immutable")
+
+    def __reduce__(self):
+        return (_rebuild_schema, (self.args, dict(self.kwargs)))
+
+    def __eq__(self, other):
+        if not isinstance(other, Schema):
+            return NotImplemented
+        if self._key is not None and other._key is not None:
+            return self._key == other._key
+        return self.args == other.args and dict(self.kwargs) == dict(other.kwargs)
+
+    def __hash__(self):
+        if self._key is None:
+            raise TypeError("Schema with unhashable specs is not hashable")
+        return hash(self._key)
+
+    def __repr__(self):
+        parts = [repr(tuple(spec)) for spec in self.args]
+        parts += ["{}={!r}".format(name, tuple(spec)) for name, spec in self.kwargs.items()]
+        return "Schema({})".format(", ".join(parts))
+
+
+def _rebuild_schema(args: typing.Tuple[object, ...], kwargs: typing.Dict[str, object]) -> Schema:
+    return Schema(*args, **kwargs)
@@ -0,0 +1,208 @@
+"""
+(c) Microsoft. All rights reserved.
+
+Objects that extend the validation tuple.
+
+The third element of a validation tuple is usually a (low, high) range for
+int/float arguments. It can instead be one of the objects below to validate
+the contents of an argument.
+
+    Items - validates the elements of a list, tuple, set, dict, array.array
+            or NumPy array against a nested validation tuple.
+
+            i.e. (list, False, Items((int, False, (0, 10))))
+                 (dict, True, Items((list, False, Items((str, False))), keys=(str, False)))
+
+    Constraints - validates the value of an argument: its length, bounds,
+            finiteness, membership, format and user predicates.
+
+            i.e. (str, False, Constraints(min_length=1, max_length=64, pattern=r"[a-z_]+"))
+                 (float, False, Constraints(gt=0.0, finite=True))
+
+    Buffer - validates a bytes-like argument through the buffer protocol: its
+            size, item format, contiguity and read only status, without
+            copying it.
+
+            i.e. ((bytes, bytearray, memoryview, mmap.mmap), False, Buffer(max_size=1 << 20))
+                 (object, False, Buffer(format="d", contiguous=True, readonly=False))
+
+A frozenset of allowed values, or a compiled re pattern, may also be given
+directly as the third element, i.e. (str, False, frozenset({"r", "w"})) or
+(str, False, re.compile(r"[0-9a-f]{40}")).
+"""
+import re
+import typing
+
+# re.Pattern is only named from Python 3.8
+PATTERN_TYPE = type(re.compile(""))
+
+
+class Items:
+    """
+    Element validation for container arguments.
+
+    Parameters:
+    values : Validation tuple every element (dict value for dicts) must meet.
+    keys : Validation tuple every dict key must meet, dicts only.
+    first : Only validate the first N elements.
+    sample : Only validate K randomly chosen elements. Sets, dicts and other
+             containers that cannot be indexed have their first K elements
+             validated instead, to keep the cost O(K).
+
+    Without first or sample every element is validated, which is O(n).
+
+    Homogeneous array.array and NumPy arguments have their element type
+    checked once from the typecode/dtype, in O(1). Only a range on the
+    elements, if one is given, requires looking at the elements themselves.
+    """
+    __slots__ = ("values", "keys", "first", "sample")
+
+    def __init__(self, values: tuple = None, keys: tuple = None, first: int = None, sample: int = None):
+        if first is not None and sample is not None:
+            raise ValueError("Items accepts first or sample, not both")
+        for name, count in (("first", first), ("sample", sample)):
+            if count is not None and count < 0:
+                raise ValueError("Items {} must not be negative, got {}".format(name, count))
+        object.__setattr__(self, "values", values)
+        object.__setattr__(self, "keys", keys)
+        object.__setattr__(self, "first", first)
+        object.__setattr__(self, "sample", sample)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Items is immutable")
+
+    def __reduce__(self):
+        return (Items, self._key())
+
+    def _key(self) -> typing.Tuple[object, ...]:
+        return (self.values, self.keys, self.first, self.sample)
+
+    def __eq__(self, other):
+        return isinstance(other, Items) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return "Items({!r}, keys={!r}, first={!r}, sample={!r})".format(*self._key())
+
+
+class Constraints:
+    """
+    Value constraints for an argument, checked after its None and type checks.
+
+    Parameters:
+    min_length : Minimum len() of the argument.
+    max_length : Maximum len() of the argument.
+    gt, ge, lt, le : Exclusive (gt, lt) and inclusive (ge, le) bounds.
+    finite : True to reject NaN and infinite numbers.
+    allowed : Iterable of allowed values, held as a frozenset.
+    pattern : Regular expression, a str or compiled pattern, the whole
+              argument must match, see re.fullmatch.
+    predicate : Function, or tuple of functions, taking the argument and
+                returning True if it is valid. Predicates should be pure,
+                ParameterValidator.with_memo() remembers accepted values.
+
+    Only the constraints given are checked, cheapest first: length, bounds,
+    finite, allowed, pattern, predicate. Patterns are compiled when the
+    Constraints is created and membership is a hash lookup. Arguments that
+    a constraint cannot be applied to, i.e. len() of an int, fail it.
+    """
+    __slots__ = ("min_length", "max_length", "gt", "ge", "lt", "le", "finite", "allowed", "pattern", "predicate")
+
+    def __init__(self, min_length: int = None, max_length: int = None, gt: object = None, ge: object = None,
+                 lt: object = None, le: object = None, finite: bool = False, allowed: typing.Iterable[object] = None,
+                 pattern: typing.Union[str, typing.Pattern] = None,
+                 predicate: typing.Union[typing.Callable[[object], bool], typing.Tuple[typing.Callable[[object], bool], ...]] = None):
+        for name, length in (("min_length", min_length), ("max_length", max_length)):
+            if length is not None and length < 0:
+                raise ValueError("Constraints {} must not be negative, got {}".format(name, length))
+        if gt is not None and ge is not None or lt is not None and le is not None:
+            raise ValueError("Constraints accepts one lower (gt or ge) and one upper (lt or le) bound")
+        if pattern is not None and not isinstance(pattern, PATTERN_TYPE):
+            pattern = re.compile(pattern)
+        if predicate is not None and not isinstance(predicate, tuple):
+            predicate = (predicate,)
+        for name, value in (("min_length", min_length), ("max_length", max_length), ("gt", gt), ("ge", ge),
+                            ("lt", lt), ("le", le), ("finite", bool(finite)),
+                            ("allowed", frozenset(allowed) if allowed is not None else None),
+                            ("pattern", pattern), ("predicate", predicate)):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Constraints is immutable")
+
+    def __reduce__(self):
+        return (_rebuild_constraints, (dict(zip(self.__slots__, self._key())),))
+
+    def _key(self) -> typing.Tuple[object, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        return isinstance(other, Constraints) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        given = ["{}={!r}".format(name, value) for name, value in zip(self.__slots__, self._key())
+                 if value is not None and value is not False]
+        return "Constraints({})".format(", ".join(given))
+
+
+def _rebuild_constraints(fields: typing.Dict[str, object]) -> Constraints:
+    return Constraints(**fields)
+
+
+class Buffer:
+    """
+    Buffer protocol checks for bytes-like arguments, i.e. bytes, bytearray,
+    memoryview, mmap, array.array or NumPy arrays, checked after the None and
+    type checks.
+
+    Parameters:
+    min_size : Minimum size of the buffer, in bytes.
+    max_size : Maximum size of the buffer, in bytes.
+    format : struct format of the items, i.e. "B" or "d", or a tuple of
+             accepted formats.
+    contiguous : True to require a C contiguous buffer.
+    readonly : True to require a read only buffer, False a writable one.
+
+    The argument is checked through a memoryview, released before returning,
+    which neither copies nor reads its data. Arguments without the buffer
+    protocol fail the "buffer" constraint. Failures show a bounded preview of
+    the argument, see ParameterConstraintValidationException.
+    """
+    __slots__ = ("min_size", "max_size", "format", "contiguous", "readonly")
+
+    def __init__(self, min_size: int = None, max_size: int = None, format: typing.Union[str, typing.Tuple[str, ...]] = None,
+                 contiguous: bool = False, readonly: bool = None):
+        for name, size in (("min_size", min_size), ("max_size", max_size)):
+            if size is not None and size < 0:
+                raise ValueError("Buffer {} must not be negative, got {}".format(name, size))
+        if isinstance(format, str):
+            format = (format,)
+        for name, value in (("min_size", min_size), ("max_size", max_size),
+                            ("format", tuple(format) if format is not None else None),
+                            ("contiguous", bool(contiguous)), ("readonly", readonly)):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Buffer is immutable")
+
+    def __reduce__(self):
+        return (Buffer, self._key())
+
+    def _key(self) -> typing.Tuple[object, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        return isinstance(other, Buffer) and self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        given = ["{}={!r}".format(name, value) for name, value in zip(self.__slots__, self._key())
+                 if value is not None and value is not False]
+        return "Buffer({})".format(", ".join(given))
@@ -0,0 +1,153 @@
+"""
+(c) Microsoft. All rights reserved.
+
+Validation of payload dicts from a stream, without a function call.
+
+The kwargs rules of a ParameterValidator, or a Schema, are applied to every
+record of an iterable, i.e. JSON lines or message queue payloads:
+
+    validator = ParameterValidator(id=(int, False), name=(str, False), tags=(list, True))
+    with open("events.jsonl") as lines:
+        for record in validator.validate_stream(map(json.loads, lines), only_valid=True):
+            ...
+
+Records are pulled from the iterable chunk_size at a time and results are
+yielded lazily, one at a time or, with chunked=True, as one list per chunk,
+i.e. for bulk inserts. At most a few chunks are held in memory however long
+the stream is. Every failure of a record is reported, parameters are named by
+their kwarg name. Records that are not dicts fail with a type exception for
+parameter "record".
+
+With processes=N the chunks are validated in a pool of N worker processes,
+for CPU bound validation of large files. At most 2 * N chunks are in flight
+and results keep the order of the stream. Records, specs and exceptions
+must then be picklable.
+"""
+import collections
+import itertools
+import typing
+from paramvalidator.exceptions import (
+    ParameterValidationException,
+    ParameterKwargValidationException,
+    ParameterTypeValidationException
+)
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Compiled kwargs checks of a worker process, see _initialize_worker()
+_worker_checks = None
+
+
+def validate_stream(*args, **kwargs):
+    """
+    Stand-in function named in exceptions of stream validation when no
+    function is supplied.
+    """
+
+
+def record_errors(kwarg_checks: typing.Sequence[tuple], record: object, func: typing.Callable[..., None] = validate_stream) -> typing.List[ParameterValidationException]:
+    """
+    Returns every failure of one record.
+
+    Parameters:
+    kwarg_checks: Compiled kwargs checks, see Schema.compiled_kwargs()
+    record: The record, a dict
+    func: Function named in the exceptions
+
+    Returns:
+    List of exceptions, empty if the record is valid.
+    """
+    if not isinstance(record, dict):
+        return [ParameterTypeValidationException(func, "record", type(record), dict)]
+    errors = []
+    for (name, _, allow_missing, check) in kwarg_checks:
+        if name in record:
+            try:
+                check(func, name, record[name])
+            except ParameterValidationException as ex:
+                # Without the traceback, which would reference this frame and
+                # so errors, the exception is freed with the record.
+                errors.append(ex.with_traceback(None))
+        elif not allow_missing:
+            errors.append(ParameterKwargValidationException(func, name))
+    return errors
+
+
+def validate_records(schema: object, records: typing.Iterable[object], only_valid: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE, processes: int = None, chunked: bool = False, func: typing.Callable[..., None] = None) -> typing.Iterator[object]:
+    """
+    Lazily validates the records of a stream against the kwargs specs of a
+    Schema.
+
+    Parameters:
+    schema: The Schema, its kwargs specs are used
+    records: Iterable or generator of records
+    only_valid: True to yield only the valid records
+    chunk_size: Number of records pulled from the stream at a time
+    processes: Number of worker processes, None to validate in this process
+    chunked: True to yield a list of results per chunk rather than each result
+    func: Module level function named in the exceptions, defaults to a stand-in
+
+    Returns:
+    Iterator of (record, errors) pairs in stream order, errors being the list
+    of exceptions of the record, or of the valid records if only_valid. If
+    chunked, an iterator of lists of those, one list per chunk.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1, got {}".format(chunk_size))
+    func = func or validate_stream
+    chunks = _chunks(records, chunk_size)
+    if processes:
+        results = _validate_in_pool(schema, chunks, processes, func)
+    else:
+        kwarg_checks = schema.compiled_kwargs()
+        results = ([(record, record_errors(kwarg_checks, record, func)) for record in chunk] for chunk in chunks)
+
+    if only_valid:
+        results = ([record for (record, errors) in chunk if not errors] for chunk in results)
+    if chunked:
+        return results
+    return _flatten(results)
+
+
+def _flatten(chunks: typing.Iterator[list]) -> typing.Iterator[object]:
+    try:
+        for chunk in chunks:
+            yield from chunk
+    finally:
+        # Stops a process pool when the consumer stops early
+        chunks.close()
+
+
+def _chunks(records: typing.Iterable[object], chunk_size: int) -> typing.Iterator[typing.List[object]]:
+    iterator = iter(records)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _initialize_worker(schema: object):
+    global _worker_checks
+    _worker_checks = schema.compiled_kwargs()
+
+
+def _validate_chunk(chunk: typing.List[object], func: typing.Callable[..., None]) -> typing.List[typing.Tuple[object, list]]:
+    return [(record, record_errors(_worker_checks, record, func)) for record in chunk]
+
+
+def _validate_in_pool(schema: object, chunks: typing.Iterator[typing.List[object]], processes: int, func: typing.Callable[..., None]) -> typing.Iterator[typing.List[tuple]]:
+    """
+    Validates chunks in a process pool keeping at most 2 * processes chunks
+    in flight. Pool.imap would read the whole stream ahead of the workers.
+    """
+    import multiprocessing
+
+    with multiprocessing.Pool(processes, _initialize_worker, (schema,)) as pool:
+        pending = collections.deque()
+        for chunk in chunks:
+            pending.append(pool.apply_async(_validate_chunk, (chunk, func)))
+            if len(pending) >= 2 * processes:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
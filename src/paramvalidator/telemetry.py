@@ -0,0 +1,280 @@
+"""
+(c) Microsoft. All rights reserved.
+
+Opt-in telemetry for decorated functions.
+
+When enabled, globally with enable_stats() or per decorator with
+ParameterValidator.with_stats(), the decorated function records
+
+    - the number of validated calls
+    - the number of failures by exception class and parameter
+    - optionally, the cumulative time spent validating, in nanoseconds
+
+Like the validation mode, this is resolved when a function is decorated, so
+functions decorated without telemetry carry no instrumentation at all.
+
+Call counts and timings are kept in per-thread shards so that threads never
+contend on the hot path; the shards are summed when stats() is called. The
+shard of a thread is folded into a retired total when the thread ends, so
+servers running a thread per request keep one shard per live thread.
+Failures are counted under a lock as they are the exceptional path.
+
+Hooks registered with add_hook() are called after every instrumented call as
+
+    hook(name, exception, elapsed_ns)
+
+where exception is None on success and elapsed_ns is None when timing is off.
+"""
+import threading
+import typing
+import weakref
+from time import perf_counter_ns
+from paramvalidator.exceptions import ParameterValidationException
+
+_registry_lock = threading.Lock()
+_registry = {}
+_hooks = ()
+_enabled = False
+_timing = False
+
+
+class ValidationStats(typing.NamedTuple):
+    """
+    Snapshot of the telemetry of one decorated function.
+
+    calls : Number of validated calls
+    failures : Dictionary of (exception class name, parameter) to count
+    validation_ns : Cumulative validation time, 0 if timing is not enabled
+    """
+    calls: int
+    failures: typing.Dict[typing.Tuple[str, object], int]
+    validation_ns: int
+
+
+class _ShardOwner:
+    """
+    Held by the thread local of one thread, it is released when the thread
+    ends and its shard is then retired.
+    """
+    __slots__ = ("__weakref__",)
+
+
+class FunctionStats:
+    """
+    Thread-safe counters for one decorated function.
+    """
+    __slots__ = ("name", "_local", "_shards", "_retired", "_failures", "_lock")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._local = threading.local()
+        self._shards = {}
+        self._retired = [0, 0]
+        self._failures = {}
+        self._lock = threading.Lock()
+
+    def shard(self) -> typing.List[int]:
+        """
+        Returns the [calls, validation_ns] counters of the calling thread.
+        """
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = [0, 0]
+            owner = _ShardOwner()
+            with self._lock:
+                self._shards[id(shard)] = shard
+            weakref.finalize(owner, self._retire, shard)
+            self._local.owner = owner
+            self._local.shard = shard
+            return shard
+
+    def _retire(self, shard: typing.List[int]):
+        # The thread has ended, its shard is no longer written to.
+        with self._lock:
+            del self._shards[id(shard)]
+            self._retired[0] += shard[0]
+            self._retired[1] += shard[1]
+
+    def record_failure(self, exception: ParameterValidationException):
+        """
+        Counts a failure by exception class and parameter index or kwarg name.
+        The failures collected in a ParameterAggregateValidationException are
+        each counted.
+        """
+        exceptions = getattr(exception, "failures", None) or (exception,)
+        keys = [(type(failure).__name__, _failed_parameter(failure)) for failure in exceptions]
+        with self._lock:
+            for key in keys:
+                self._failures[key] = self._failures.get(key, 0) + 1
+
+    def snapshot(self) -> ValidationStats:
+        with self._lock:
+            shards = [list(shard) for shard in self._shards.values()]
+            shards.append(list(self._retired))
+            failures = dict(self._failures)
+        return ValidationStats(
+            sum(shard[0] for shard in shards),
+            failures,
+            sum(shard[1] for shard in shards))
+
+    def reset(self):
+        with self._lock:
+            for shard in self._shards.values():
+                shard[0] = shard[1] = 0
+            self._retired[0] = self._retired[1] = 0
+            self._failures.clear()
+
+
+def _failed_parameter(exception: ParameterValidationException) -> object:
+    """
+    Returns the parameter index or kwarg name an exception refers to, if any.
+    """
+    param = getattr(exception, "param", None)
+    if param is None:
+        param = getattr(exception, "expected", None)
+    return param
+
+
+def _get_function_stats(func: typing.Callable[..., None]) -> FunctionStats:
+    name = "{}.{}".format(func.__module__, func.__qualname__)
+    with _registry_lock:
+        function_stats = _registry.get(name)
+        if function_stats is None:
+            function_stats = _registry[name] = FunctionStats(name)
+    return function_stats
+
+
+def instrument(func: typing.Callable[..., None], validate: typing.Callable[..., None], timing: bool, target: typing.Callable[..., object] = None) -> typing.Callable[..., object]:
+    """
+    Wraps a function with validation and telemetry.
+
+    Parameters:
+    func: The decorated function, stats are recorded under its name
+    validate: Callable taking the call arguments that raises if they are invalid
+    timing: True to measure the time spent in validate
+    target: Function called once the arguments are validated, defaults to func
+
+    Returns:
+    The instrumented wrapper.
+    """
+    if target is None:
+        target = func
+    function_stats = _get_function_stats(func)
+    shard = function_stats.shard
+    record_failure = function_stats.record_failure
+    name = function_stats.name
+
+    if timing:
+        def timed_wrapper(*args, **kwargs):
+            counters = shard()
+            start = perf_counter_ns()
+            try:
+                validate(*args, **kwargs)
+            except ParameterValidationException as ex:
+                elapsed = perf_counter_ns() - start
+                counters[0] += 1
+                counters[1] += elapsed
+                record_failure(ex)
+                for hook in _hooks:
+                    hook(name, ex, elapsed)
+                raise
+            elapsed = perf_counter_ns() - start
+            counters[0] += 1
+            counters[1] += elapsed
+            for hook in _hooks:
+                hook(name, None, elapsed)
+            return target(*args, **kwargs)
+        return timed_wrapper
+
+    def counted_wrapper(*args, **kwargs):
+        counters = shard()
+        counters[0] += 1
+        try:
+            validate(*args, **kwargs)
+        except ParameterValidationException as ex:
+            record_failure(ex)
+            for hook in _hooks:
+                hook(name, ex, None)
+            raise
+        for hook in _hooks:
+            hook(name, None, None)
+        return target(*args, **kwargs)
+    return counted_wrapper
+
+
+def enable_stats(timing: bool = False):
+    """
+    Enables telemetry for functions decorated from now on.
+
+    Parameters:
+    timing: True to also measure the cumulative validation time.
+    """
+    global _enabled, _timing
+    _enabled = True
+    _timing = timing
+
+
+def disable_stats():
+    """
+    Disables telemetry for functions decorated from now on.
+    """
+    global _enabled, _timing
+    _enabled = False
+    _timing = False
+
+
+def stats_settings() -> typing.Tuple[bool, bool]:
+    """
+    Returns the global (enabled, timing) telemetry settings.
+    """
+    return _enabled, _timing
+
+
+def stats(name: str = None) -> typing.Union[ValidationStats, typing.Dict[str, ValidationStats]]:
+    """
+    Returns the telemetry of instrumented functions.
+
+    Parameters:
+    name: Optional "module.qualname" of one function.
+
+    Returns:
+    ValidationStats for the named function, or a dictionary of all of them
+    keyed by "module.qualname".
+
+    Throws:
+    KeyError if the named function is not instrumented
+    """
+    with _registry_lock:
+        registry = dict(_registry)
+    if name is not None:
+        return registry[name].snapshot()
+    return {key: function_stats.snapshot() for key, function_stats in registry.items()}
+
+
+def reset_stats():
+    """
+    Zeroes the telemetry of all instrumented functions.
+    """
+    with _registry_lock:
+        registry = list(_registry.values())
+    for function_stats in registry:
+        function_stats.reset()
+
+
+def add_hook(hook: typing.Callable[[str, ParameterValidationException, int], None]):
+    """
+    Registers a callback invoked after every instrumented call.
+    """
+    global _hooks
+    with _registry_lock:
+        _hooks = _hooks + (hook,)
+
+
+def remove_hook(hook: typing.Callable[[str, ParameterValidationException, int], None]):
+    """
+    Unregisters a callback registered with add_hook().
+    """
+    global _hooks
+    with _registry_lock:
+        _hooks = tuple(registered for registered in _hooks if registered is not hook)
@@ -0,0 +1,132 @@
+"""
+(c) Microsoft. All rights reserved.
+
+The object ParameterValidator returns for a decorated function.
+
+A ValidatedFunction holds the validating wrapper built for a function, along
+with the schema and settings it was built from, and carries the metadata of
+the function: __wrapped__, __name__, __qualname__, __module__, __doc__ and
+its __dict__, so inspect.signature(), profilers and caches see the original
+function.
+
+    - It pickles by reference, like a function, when it can be found under
+      its module and qualified name, i.e. a decorated module level function
+      sent to a ProcessPoolExecutor. Otherwise it pickles the original
+      function, schema and settings, and the validating wrapper is rebuilt
+      on unpickling from the interned Schema and the cached checkers, once
+      per process for a function received many times.
+    - It is a functools.partial, whose call is implemented in C, so calling
+      it adds little over calling the wrapper itself.
+    - It does not bind as a method. Functions defined in a class body keep
+      plain function wrappers, with the same metadata, that pickle by
+      reference through their class. staticmethods and classmethods are
+      wrapped in ValidatedFunctions.
+    - Coroutine and async generator functions keep their async def wrappers,
+      with the same metadata, so inspect.iscoroutinefunction() and
+      isasyncgenfunction() recognize them on every Python version. They
+      pickle by reference only.
+
+A function defined in a class body whose first parameter is neither self nor
+cls may be a method or end up wrapped in staticmethod() by a later decorator.
+It is wrapped in a ValidatedMethod, which decides by binding: accessed through
+an instance or its class it is a method, called directly, which is what
+staticmethod() does, it has no receiver.
+"""
+import functools
+import sys
+import types
+import typing
+
+
+class ValidatedFunction(functools.partial):
+    """
+    A decorated function, calling the validating wrapper built for it.
+
+    Attributes:
+    schema : The Schema the function is validated against
+    receiver : True or False if the first argument is or is not self/cls,
+               None if it was decided from the function
+    settings : The settings of the decoration
+    """
+    __slots__ = ("_validator", "receiver", "settings")
+
+    def __new__(cls, wrapper: typing.Callable[..., object], func: typing.Callable[..., object], validator: object, receiver: typing.Optional[bool], settings: tuple):
+        self = super().__new__(cls, wrapper)
+        # The ParameterValidator, whose Schema is interned on first use
+        self._validator = validator
+        self.receiver = receiver
+        self.settings = settings
+        functools.update_wrapper(self, func)
+        return self
+
+    @property
+    def schema(self) -> object:
+        return self._validator.schema
+
+    def __reduce__(self):
+        if find_qualified(self.__module__, self.__qualname__) is self:
+            return self.__qualname__
+        return (_rebuild, (self.__wrapped__, self.schema, self.receiver, self.settings))
+
+    def __repr__(self):
+        return "<validated function {}.{}>".format(self.__module__, self.__qualname__)
+
+
+class ValidatedMethod(functools.partial):
+    """
+    A decorated function defined in a class body, calling the validating
+    wrapper built without a receiver, and binding as a method to the wrapper
+    built with one.
+
+    Attributes:
+    method : The validating wrapper skipping the receiver, a function
+             carrying the metadata of the original function
+    """
+    __slots__ = ("method",)
+
+    def __new__(cls, wrapper: typing.Callable[..., object], method: typing.Callable[..., object], func: typing.Callable[..., object]):
+        self = super().__new__(cls, wrapper)
+        self.method = functools.update_wrapper(method, func)
+        functools.update_wrapper(self, func)
+        return self
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            # Accessed through the class, the receiver is passed explicitly
+            return self.method
+        return types.MethodType(self.method, instance)
+
+    def __reduce__(self):
+        if find_qualified(self.__module__, self.__qualname__) is self:
+            return self.__qualname__
+        return super().__reduce__()
+
+    def __repr__(self):
+        return "<validated method {}.{}>".format(self.__module__, self.__qualname__)
+
+
+def find_qualified(module_name: str, qualname: str) -> object:
+    """
+    Returns the object named qualname in an imported module, or None.
+    """
+    found = sys.modules.get(module_name)
+    for name in qualname.split("."):
+        found = getattr(found, name, None)
+    return found
+
+
+def _rebuild(func: typing.Callable[..., object], schema: object, receiver: typing.Optional[bool], settings: tuple) -> ValidatedFunction:
+    try:
+        return _rebuild_cached(func, schema, receiver, settings)
+    except TypeError:
+        # Schemas with unhashable specs
+        return _build(func, schema, receiver, settings)
+
+
+def _build(func: typing.Callable[..., object], schema: object, receiver: typing.Optional[bool], settings: tuple) -> ValidatedFunction:
+    from paramvalidator.validator import ParameterValidator
+    return ParameterValidator(schema)._validated(func, receiver, settings)
+
+
+# A worker receiving the same function task after task rebuilds it once.
+_rebuild_cached = functools.lru_cache(maxsize=256)(_build)
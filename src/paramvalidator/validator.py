@@ -14,15 +14,139 @@ This class can be used with:
         - Methods with a set number of arguments
         - Methods that rely on kwargs for arguments.
 """
+import functools
+import sys
 import typing
-from paramvalidator.exceptions import (
-    ParameterNoneValidationException,
-    ParameterTypeValidationException,
-    ParameterKwargValidationException,
-    ParameterCountValidationException,
-    ParameterRangeValidationException,
-    ParameterValidationException
+from random import random as _random
+from paramvalidator.binding import Binding
+from paramvalidator.schema import Schema
+from paramvalidator.mode import (
+    ValidationMode,
+    get_global_mode,
+    set_global_mode,
+    get_lazy_compile,
+    set_lazy_compile,
+    get_validate_once,
+    set_validate_once,
+    get_check_order,
+    set_check_order,
+    parse_check_order
 )
+from paramvalidator.validated import ValidatedFunction, ValidatedMethod
+
+# The compiler, exceptions, telemetry, memo, batch, annotations, async and
+# context modules are imported when first used, decorating a function lazily
+# only needs the modules above. Validation tuples are interned, and the
+# checkers compiled, when the validating wrapper is built.
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from paramvalidator.batch import BatchValidationReport
+    from paramvalidator.exceptions import ParameterValidationException
+
+# co_flags bits of generator, coroutine and async generator functions
+_CO_GENERATOR = 0x20
+_CO_COROUTINE = 0x80
+_CO_ASYNC_GENERATOR = 0x200
+
+
+class _Settings(typing.NamedTuple):
+    """
+    The settings of one decoration, resolved from the ParameterValidator and
+    the global settings when the function is decorated. Wrappers only read
+    these, never the ParameterValidator, so later with_*() calls or global
+    changes, from any thread, do not affect functions already decorated.
+    """
+    mode: ValidationMode
+    stats: typing.Tuple[bool, bool]
+    once: typing.Tuple[bool, bool]
+    lazy: bool
+    collect_all: bool
+    memo: typing.Optional[int]
+    order: str = "declared"
+
+
+def _no_call(*args, **kwargs):
+    """
+    Target of validating wrappers that only validate, the call is made by the caller.
+    """
+
+
+def _sampled(validated: typing.Callable[..., object], func: typing.Callable[..., object], rate: float) -> typing.Callable[..., object]:
+    """
+    Returns a wrapper that calls validated for a random fraction, rate, of the
+    calls and func for the rest.
+    """
+    random = _random
+
+    def sampled_wrapper(*args, **kwargs):
+        if random() < rate:
+            return validated(*args, **kwargs)
+        return func(*args, **kwargs)
+    return sampled_wrapper
+
+
+def _deferred(build: typing.Callable[[], typing.Callable[..., object]]) -> typing.Callable[..., object]:
+    """
+    Returns a wrapper that builds the validating wrapper, with build, on its
+    first call and delegates to it from then on. Concurrent first calls may
+    build it more than once, every build is equivalent.
+    """
+    validated = None
+
+    def deferred_wrapper(*args, **kwargs):
+        nonlocal validated
+        if validated is None:
+            validated = build()
+        return validated(*args, **kwargs)
+    return deferred_wrapper
+
+
+def _stats_settings() -> typing.Tuple[bool, bool]:
+    """
+    Returns the global telemetry settings. Telemetry can only have been
+    enabled if its module was imported.
+    """
+    telemetry = sys.modules.get("paramvalidator.telemetry")
+    return telemetry.stats_settings() if telemetry is not None else (False, False)
+
+
+def _in_class(func: typing.Callable[..., object]) -> bool:
+    """
+    Returns True if a function is defined in a class body, per its __qualname__.
+    """
+    qualname_parts = func.__qualname__.split(".")
+    return len(qualname_parts) > 1 and qualname_parts[-2] != "<locals>"
+
+
+def _code_flags(func: typing.Callable[..., object]) -> int:
+    code = getattr(func, "__code__", None)
+    return code.co_flags if code is not None else 0
+
+
+def _checked(func: typing.Callable[..., object], check: typing.Callable[..., None]) -> typing.Callable[..., object]:
+    """
+    Returns a wrapper that runs check on the arguments and then calls func.
+    """
+    def checked_wrapper(*args, **kwargs):
+        check(*args, **kwargs)
+        return func(*args, **kwargs)
+    return checked_wrapper
+
+
+def _collecting(func: typing.Callable[..., object], check: typing.Callable[..., None], collect: typing.Callable[[tuple, dict], typing.List["ParameterValidationException"]]) -> typing.Callable[..., None]:
+    """
+    Returns a check that, when check fails, collects every failure of the
+    call and raises them together. Valid calls only pay for check.
+    """
+    from paramvalidator.exceptions import ParameterValidationException
+
+    def collecting_check(*args, **kwargs):
+        try:
+            check(*args, **kwargs)
+        except ParameterValidationException as ex:
+            from paramvalidator.exceptions import ParameterAggregateValidationException
+            failures = collect(args, kwargs) or [ex]
+            raise ParameterAggregateValidationException(func, failures) from None
+    return collecting_check
 
 
 class ParameterValidator:
@@ -55,24 +179,710 @@ class ParameterValidator:
         """
         Collect the parameters passed to this instance for future
         validation against the calling function.
+
+        The validation tuples can also be given as a single Schema.
         """
-        self.validation_args = args
-        self.validation_kwargs = kwargs
+        if len(args) == 1 and not kwargs and isinstance(args[0], Schema):
+            self._schema = args[0]
+        else:
+            # Interned when first needed, see schema
+            self._schema = None
+            self._validations = (args, kwargs)
+        self.mode = None
+        self.stats = None
+        self.collect_all = False
+        self.lazy_compile = None
+        self.memo = None
+        self.validate_once = None
+        self.check_order = None
+
+    @property
+    def schema(self) -> Schema:
+        """
+        The Schema of the validation tuples. Identical validation tuples, and
+        identical decorators, share one interned Spec and Schema. It is
+        interned on first use, when a wrapper is built, so decorating with
+        lazy compilation does not pay for it.
+        """
+        schema = self._schema
+        if schema is None:
+            # Threads racing here intern the same Schema
+            validations = self._validations
+            if callable(validations):
+                # Read from annotations, see from_annotations()
+                validations = validations()
+            args, kwargs = validations
+            schema = self._schema = Schema(*args, **kwargs)
+        return schema
+
+    @property
+    def validation_args(self) -> typing.Tuple[tuple, ...]:
+        """
+        The positional validation tuples, as interned Specs.
+        """
+        return self.schema.args
+
+    @property
+    def validation_kwargs(self) -> typing.Mapping[str, tuple]:
+        """
+        The kwargs validation tuples by name, as interned Specs.
+        """
+        return self.schema.kwargs
 
     def __call__(self, func):
         """
         Returns a wrapper to the function that when called it will validate
         the parameters for the given call.
 
-        This works with both standalone and class methods.
+        This works with standalone functions, methods, classmethods and
+        staticmethods. Whether the first argument is a receiver (self/cls)
+        that must not be validated is decided here, once, rather than on
+        every call. With lazy compilation that decision, and compiling the
+        checkers, is left to the first call of a synchronous function.
+
+        Parameters:
+        func: The calling function
+
+        Returns:
+        A ValidatedFunction, or for functions defined in a class body a
+        wrapper function, carrying the metadata of func.
+        """
+        mode = self.mode or get_global_mode()
+        if mode.name == "never" or (mode.name == "sample" and mode.rate == 0.0):
+            # Validation disabled, leave the function untouched.
+            return func
+
+        settings = _Settings(
+            mode,
+            self.stats if self.stats is not None else _stats_settings(),
+            self.validate_once if self.validate_once is not None else (get_validate_once(), False),
+            self.lazy_compile if self.lazy_compile is not None else get_lazy_compile(),
+            self.collect_all,
+            self.memo,
+            self.check_order or get_check_order())
+        if isinstance(func, staticmethod):
+            return staticmethod(self._validated(func.__func__, False, settings))
+        if isinstance(func, classmethod):
+            return classmethod(self._validated(func.__func__, True, settings))
+        return self._validated(func, None, settings)
+
+    def _validated(self, func: typing.Callable[..., object], has_receiver: typing.Optional[bool], settings: _Settings) -> typing.Callable[..., object]:
+        """
+        Wraps a function and gives the wrapper the metadata of the function.
+
+        Parameters:
+        func: The calling function
+        has_receiver: True or False, or None to decide from the function
+        settings: The settings of the decoration
+
+        Returns:
+        A ValidatedFunction, or the wrapper itself for coroutine and async
+        generator functions and for functions defined in a class body, which
+        must bind as methods, or a ValidatedMethod.
+        """
+        if has_receiver is None and _in_class(func):
+            binding = Binding(func, False)
+            if self._has_receiver(func) or not (binding.names or binding.var_positional):
+                return functools.update_wrapper(self._wrap(func, has_receiver, settings), func)
+            # Neither self nor cls, decided by binding, see ValidatedMethod
+            return ValidatedMethod(self._wrap(func, False, settings), self._wrap(func, True, settings), func)
+        if _code_flags(func) & (_CO_COROUTINE | _CO_ASYNC_GENERATOR):
+            # Before Python 3.8 inspect.iscoroutinefunction() and
+            # isasyncgenfunction() do not look through partials.
+            return functools.update_wrapper(self._wrap(func, has_receiver, settings), func)
+        return ValidatedFunction(self._wrap(func, has_receiver, settings), func, self, has_receiver, settings)
+
+    def _wrap(self, func: typing.Callable[..., object], has_receiver: typing.Optional[bool], settings: _Settings) -> typing.Callable[..., object]:
+        """
+        Builds the wrapper for a function now, or on its first call if lazy.
+        Async functions are always built now, their wrapper must itself be a
+        coroutine or async generator function.
+
+        Parameters:
+        func: The calling function
+        has_receiver: True or False, or None to decide from the function
+        settings: The settings of the decoration
+
+        Returns:
+        wrapper function that will be called when the subscribed function
+        is called.
+        """
+        def build():
+            receiver = self._has_receiver(func) if has_receiver is None else has_receiver
+            return self._build_wrapper(func, receiver, settings)
+
+        if settings.lazy and not _code_flags(func) & (_CO_COROUTINE | _CO_ASYNC_GENERATOR):
+            return _deferred(build)
+        return build()
+
+    @classmethod
+    def from_annotations(cls, func: typing.Callable[..., object]) -> typing.Callable[..., object]:
+        """
+        Decorator that builds the validation tuples from the typing annotations
+        of the function, instead of repeating them in ParameterValidator(...).
+
+        i.e.
+            @ParameterValidator.from_annotations
+            def myfunc(num: Annotated[int, (0, 10)], names: Optional[List[str]]):
+
+        is the same as
+            @ParameterValidator((int, False, (0, 10)), (list, True, Items((str, False))))
+            def myfunc(num, names):
+
+        Unannotated parameters accept anything. The annotations are read on
+        the first call of a synchronous function, so they may name classes
+        defined after it, i.e. its own class. See paramvalidator.annotations
+        for the supported annotations.
+
+        Parameters:
+        func: The function, method, classmethod or staticmethod to decorate
+
+        Returns:
+        The validating wrapper.
+        """
+        target = func.__func__ if isinstance(func, (staticmethod, classmethod)) else func
+        if isinstance(func, classmethod):
+            skip_receiver = True
+        elif isinstance(func, staticmethod):
+            skip_receiver = False
+        else:
+            qualname_parts = target.__qualname__.split(".")
+            code = target.__code__
+            skip_receiver = (len(qualname_parts) > 1 and qualname_parts[-2] != "<locals>"
+                             and code.co_argcount > 0 and code.co_varnames[0] in ("self", "cls"))
+
+        from paramvalidator.annotations import function_validations
+        validator = cls().with_lazy_compile()
+        validator._validations = functools.partial(function_validations, target, skip_receiver)
+        return validator(func)
+
+    def with_mode(self, mode: typing.Union[str, ValidationMode]) -> "ParameterValidator":
+        """
+        Sets the validation mode for the functions this instance decorates,
+        overriding the global mode.
+
+        i.e. sampled = ParameterValidator((int, False)).with_mode("sample(0.1)")
+             @sampled
+             def hot_path(num):
+
+        Parameters:
+        mode: "always", "never", "sample(rate)" or a ValidationMode
+
+        Returns:
+        This instance
+        """
+        self.mode = ValidationMode.parse(mode)
+        return self
+
+    def with_stats(self, enabled: bool = True, timing: bool = False) -> "ParameterValidator":
+        """
+        Enables or disables telemetry for the functions this instance decorates,
+        overriding the global setting. See paramvalidator.telemetry.
+
+        Parameters:
+        enabled: True to record call and failure counts
+        timing: True to also record the cumulative validation time
+
+        Returns:
+        This instance
+        """
+        self.stats = (enabled, enabled and timing)
+        return self
+
+    def with_collect_all(self, enabled: bool = True) -> "ParameterValidator":
+        """
+        Validates every parameter of a failing call rather than stopping at the
+        first failure. All failures are raised together in a single
+        ParameterAggregateValidationException, whose to_json() is suited to
+        error responses.
+
+        Parameters:
+        enabled: True to collect all failures
+
+        Returns:
+        This instance
+        """
+        self.collect_all = enabled
+        return self
+
+    def with_validate_once(self, enabled: bool = True, strict: bool = False) -> "ParameterValidator":
+        """
+        Skips validating the functions this instance decorates when they are
+        called from within another validated call, i.e. by a validated public
+        function passing on its arguments or by recursion, overriding the
+        global setting. See paramvalidator.context.
+
+        Parameters:
+        enabled: True to skip validation within a validated call
+        strict: True to validate within a validated call too, while still
+                marking the calls made by the decorated function
+
+        Returns:
+        This instance
+        """
+        self.validate_once = (enabled or strict, strict)
+        return self
+
+    def with_lazy_compile(self, enabled: bool = True) -> "ParameterValidator":
+        """
+        Defers analysing the signature and compiling the checkers of the
+        synchronous functions this instance decorates to their first call,
+        overriding the global setting.
+
+        Parameters:
+        enabled: True to compile on first call, False to compile when decorating
+
+        Returns:
+        This instance
+        """
+        self.lazy_compile = enabled
+        return self
+
+    def with_memo(self, maxsize: int = 256) -> "ParameterValidator":
+        """
+        Remembers the immutable values, i.e. tuples of ints and strings, that
+        passed the range or membership checks of the elements, see Items, of
+        each parameter, so that calls repeating them skip those checks. See
+        paramvalidator.memo.
+
+        Parameters:
+        maxsize: Maximum number of values cached per parameter, 0 to disable
+
+        Returns:
+        This instance
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must not be negative, got {}".format(maxsize))
+        self.memo = maxsize or None
+        return self
+
+    def with_check_order(self, order: str = "cost") -> "ParameterValidator":
+        """
+        Orders the checks of the functions this instance decorates, overriding
+        the global setting, see paramvalidator.planner.
+
+        Parameters:
+        order: declared, or cost for cheapest first
+
+        Returns:
+        This instance
+
+        Throws:
+        ValueError if order is unknown
+        """
+        self.check_order = parse_check_order(order)
+        return self
+
+    @staticmethod
+    def set_mode(mode: typing.Union[str, ValidationMode]) -> ValidationMode:
+        """
+        Sets the global validation mode used when decorating functions whose
+        ParameterValidator was not given a mode. The initial global mode is
+        read from the PARAMVALIDATOR_MODE environment variable.
+
+        Parameters:
+        mode: "always", "never", "sample(rate)" or a ValidationMode
+
+        Returns:
+        The previous global mode
+        """
+        return set_global_mode(mode)
+
+    @staticmethod
+    def get_mode() -> ValidationMode:
+        """
+        Returns the global validation mode.
+        """
+        return get_global_mode()
+
+    @staticmethod
+    def set_lazy_compile(enabled: bool) -> bool:
+        """
+        Sets whether functions decorated from now on, by a ParameterValidator
+        not given with_lazy_compile(), compile on their first call. The initial
+        setting is read from the PARAMVALIDATOR_LAZY_COMPILE environment
+        variable.
+
+        Parameters:
+        enabled: True to compile on first call, False to compile when decorating
+
+        Returns:
+        The previous setting
+        """
+        return set_lazy_compile(enabled)
+
+    @staticmethod
+    def get_lazy_compile() -> bool:
+        """
+        Returns the global lazy compilation setting.
+        """
+        return get_lazy_compile()
+
+    @staticmethod
+    def set_validate_once(enabled: bool) -> bool:
+        """
+        Sets whether functions decorated from now on, by a ParameterValidator
+        not given with_validate_once(), skip validation within another
+        validated call. The initial setting is read from the
+        PARAMVALIDATOR_VALIDATE_ONCE environment variable.
+
+        Parameters:
+        enabled: True to validate once
+
+        Returns:
+        The previous setting
+        """
+        return set_validate_once(enabled)
+
+    @staticmethod
+    def get_validate_once() -> bool:
+        """
+        Returns the global validate once setting.
+        """
+        return get_validate_once()
+
+    @staticmethod
+    def set_check_order(order: str) -> str:
+        """
+        Sets the check order of functions decorated from now on by a
+        ParameterValidator not given with_check_order(). The initial setting
+        is read from the PARAMVALIDATOR_CHECK_ORDER environment variable.
+
+        Parameters:
+        order: declared or cost
+
+        Returns:
+        The previous setting
+
+        Throws:
+        ValueError if order is unknown
+        """
+        return set_check_order(order)
+
+    @staticmethod
+    def get_check_order() -> str:
+        """
+        Returns the global check order.
+        """
+        return get_check_order()
+
+    def validate_many(self, rows: typing.Iterable[object], func: typing.Callable[..., None] = None) -> "BatchValidationReport":
+        """
+        Validates many argument sets in one pass without raising.
+
+        Parameters:
+        rows: Iterable of argument tuples, validated against the positional
+              validation tuples, or kwargs dictionaries, validated against the
+              kwargs validation tuples.
+        func: Optional function to name in the collected exceptions.
+
+        Returns:
+        BatchValidationReport holding the first failure of each failing row.
+        """
+        from paramvalidator.batch import validate_rows
+        return validate_rows(self.validation_args, self.validation_kwargs, rows, func)
+
+    def validate_columns(self, columns: typing.Union[typing.Sequence[typing.Sequence[object]], typing.Dict[str, typing.Sequence[object]]], func: typing.Callable[..., None] = None) -> "BatchValidationReport":
+        """
+        Validates many argument sets given as columns in one pass without raising.
+        Numeric NumPy columns are checked with vectorized comparisons.
+
+        Parameters:
+        columns: Sequence of columns, one per positional validation tuple, or
+                 dictionary of columns keyed by kwarg name.
+        func: Optional function to name in the collected exceptions.
+
+        Returns:
+        BatchValidationReport holding the first failure of each failing row.
+        """
+        from paramvalidator.batch import validate_columns
+        return validate_columns(self.validation_args, self.validation_kwargs, columns, func)
+
+    def validate_stream(self, records: typing.Iterable[object], only_valid: bool = False, chunk_size: int = 1000, processes: int = None, chunked: bool = False) -> typing.Iterator[object]:
+        """
+        Lazily validates a stream of payload dicts, i.e. JSON lines or message
+        queue payloads, against the kwargs validation tuples, without calling
+        a function. Memory use does not grow with the length of the stream.
+        See paramvalidator.stream.
+
+        Parameters:
+        records: Iterable or generator of dicts
+        only_valid: True to yield only the valid records
+        chunk_size: Number of records pulled from the stream at a time
+        processes: Number of worker processes, None to validate in this process
+        chunked: True to yield a list of results per chunk
+
+        Returns:
+        Iterator of (record, errors) pairs in stream order, errors listing
+        every failure of the record, or of the valid records if only_valid.
+        """
+        from paramvalidator.stream import validate_records
+        return validate_records(self.schema, records, only_valid, chunk_size, processes, chunked)
+
+    def _has_receiver(self, func: typing.Callable[..., None]) -> bool:
+        """
+        Determines whether a plain function is a method whose first parameter
+        is the receiver (self or cls).
+
+        A function is treated as a method when it is defined in a class body,
+        per its __qualname__, and its first parameter is called self or cls.
+        The parameters are those of the signature, which follows __wrapped__
+        through functools.wraps decorators. Other functions defined in a class
+        body are decided by binding, see ValidatedMethod.
+
+        Parameters:
+        func: The calling function
+
+        Returns:
+        True if the first positional argument should not be validated.
+        """
+        if not _in_class(func):
+            return False
+        names = Binding(func, False).names
+        return bool(names) and names[0] in ("self", "cls")
+
+    def _build_wrapper(self, func: typing.Callable[..., None], has_receiver: bool, settings: _Settings) -> typing.Callable[..., object]:
+        """
+        Builds the wrapper for a function according to the validation mode.
+
+        Parameters:
+        func: The calling function
+        has_receiver: True if the first argument is self/cls and is not validated.
+        settings: The settings of the decoration, mode always or sample
+
+        Returns:
+        wrapper function that will be called when the subscribed function
+        is called.
+        """
+        mode = settings.mode
+        stats_enabled, timing = settings.stats
+        once_enabled, strict = settings.once
+        collect_all = settings.collect_all
+        sample_rate = mode.rate if mode.name == "sample" and mode.rate < 1.0 else None
+        flags = _code_flags(func)
+        is_async = bool(flags & (_CO_COROUTINE | _CO_ASYNC_GENERATOR))
+        if stats_enabled:
+            from paramvalidator.telemetry import instrument
+
+        if not (is_async or stats_enabled or collect_all or once_enabled):
+            validated = self._build_validating_wrapper(func, has_receiver, memo=settings.memo, order=settings.order)
+            if sample_rate is None:
+                return validated
+            return _sampled(validated, func, sample_rate)
+
+        # Build a check that only validates, then layer the optional behavior
+        # around it.
+        check = self._build_validating_wrapper(func, has_receiver, _no_call, settings.memo, settings.order)
+        if collect_all:
+            check = _collecting(func, check, self._build_collector(func, has_receiver))
+        if is_async:
+            # Validation stays synchronous, the async wrapper runs it before
+            # awaiting (or iterating) the original function.
+            if stats_enabled:
+                check = instrument(func, check, timing, _no_call)
+            if sample_rate is not None:
+                check = _sampled(check, _no_call, sample_rate)
+            from paramvalidator.asyncwrappers import wrap_coroutine_function, wrap_async_generator_function
+            if flags & _CO_ASYNC_GENERATOR:
+                if once_enabled:
+                    from paramvalidator.context import skip_within_validated_call
+                    check = skip_within_validated_call(check, strict)
+                return wrap_async_generator_function(func, check)
+            if once_enabled:
+                from paramvalidator.context import validate_once_coroutine
+                return validate_once_coroutine(func, check, strict)
+            return wrap_coroutine_function(func, check)
+
+        if once_enabled:
+            # Calls skipped within a validated call are neither validated nor
+            # counted, the check carries the telemetry and sampling.
+            from paramvalidator.context import validate_once, skip_within_validated_call
+            if stats_enabled:
+                check = instrument(func, check, timing, _no_call)
+            if sample_rate is not None:
+                check = _sampled(check, _no_call, sample_rate)
+            if flags & _CO_GENERATOR:
+                return _checked(func, skip_within_validated_call(check, strict))
+            return validate_once(func, check, strict)
+
+        if stats_enabled:
+            validated = instrument(func, check, timing)
+        else:
+            validated = _checked(func, check)
+        if sample_rate is None:
+            return validated
+        return _sampled(validated, func, sample_rate)
+
+    def _build_collector(self, func: typing.Callable[..., None], has_receiver: bool) -> typing.Callable[[tuple, dict], typing.List["ParameterValidationException"]]:
+        """
+        Builds the function used in collect all mode to find every failure of
+        a call. It is only run once a call has failed validation.
+
+        Parameters:
+        func: The calling function
+        has_receiver: True if the first argument is self/cls and is not validated.
+
+        Returns:
+        Function taking (args, kwargs) of a call, returning its list of failures
+        in parameter order.
+        """
+        from paramvalidator.exceptions import (
+            ParameterValidationException,
+            ParameterCountValidationException,
+            ParameterKwargValidationException
+        )
+        binding = Binding(func, has_receiver)
+        arg_checks = self.schema.compiled_args()
+        kwarg_checks = self.schema.compiled_kwargs()
+        names = binding.names
+        positional_count = len(names)
+        offset = binding.receiver_offset
+
+        def collect(args, kwargs):
+            failures = []
+
+            def attempt(check, param_index, argument):
+                try:
+                    check(func, param_index, argument)
+                except ParameterValidationException as ex:
+                    failures.append(ex)
+
+            args = args[offset:]
+            count = len(args)
+            if count > positional_count and not binding.var_positional:
+                failures.append(ParameterCountValidationException(func, count + offset))
+            for (argument, (param_index, check)) in zip(args, arg_checks):
+                attempt(check, param_index, argument)
+
+            supplied = count
+            missing = False
+            for slot in range(count, positional_count):
+                name = names[slot]
+                if name in kwargs:
+                    supplied += 1
+                    if slot < len(arg_checks):
+                        param_index, check = arg_checks[slot]
+                        attempt(check, param_index, kwargs[name])
+                elif not binding.has_default[slot]:
+                    missing = True
+            if missing:
+                failures.append(ParameterCountValidationException(func, supplied + offset))
+
+            for (name, param_index, allow_missing, check) in kwarg_checks:
+                slot = binding.slot_of(name)
+                if slot is not None and slot < count:
+                    attempt(check, param_index, args[slot])
+                elif name in kwargs:
+                    attempt(check, param_index, kwargs[name])
+                elif not (allow_missing or (slot is not None and binding.has_default[slot])):
+                    failures.append(ParameterKwargValidationException(func, name))
+            return failures
+        return collect
+
+    def _build_validating_wrapper(self, func: typing.Callable[..., None], has_receiver: bool, target: typing.Callable[..., object] = None, memo: typing.Optional[int] = None, order: str = "declared") -> typing.Callable[..., object]:
+        """
+        Builds the validating wrapper for a function.
 
         Parameters:
         func: The calling function
+        has_receiver: True if the first argument is self/cls and is not validated.
+        target: Function called with the arguments once validated, defaults to func.
+        memo: Memo cache size per parameter, None to not memoize.
+        order: Check order, declared or cost, see paramvalidator.planner.
 
         Returns:
         wrapper function that will be called when the subscribed function
         is called.
         """
+        from paramvalidator.exceptions import ParameterCountValidationException, ParameterKwargValidationException
+        # Interpret the validation tuples and the signature once, here, rather
+        # than on every call.
+        binding = Binding(func, has_receiver)
+        if memo is None:
+            arg_checks = self.schema.compiled_args()
+            compiled_kwargs = self.schema.compiled_kwargs()
+        else:
+            from paramvalidator.memo import memoize_checks
+            arg_checks, compiled_kwargs = memoize_checks(func, self.schema, memo)
+        names = binding.names
+        has_default = binding.has_default
+        positional_count = len(names)
+        var_positional = binding.var_positional
+        offset = binding.receiver_offset
+        if target is None:
+            target = func
+
+        # kwargs validation tuples naming a positional parameter are checked
+        # against that parameter however it is passed.
+        kwarg_checks = []
+        slot_kwarg_checks = []
+        for (name, param_index, allow_missing, check) in compiled_kwargs:
+            slot = binding.slot_of(name)
+            if slot is None:
+                kwarg_checks.append((name, param_index, allow_missing, check))
+            else:
+                slot_kwarg_checks.append((name, slot, param_index, allow_missing or has_default[slot], check))
+        exact_fast_path = not slot_kwarg_checks
+
+        def validate_bound(args, kwargs):
+            """
+            Validates positional arguments that do not line up one to one with
+            the positional parameters: omitted defaults, positional parameters
+            passed by keyword and *args.
+            """
+            count = len(args)
+            if count > positional_count and not var_positional:
+                raise ParameterCountValidationException(func, count + offset)
+            for (argument, (param_index, check)) in zip(args, arg_checks):
+                check(func, param_index, argument)
+            for slot in range(count, positional_count):
+                name = names[slot]
+                if name in kwargs:
+                    if slot < len(arg_checks):
+                        param_index, check = arg_checks[slot]
+                        check(func, param_index, kwargs[name])
+                elif not has_default[slot]:
+                    supplied = count + sum(1 for later in names[count:] if later in kwargs)
+                    raise ParameterCountValidationException(func, supplied + offset)
+            for (name, slot, param_index, allow_missing, check) in slot_kwarg_checks:
+                if slot < count:
+                    check(func, param_index, args[slot])
+                elif name in kwargs:
+                    check(func, param_index, kwargs[name])
+                elif not allow_missing:
+                    raise ParameterKwargValidationException(func, name)
+
+        if has_receiver:
+            def method_wrapper(receiver, *args, **kwargs):
+                """
+                Validates the parameters of a method call, skipping the receiver.
+
+                Parameters:
+                receiver: The instance or class the method is bound to
+                args: The list of arguments passed to the method
+                kwargs: The dictionary of arguments passed into the method
+
+                Returns:
+                Whatever the original function returns.
+
+                Throws:
+                ParameterValidationException if there is an issue
+                """
+                if len(args) == positional_count and exact_fast_path:
+                    for (argument, (param_index, check)) in zip(args, arg_checks):
+                        check(func, param_index, argument)
+                else:
+                    validate_bound(args, kwargs)
+
+                for (name, param_index, allow_missing, check) in kwarg_checks:
+                    if name in kwargs:
+                        check(func, param_index, kwargs[name])
+                    elif not allow_missing:
+                        raise ParameterKwargValidationException(func, name)
+
+                return target(receiver, *args, **kwargs)
+            return self._plan(method_wrapper, func, has_receiver, target, binding, arg_checks, kwarg_checks if exact_fast_path else None, order)
+
         def wrapper(*args, **kwargs):
             """
             Wraps an existing function and validates the parameters passed in meet
@@ -86,36 +896,72 @@ class ParameterValidator:
             Whatever the original function returns.
 
             Throws:
-            ParameterTypeValidationException if there is an issue
+            ParameterValidationException if there is an issue
             """
-            args_to_validate = args
-            if len(args) and func.__qualname__.startswith(args[0].__class__.__name__):
-                # This is a class method and we do NOT want to validate self.
-                args_to_validate = args[1:]
-
-            if len(args_to_validate) and (len(args) != func.__code__.co_argcount):
-                raise ParameterCountValidationException(func, len(args))
-
-            # We may have args and kwargs so track if we are checking kwargs
-            validate_kwargs = False
-            if len(args_to_validate):
-                validate_kwargs = len(self.validation_kwargs) > 0
-                self._validate_args_arguments(func, args_to_validate, self.validation_args)
-            elif len(self.validation_kwargs):
-                validate_kwargs = True
+            if len(args) == positional_count and exact_fast_path:
+                for (argument, (param_index, check)) in zip(args, arg_checks):
+                    check(func, param_index, argument)
             else:
-                raise ParameterCountValidationException(func, 0)
+                validate_bound(args, kwargs)
+
+            # Required kwargs must be validated even if no kwargs were passed.
+            for (name, param_index, allow_missing, check) in kwarg_checks:
+                if name in kwargs:
+                    check(func, param_index, kwargs[name])
+                elif not allow_missing:
+                    raise ParameterKwargValidationException(func, name)
+
+            return target(*args, **kwargs)
+        return self._plan(wrapper, func, has_receiver, target, binding, arg_checks, kwarg_checks if exact_fast_path else None, order)
+
+    def _plan(self, declared: typing.Callable[..., object], func: typing.Callable[..., None], has_receiver: bool, target: typing.Callable[..., object], binding: Binding, arg_checks: typing.Sequence[tuple], kwarg_checks: typing.Sequence[tuple], order: str) -> typing.Callable[..., object]:
+        """
+        Returns the declared order wrapper, or a wrapper validating calls that
+        match the positional parameters exactly with checks planned in cost
+        order, see paramvalidator.planner. Other calls are passed on to the
+        declared order wrapper.
+
+        Parameters:
+        declared: The declared order validating wrapper
+        func: The calling function
+        has_receiver: True if the first argument is self/cls and is not validated.
+        target: Function called with the arguments once validated.
+        binding: The Binding of func
+        arg_checks: (param_index, checker) of the positional specs
+        kwarg_checks: (name, param_index, allow_missing, checker) of the kwargs
+                      specs not naming a positional parameter, None if some do
+        order: Check order, declared or cost
+
+        Returns:
+        wrapper function that will be called when the subscribed function
+        is called.
+        """
+        if order == "declared" or kwarg_checks is None:
+            return declared
+        from paramvalidator.planner import planned_validator
+
+        positional_count = len(binding.names)
+        specs = self.schema.args
+        kwarg_specs = self.schema.kwargs
+        validate = planned_validator(
+            func,
+            [(slot, param_index, check, specs[slot]) for slot, (param_index, check) in enumerate(arg_checks[:positional_count])],
+            [(name, param_index, allow_missing, check, kwarg_specs[name]) for (name, param_index, allow_missing, check) in kwarg_checks])
 
-            # Check kwargs?
-            if validate_kwargs: 
-                # If no kwargs passed we still have to validate because there may
-                # be required kwargs parameters.
-                if not kwargs:
-                    kwargs = {}
-                self._validate_kwargs_arguments(func, kwargs, self.validation_kwargs)
+        if has_receiver:
+            def planned_method_wrapper(receiver, *args, **kwargs):
+                if len(args) != positional_count:
+                    return declared(receiver, *args, **kwargs)
+                validate(args, kwargs)
+                return target(receiver, *args, **kwargs)
+            return planned_method_wrapper
 
-            return func(*args, **kwargs)
-        return wrapper
+        def planned_wrapper(*args, **kwargs):
+            if len(args) != positional_count:
+                return declared(*args, **kwargs)
+            validate(args, kwargs)
+            return target(*args, **kwargs)
+        return planned_wrapper
 
     def _validate_args_arguments(self, func: typing.Callable[..., None], call_arguments: typing.List[object], validation_args: typing.List[tuple]):
         """
@@ -153,6 +999,7 @@ class ParameterValidator:
         Throws:
         ParameterTypeValidationException if there is an issue
         """
+        from paramvalidator.exceptions import ParameterKwargValidationException
         param_index = 1
         for expected_arg in validation_args.keys():
             # Overload the boolean in the validation, if it's True and not present
@@ -191,6 +1038,12 @@ class ParameterValidator:
         ParameterTypeValidationException if arg type does not match validation
         ParameterRangeValidationException if numeric type is out of range
         """
+        from paramvalidator.exceptions import (
+            ParameterNoneValidationException,
+            ParameterTypeValidationException,
+            ParameterRangeValidationException
+        )
+        from paramvalidator.compiler import get_checker
         if not validation[1] and (argument is None):
             # Not allowed None but is
             raise ParameterNoneValidationException(func, param_index)
@@ -200,6 +1053,9 @@ class ParameterValidator:
         elif not isinstance(argument, validation[0]):
             # Not none and have value, types to not match.
             raise ParameterTypeValidationException(func, param_index, type(argument), validation[0])
+        elif len(validation) == 3 and not isinstance(validation[2], tuple):
+            # Items, Constraints, membership and patterns, compiled once
+            get_checker(validation)(func, param_index, argument)
         elif len(validation) == 3 and isinstance(validation[2], tuple):
             if isinstance(argument,int) or isinstance(argument, float):
                 if argument < validation[2][0] or argument > validation[2][1]:
@@ -0,0 +1,151 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests building validation tuples from typing annotations."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+
+import typing
+import pytest
+from paramvalidator import ParameterValidator, Items
+from paramvalidator.annotations import annotation_to_validation
+from paramvalidator.compiler import get_checker
+from paramvalidator.exceptions import (
+    ParameterNoneValidationException,
+    ParameterTypeValidationException,
+    ParameterKwargValidationException,
+    ParameterRangeValidationException
+)
+
+
+def test_annotation_to_validation():
+    assert annotation_to_validation(int) == (int, False)
+    assert annotation_to_validation(typing.Optional[str]) == (str, True)
+    assert annotation_to_validation(typing.Union[int, float, None]) == ((int, float), True)
+    assert annotation_to_validation(typing.Any) == (object, True)
+    assert annotation_to_validation(typing.List[object]) == (list, False, Items((object, True)))
+    assert annotation_to_validation(typing.List[int]) == (list, False, Items((int, False)))
+    assert annotation_to_validation(typing.Tuple[int, ...]) == (tuple, False, Items((int, False)))
+    assert annotation_to_validation(typing.Tuple[int, str]) == (tuple, False)
+    assert annotation_to_validation(typing.Dict[str, typing.List[int]]) == (
+        dict, False, Items((list, False, Items((int, False))), keys=(str, False)))
+    assert annotation_to_validation(typing.Sequence[int]) == (typing.Sequence.__origin__, False)
+
+
+def test_literal_and_annotated_to_validation():
+    if not hasattr(typing, "Annotated"):
+        pytest.skip("typing.Annotated requires Python 3.9")
+    assert annotation_to_validation(typing.Literal["a", "b", None]) == ((str,), True, frozenset({"a", "b"}))
+    assert annotation_to_validation(typing.Annotated[int, (0, 10)]) == (int, False, (0, 10))
+    assert annotation_to_validation(typing.Optional[typing.Annotated[float, (0.0, 1.0)]]) == (float, True, (0.0, 1.0))
+
+
+def test_checkers_are_shared():
+    validation = annotation_to_validation(typing.Dict[str, typing.List[int]])
+    assert get_checker(validation) is get_checker(annotation_to_validation(typing.Dict[str, typing.List[int]]))
+    assert get_checker((int, False, (0, 1))) is not get_checker((int, False, (0.0, 1.0)))
+
+
+class Annotated:
+    @ParameterValidator.from_annotations
+    def method(self, num: int, names: typing.List[object]):
+        return num
+
+    @classmethod
+    @ParameterValidator.from_annotations
+    def create(cls, name: str):
+        return name
+
+    @ParameterValidator.from_annotations
+    @staticmethod
+    def static(num: float):
+        return num
+
+
+def test_from_annotations():
+    if not hasattr(typing, "Annotated"):
+        pytest.skip("typing.Annotated requires Python 3.9")
+
+    @ParameterValidator.from_annotations
+    def standalone(num: typing.Annotated[int, (0, 10)], mode: typing.Literal["fast", "slow"],
+                   names: typing.Optional[typing.List[str]], untyped, *, flag: bool, limit: int = 5):
+        return num
+
+    assert standalone(3, "fast", None, object(), flag=True) == 3
+    assert standalone(3, "slow", ["a"], None, flag=False, limit=2) == 3
+
+    with pytest.raises(ParameterRangeValidationException):
+        standalone(30, "fast", None, None, flag=True)
+    with pytest.raises(ParameterRangeValidationException):
+        standalone(3, "medium", None, None, flag=True)
+    with pytest.raises(ParameterTypeValidationException):
+        standalone(3, "fast", [1], None, flag=True)
+    with pytest.raises(ParameterKwargValidationException):
+        standalone(3, "fast", None, None)
+    with pytest.raises(ParameterTypeValidationException):
+        standalone(3, "fast", None, None, flag=True, limit="5")
+
+
+def test_from_annotations_methods():
+    instance = Annotated()
+    assert instance.method(1, []) == 1
+    assert Annotated.create("a") == "a"
+    assert Annotated.static(1.5) == 1.5
+    with pytest.raises(ParameterNoneValidationException):
+        instance.method(None, [])
+    with pytest.raises(ParameterTypeValidationException):
+        Annotated.create(1)
+    with pytest.raises(ParameterTypeValidationException):
+        Annotated.static("1.5")
+
+
+class Node:
+    @ParameterValidator.from_annotations
+    def link(self, other: "Node", weight: "float" = 1.0):
+        return other
+
+    @ParameterValidator.from_annotations
+    def missing(self, other: "Undefined", count: int):
+        return other
+
+
+def test_from_annotations_forward_references():
+    node = Node()
+    assert node.link(Node()) is not None
+    with pytest.raises(ParameterTypeValidationException):
+        node.link("node")
+    with pytest.raises(ParameterTypeValidationException):
+        node.link(Node(), "1.0")
+    # Names still undefined on the first call accept anything
+    assert node.missing("anything", 1) == "anything"
+    with pytest.raises(ParameterTypeValidationException):
+        node.missing("anything", "1")
+
+
+def test_from_annotations_postponed_evaluation():
+    namespace = {"ParameterValidator": ParameterValidator}
+    exec("from __future__ import annotations\n"
+         "class Tree:\n"
+         "    @ParameterValidator.from_annotations\n"
+         "    def add(self, child: Tree, depth: int):\n"
+         "        return depth\n", namespace)
+    tree = namespace["Tree"]()
+    assert tree.add(namespace["Tree"](), 2) == 2
+    with pytest.raises(ParameterTypeValidationException):
+        tree.add("tree", 2)
+    with pytest.raises(ParameterTypeValidationException):
+        tree.add(namespace["Tree"](), "2")
@@ -0,0 +1,101 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests ParameterValidator on coroutine functions and async generators."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+
+import asyncio
+import inspect
+import pytest
+import paramvalidator
+from paramvalidator import ParameterValidator, ParameterValidationException
+from paramvalidator.exceptions import (
+    ParameterTypeValidationException,
+    ParameterRangeValidationException
+)
+
+
+@ParameterValidator((int, False, (0, 10)))
+async def fetch(num):
+    await asyncio.sleep(0)
+    return num * 2
+
+
+@ParameterValidator((int, False))
+async def count_up(limit):
+    total = 0
+    for num in range(limit):
+        received = yield num
+        if received is not None:
+            total += received
+
+
+class Handler:
+    @ParameterValidator((str, False))
+    async def handle(self, name):
+        return name.upper()
+
+
+def test_coroutine_function():
+    assert inspect.iscoroutinefunction(fetch)
+    assert asyncio.run(fetch(3)) == 6
+    assert asyncio.run(Handler().handle("a")) == "A"
+
+    with pytest.raises(ParameterRangeValidationException):
+        asyncio.run(fetch(30))
+    with pytest.raises(ParameterTypeValidationException):
+        asyncio.run(Handler().handle(1))
+
+
+def test_async_generator_function():
+    assert inspect.isasyncgenfunction(count_up)
+
+    async def consume():
+        return [num async for num in count_up(3)]
+
+    async def send():
+        generator = count_up(5)
+        first = await generator.__anext__()
+        second = await generator.asend(10)
+        await generator.aclose()
+        return first, second
+
+    assert asyncio.run(consume()) == [0, 1, 2]
+    assert asyncio.run(send()) == (0, 1)
+    with pytest.raises(ParameterTypeValidationException):
+        asyncio.run(consume_bad())
+
+
+async def consume_bad():
+    async for _ in count_up("3"):
+        pass
+
+
+def test_async_modes_and_stats():
+    async def plain(num):
+        return num
+
+    assert ParameterValidator((int, False)).with_mode("never")(plain) is plain
+
+    wrapped = ParameterValidator((int, False)).with_stats()(plain)
+    assert inspect.iscoroutinefunction(wrapped)
+    assert asyncio.run(wrapped(1)) == 1
+    with pytest.raises(ParameterValidationException):
+        asyncio.run(wrapped("1"))
+    result = paramvalidator.stats(__name__ + ".test_async_modes_and_stats.<locals>.plain")
+    assert result.calls == 2
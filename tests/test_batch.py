@@ -0,0 +1,92 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests batch validation of many argument sets."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+
+import pytest
+from paramvalidator import ParameterValidator, BatchValidationReport
+from paramvalidator.exceptions import (
+    ParameterNoneValidationException,
+    ParameterTypeValidationException,
+    ParameterKwargValidationException,
+    ParameterCountValidationException,
+    ParameterRangeValidationException
+)
+
+
+def test_validate_many_rows():
+    validator = ParameterValidator((int, False, (0, 10)), (str, True))
+    rows = [(1, "a"), (None, "b"), (5, None), (11, "c"), (2, 3), (1,)]
+
+    report = validator.validate_many(rows)
+    assert isinstance(report, BatchValidationReport)
+    assert report.count == 6
+    assert not report.valid
+    assert report.failed_indices == [1, 3, 4, 5]
+    assert isinstance(report.failures[1], ParameterNoneValidationException)
+    assert isinstance(report.failures[3], ParameterRangeValidationException)
+    assert isinstance(report.failures[4], ParameterTypeValidationException)
+    assert isinstance(report.failures[5], ParameterCountValidationException)
+    assert "Expected 2 args" in str(report.failures[5])
+
+
+def test_validate_many_kwargs_rows():
+    validator = ParameterValidator(age=(int, False, (0, 150)), name=(str, False), addresses=(list, True))
+    rows = [
+        dict(age=25, name="Fred"),
+        dict(age=25),
+        dict(age=200, name="Fred", addresses=[]),
+        dict(age=25, name="Fred", addresses="main st"),
+    ]
+
+    report = validator.validate_many(rows)
+    assert report.failed_indices == [1, 2, 3]
+    assert isinstance(report.failures[1], ParameterKwargValidationException)
+    assert isinstance(report.failures[2], ParameterRangeValidationException)
+    assert isinstance(report.failures[3], ParameterTypeValidationException)
+
+
+def test_validate_columns():
+    validator = ParameterValidator((int, False, (0, 10)), (str, True))
+    report = validator.validate_columns([[1, 20, None, 3], ["a", 1, "c", None]])
+    # Row 1 fails in both columns, the first column wins.
+    assert report.failed_indices == [1, 2]
+    assert isinstance(report.failures[1], ParameterRangeValidationException)
+    assert isinstance(report.failures[2], ParameterNoneValidationException)
+
+    validator = ParameterValidator(age=(int, False), name=(str, False))
+    report = validator.validate_columns(dict(age=[1, 2]))
+    assert report.failed_indices == [0, 1]
+    assert isinstance(report.failures[0], ParameterKwargValidationException)
+
+
+def test_validate_columns_numpy():
+    numpy = pytest.importorskip("numpy")
+    validator = ParameterValidator((int, False, (0, 10)), (float, False, (0.0, 1.0)), (int, False))
+    report = validator.validate_columns([
+        numpy.array([1, 11, 3, -1]),
+        numpy.array([0.5, 0.5, 2.0, 0.5]),
+        numpy.array([0.5, 1.5, 2.5, 3.5]),
+    ])
+    # float dtype against an int spec falls back to element-wise checks
+    assert report.failed_indices == [0, 1, 2, 3]
+    assert isinstance(report.failures[0], ParameterTypeValidationException)
+    assert isinstance(report.failures[1], ParameterRangeValidationException)
+    assert isinstance(report.failures[2], ParameterRangeValidationException)
+    assert isinstance(report.failures[3], ParameterRangeValidationException)
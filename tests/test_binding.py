@@ -0,0 +1,99 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests matching validation tuples to parameters passed by keyword, defaults and *args."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+
+import pytest
+from paramvalidator import ParameterValidator
+from paramvalidator.exceptions import (
+    ParameterTypeValidationException,
+    ParameterKwargValidationException,
+    ParameterCountValidationException,
+    ParameterRangeValidationException
+)
+
+
+@ParameterValidator((int, False, (0, 10)), (str, False), (list, True))
+def with_default(num, name, items=None):
+    return (num, name, items)
+
+
+def test_defaults_and_keywords():
+    assert with_default(1, "a") == (1, "a", None)
+    assert with_default(1, name="a") == (1, "a", None)
+    assert with_default(num=1, name="a", items=[]) == (1, "a", [])
+    assert with_default(1, "a", []) == (1, "a", [])
+
+    with pytest.raises(ParameterRangeValidationException):
+        with_default(num=20, name="a")
+    with pytest.raises(ParameterTypeValidationException):
+        with_default(1, name=2)
+    with pytest.raises(ParameterTypeValidationException):
+        with_default(1, "a", items="b")
+
+    # Missing required parameter, or too many
+    with pytest.raises(ParameterCountValidationException) as info:
+        with_default(1)
+    assert info.value.received == 1
+    with pytest.raises(ParameterCountValidationException) as info:
+        with_default(1, "a", [], "extra")
+    assert info.value.received == 4
+
+
+def test_var_positional():
+    @ParameterValidator((str, False), (int, False), (int, False))
+    def total(label, *numbers):
+        return len(numbers)
+
+    assert total("a") == 0
+    assert total("a", 1, 2) == 2
+    # Only as many *args as there are validation tuples are validated
+    assert total("a", 1, 2, "unchecked") == 3
+    with pytest.raises(ParameterTypeValidationException):
+        total("a", 1, "2")
+
+
+def test_kwarg_tuple_naming_positional():
+    @ParameterValidator(num=(int, False, (0, 10)), flag=(bool, False))
+    def myfunc(num, **kwargs):
+        return num
+
+    assert myfunc(3, flag=True) == 3
+    assert myfunc(num=3, flag=True) == 3
+    with pytest.raises(ParameterRangeValidationException):
+        myfunc(30, flag=True)
+    with pytest.raises(ParameterRangeValidationException):
+        myfunc(num=30, flag=True)
+    with pytest.raises(ParameterKwargValidationException):
+        myfunc(3)
+
+
+class Defaults:
+    @ParameterValidator((int, False), (int, True))
+    def method(self, first, second=None):
+        return first
+
+
+def test_method_defaults():
+    instance = Defaults()
+    assert instance.method(1) == 1
+    assert instance.method(first=1, second=2) == 1
+    with pytest.raises(ParameterCountValidationException) as info:
+        instance.method()
+    assert info.value.received == 1
@@ -0,0 +1,127 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests buffer protocol specs and the bounded previews of values in exception messages."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+
+
+import array
+import mmap
+import pickle
+import pytest
+from paramvalidator import ParameterValidator, Buffer, Constraints, Spec
+from paramvalidator.exceptions import (
+    ParameterConstraintValidationException,
+    ParameterRangeValidationException
+)
+from paramvalidator.exceptions.validation_exception import PREVIEW_LENGTH, preview
+
+BYTES_LIKE = (bytes, bytearray, memoryview, mmap.mmap, array.array)
+
+
+def _failed(func, *args):
+    with pytest.raises(ParameterConstraintValidationException) as info:
+        func(*args)
+    return info.value
+
+
+def test_sizes_and_formats():
+    myfunc = ParameterValidator((BYTES_LIKE, False, Buffer(min_size=2, max_size=8, format=("B", "b"))))(len)
+    assert myfunc(b"ab") == 2
+    assert myfunc(bytearray(8)) == 8
+    assert myfunc(memoryview(b"abcd")[1:]) == 3
+    assert myfunc(array.array("b", [1, 2])) == 2
+
+    ex = _failed(myfunc, b"a")
+    assert (ex.constraint, ex.limit) == ("min_size", 2)
+    assert _failed(myfunc, bytes(9)).constraint == "max_size"
+    # Sizes are in bytes, not items
+    assert _failed(myfunc, array.array("d", [1.0, 2.0])).constraint == "max_size"
+    ex = _failed(myfunc, array.array("h", [1, 2]))
+    assert (ex.constraint, ex.limit) == ("format", ("B", "b"))
+
+
+def test_contiguity_and_readonly():
+    writable = ParameterValidator((object, False, Buffer(contiguous=True, readonly=False)))(lambda data: len(data))
+    assert writable(bytearray(b"abcd")) == 4
+    assert _failed(writable, b"abcd").constraint == "readonly"
+    assert _failed(writable, memoryview(bytearray(b"abcd"))[::2]).constraint == "contiguous"
+
+    readonly = ParameterValidator((object, False, Buffer(readonly=True)))(lambda data: len(data))
+    assert readonly(b"abcd") == 4
+    assert _failed(readonly, bytearray(4)).limit is True
+
+
+def test_not_a_buffer_and_released():
+    myfunc = ParameterValidator((object, False, Buffer()))(lambda data: data)
+    assert _failed(myfunc, "text").constraint == "buffer"
+    view = memoryview(b"abc")
+    view.release()
+    ex = _failed(myfunc, view)
+    assert ex.constraint == "buffer" and "released" in str(ex)
+
+
+def test_view_is_released():
+    # A bytearray with an unreleased export could not be resized.
+    data = bytearray(16)
+    myfunc = ParameterValidator((bytearray, False, Buffer(max_size=8)))(len)
+    _failed(myfunc, data)
+    data.extend(b"x")
+    myfunc(bytearray(4))
+
+
+def test_mmap(tmp_path):
+    path = tmp_path / "payload.bin"
+    path.write_bytes(b"\x01" * 4096)
+    with open(path, "rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        myfunc = ParameterValidator((mmap.mmap, False, Buffer(max_size=1024, readonly=True)))(len)
+        ex = _failed(myfunc, mapped)
+        assert ex.constraint == "max_size"
+        assert "<mmap of 4096 bytes, format 'B', starting b'\\x01\\x01" in str(ex)
+        assert len(str(ex)) < 400
+    # Closed, the buffer can no longer be read, the preview says so
+    assert "released" in str(ParameterConstraintValidationException(len, 1, "max_size", 1024, mapped))
+    assert _failed(myfunc, mapped).constraint == "buffer"
+
+
+def test_bounded_previews():
+    large = bytes(range(256)) * 4096
+    myfunc = ParameterValidator((bytes, False, Constraints(max_length=16)))(len)
+    message = str(_failed(myfunc, large))
+    assert "<bytes of 1048576 bytes" in message and len(message) < 400
+    assert _failed(myfunc, large).to_dict()["value"].startswith("<bytes of 1048576 bytes")
+
+    text = "x" * 100000
+    assert preview(text) == "x" * PREVIEW_LENGTH + "... (100000 characters)"
+    assert len(preview(list(range(100000)))) < 200
+    assert preview(b"short") == "b'short'" and preview(7) == "7"
+
+    ranged = ParameterValidator((str, False, frozenset(str(value) for value in range(10000))))(len)
+    with pytest.raises(ParameterRangeValidationException) as info:
+        ranged(text)
+    assert len(str(info.value)) < 600
+
+
+def test_spec_interning_and_pickling():
+    buffer = Buffer(max_size=10, format="B")
+    assert Spec(bytes, False, buffer) is Spec(bytes, False, Buffer(max_size=10, format=("B",)))
+    assert pickle.loads(pickle.dumps(buffer)) == buffer
+    with pytest.raises(AttributeError):
+        buffer.max_size = 1
+    with pytest.raises(ValueError):
+        Buffer(min_size=-1)
@@ -0,0 +1,105 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests collecting every validation failure of a call into one exception."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+
+import json
+import pytest
+from paramvalidator import ParameterValidator, ParameterValidationException, Items
+from paramvalidator.exceptions import (
+    ParameterAggregateValidationException,
+    ParameterNoneValidationException,
+    ParameterTypeValidationException,
+    ParameterKwargValidationException,
+    ParameterRangeValidationException
+)
+
+
+collecting = ParameterValidator(
+    (int, False, (0, 10)), (str, False), (list, True, Items((int, False))),
+    age=(int, False, (0, 150)), name=(str, False)).with_collect_all()
+
+
+@collecting
+def handler(num, label, items, **kwargs):
+    return num
+
+
+def test_collects_every_failure():
+    assert handler(1, "a", None, age=1, name="n") == 1
+
+    with pytest.raises(ParameterAggregateValidationException) as info:
+        handler(20, None, [1, "2"], age=200)
+    failures = info.value.failures
+    assert [type(failure) for failure in failures] == [
+        ParameterRangeValidationException,
+        ParameterNoneValidationException,
+        ParameterTypeValidationException,
+        ParameterRangeValidationException,
+        ParameterKwargValidationException,
+    ]
+    assert isinstance(info.value, ParameterValidationException)
+    assert info.value.message.startswith("5 invalid parameters in func handler")
+
+    report = json.loads(info.value.to_json())
+    assert report["func"] == "handler"
+    assert report["failures"][0] == {"error": "range", "param": 1, "range": [0, 10], "value": 20}
+    assert report["failures"][1] == {"error": "none", "param": 2}
+    assert report["failures"][2] == {"error": "type", "param": "3[1]", "expected": "int", "actual": "str"}
+    assert report["failures"][3] == {"error": "range", "param": "age", "range": [0, 150], "value": 200}
+    assert report["failures"][4] == {"error": "missing", "param": "name"}
+
+
+def test_kwarg_failures_and_json_of_non_finite_values():
+    bounded = ParameterValidator((float, False, (0.0, 1.0)), x=(float, False, (0.0, 1.0))).with_collect_all().with_stats()
+
+    @bounded
+    def ratio(value, **kwargs):
+        return value
+
+    with pytest.raises(ParameterAggregateValidationException) as info:
+        ratio(5.0, x=float("inf"))
+    report = json.loads(info.value.to_json())
+    assert [failure["param"] for failure in report["failures"]] == [1, "x"]
+    assert report["failures"][1]["value"] == "inf"
+
+    from paramvalidator import stats
+    assert stats("{}.{}".format(ratio.__module__, ratio.__qualname__)).failures == {
+        ("ParameterRangeValidationException", 1): 1,
+        ("ParameterRangeValidationException", "x"): 1,
+    }
+
+
+def test_collect_all_methods_and_counts():
+    collecting_method = ParameterValidator((int, False), (str, False)).with_collect_all()
+
+    class Service:
+        @collecting_method
+        def call(self, num, name="a"):
+            return num
+
+    service = Service()
+    assert service.call(1) == 1
+    with pytest.raises(ParameterAggregateValidationException) as info:
+        service.call("1", name=2)
+    assert [failure.param for failure in info.value.failures] == [1, 2]
+
+    with pytest.raises(ParameterAggregateValidationException) as info:
+        service.call(1, "a", "extra")
+    assert info.value.to_dict()["failures"] == [{"error": "count", "expected": 3, "received": 4}]
@@ -0,0 +1,58 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests that compiled validation tuples behave like the interpreted path."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+from paramvalidator import ParameterValidator, ParameterValidationException
+from paramvalidator.compiler import compile_validation
+
+
+def _outcome(callable_, *args):
+    try:
+        callable_(*args)
+    except ParameterValidationException as ex:
+        return type(ex), str(ex)
+    return None
+
+
+def test_compiled_matches_interpreted():
+    """
+    Every compiled checker must raise the same exception, with the same message,
+    as ParameterValidator._validate_argument for the same validation tuple.
+    """
+    def target(num):
+        pass
+
+    validator = ParameterValidator()
+    validations = [
+        (int, False),
+        (int, True),
+        (int, False, (3, 5)),
+        (float, True, (0.0, 1.0)),
+        ((int, float), False, (-1, 1)),
+        (str, False, "not a range"),
+        (list, True),
+    ]
+    values = [None, 0, 4, 10, 0.5, 2.5, True, "str", []]
+
+    for validation in validations:
+        check = compile_validation(validation)
+        for value in values:
+            expected = _outcome(validator._validate_argument, 2, target, value, validation)
+            actual = _outcome(check, target, 2, value)
+            assert expected == actual, (validation, value)
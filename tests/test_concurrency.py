@@ -0,0 +1,108 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests decorated functions shared by many threads."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+
+
+import threading
+import pytest
+from paramvalidator import ParameterValidator, Items, Schema, stats, memo_stats
+from paramvalidator.exceptions import (
+    ParameterRangeValidationException,
+    ParameterAggregateValidationException
+)
+
+THREADS = 8
+CALLS = 300
+
+
+def _run_threads(target):
+    barrier = threading.Barrier(THREADS)
+    errors = []
+
+    def run():
+        barrier.wait()
+        try:
+            target()
+        except Exception as ex:  # pragma: no cover - reported below
+            errors.append(ex)
+
+    threads = [threading.Thread(target=run) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+
+
+def test_shared_wrapper_under_threads():
+    validator = ParameterValidator((int, False, (0, 10)), (tuple, False, Items((int, False, (0, 10))))) \
+        .with_stats().with_memo(maxsize=8).with_lazy_compile()
+
+    @validator
+    def shared(num, values):
+        return num
+
+    def calls():
+        for index in range(CALLS):
+            assert shared(index % 11, (index % 11,)) == index % 11
+            with pytest.raises(ParameterRangeValidationException):
+                shared(11, (1,))
+
+    _run_threads(calls)
+    name = __name__ + ".test_shared_wrapper_under_threads.<locals>.shared"
+    assert stats(name).calls == THREADS * CALLS * 2
+    assert sum(stats(name).failures.values()) == THREADS * CALLS
+    memo = memo_stats(name)
+    assert memo.hits + memo.misses == THREADS * CALLS
+    assert memo.size <= memo.maxsize
+
+
+def test_concurrent_decoration_shares_schemas():
+    schemas = []
+
+    def decorate():
+        for index in range(CALLS):
+            validator = ParameterValidator((int, False, (0, index % 5)), name=(str, True))
+            schemas.append(validator.schema)
+            assert validator(lambda num, **kwargs: num)(0) == 0
+
+    _run_threads(decorate)
+    assert len(set(map(id, schemas))) == 5
+    assert Schema((int, False, (0, 4)), name=(str, True)) in schemas
+
+
+def test_settings_are_fixed_when_decorated():
+    validator = ParameterValidator((int, False, (0, 10))).with_lazy_compile()
+
+    @validator
+    def lazy(num):
+        return num
+
+    # Changes after decoration, even before the lazy first call, have no effect.
+    validator.with_mode("never").with_collect_all()
+    with pytest.raises(ParameterRangeValidationException) as info:
+        lazy(11)
+    assert not isinstance(info.value, ParameterAggregateValidationException)
+    previous = ParameterValidator.set_mode("never")
+    try:
+        with pytest.raises(ParameterRangeValidationException):
+            lazy(12)
+    finally:
+        ParameterValidator.set_mode(previous)
@@ -0,0 +1,159 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests value constraints: lengths, bounds, finiteness, membership, patterns and predicates."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+
+
+import math
+import pickle
+import re
+import typing
+import pytest
+from paramvalidator import ParameterValidator, Constraints, Items, Spec
+from paramvalidator.exceptions import (
+    ParameterTypeValidationException,
+    ParameterRangeValidationException,
+    ParameterConstraintValidationException
+)
+
+
+def _failed(func, *args, **kwargs):
+    with pytest.raises(ParameterConstraintValidationException) as info:
+        func(*args, **kwargs)
+    return info.value
+
+
+def test_lengths():
+    @ParameterValidator((str, False, Constraints(min_length=1, max_length=3)), names=(list, True, Constraints(max_length=2)))
+    def myfunc(code, **kwargs):
+        return code
+
+    assert myfunc("a") == "a"
+    assert myfunc("abc", names=[1, 2]) == "abc"
+    assert _failed(myfunc, "").constraint == "min_length"
+    ex = _failed(myfunc, "abcd")
+    assert (ex.param, ex.constraint, ex.limit, ex.value) == (1, "max_length", 3, "abcd")
+    assert _failed(myfunc, "a", names=[1, 2, 3]).param == "names"
+
+
+def test_bounds_and_finite():
+    @ParameterValidator((float, False, Constraints(gt=0.0, le=1.0, finite=True)), (int, False, Constraints(ge=0, lt=10)))
+    def myfunc(ratio, count):
+        return ratio * count
+
+    assert myfunc(1.0, 0) == 0.0
+    assert myfunc(0.5, 9) == 4.5
+    assert _failed(myfunc, 0.0, 1).constraint == "gt"
+    assert _failed(myfunc, 1.5, 1).constraint == "le"
+    assert _failed(myfunc, 0.5, 10).constraint == "lt"
+    assert _failed(myfunc, 0.5, -1).constraint == "ge"
+    # NaN compares False with every bound, finite reports it
+    assert _failed(myfunc, math.nan, 1).constraint in ("gt", "finite")
+
+    finite = ParameterValidator((float, False, Constraints(finite=True)))(lambda value: value)
+    assert finite(1e308) == 1e308
+    for value in (math.nan, math.inf, -math.inf):
+        assert _failed(finite, value).constraint == "finite"
+
+
+def test_membership_pattern_and_predicates():
+    def is_even(value):
+        return value % 2 == 0
+
+    @ParameterValidator((str, False, Constraints(allowed=["r", "w"])), (str, False, re.compile(r"[0-9a-f]{4}")),
+                        (int, False, Constraints(predicate=(is_even, lambda value: value > 0))))
+    def myfunc(mode, digest, count):
+        return count
+
+    assert myfunc("r", "00af", 2) == 2
+    ex = _failed(myfunc, "x", "00af", 2)
+    assert (ex.constraint, ex.limit) == ("allowed", frozenset({"r", "w"}))
+    ex = _failed(myfunc, "w", "00afe", 2)
+    assert ex.constraint == "pattern" and ex.to_dict()["limit"] == "[0-9a-f]{4}"
+    ex = _failed(myfunc, "w", "00af", 3)
+    assert ex.constraint == "predicate" and "is_even" in str(ex)
+    assert _failed(myfunc, "w", "00af", -2).param == 3
+
+    # Strings are compiled once, by Constraints
+    assert Constraints(pattern=r"[a-z]+").pattern is re.compile(r"[a-z]+")
+
+
+def test_constraint_not_applicable_fails():
+    myfunc = ParameterValidator((object, False, Constraints(min_length=1, pattern="a+")))(lambda value: value)
+    assert myfunc("aa") == "aa"
+    assert _failed(myfunc, 5).constraint == "min_length"
+    assert _failed(myfunc, b"aa").constraint == "pattern"
+
+
+def test_type_checked_before_constraints():
+    myfunc = ParameterValidator((str, True, Constraints(min_length=2)))(lambda value: value)
+    assert myfunc(None) is None
+    with pytest.raises(ParameterTypeValidationException):
+        myfunc(5)
+
+
+def test_container_elements():
+    myfunc = ParameterValidator((list, False, Items((str, False, Constraints(max_length=2)))))(lambda values: values)
+    assert myfunc(["a", "bc"])
+    assert str(_failed(myfunc, ["a", "bcd"]).param) == "1[1]"
+
+    import array
+    membership = ParameterValidator((array.array, False, Items((int, False, frozenset({1, 2})))))(lambda values: values)
+    membership(array.array("i", [1, 2]))
+    with pytest.raises(ParameterRangeValidationException):
+        membership(array.array("i", [1, 3]))
+
+
+def test_spec_interning_and_pickling():
+    constraints = Constraints(min_length=1, pattern="[a-z]+", allowed={"ab", "cd"})
+    assert Spec(str, False, constraints) is Spec(str, False, Constraints(min_length=1, pattern="[a-z]+", allowed={"ab", "cd"}))
+    assert Constraints(allowed=("cd", "ab")) == Constraints(allowed=("ab", "cd"))
+    assert pickle.loads(pickle.dumps(constraints)) == constraints
+    with pytest.raises(AttributeError):
+        constraints.min_length = 2
+    with pytest.raises(ValueError):
+        Constraints(gt=0, ge=0)
+
+    ex = pickle.loads(pickle.dumps(ParameterConstraintValidationException(len, 1, "allowed", constraints.allowed, "ef")))
+    assert (ex.constraint, ex.limit, ex.value) == ("allowed", frozenset({"ab", "cd"}), "ef")
+
+
+def test_annotated_constraints():
+    Annotated = getattr(typing, "Annotated", None)
+    if Annotated is None:
+        pytest.skip("typing.Annotated requires Python 3.9")
+
+    @ParameterValidator.from_annotations
+    def myfunc(name: Annotated[str, Constraints(max_length=3)], code: Annotated[str, re.compile("[A-Z]+")]):
+        return name
+
+    assert myfunc("abc", "AB") == "abc"
+    assert _failed(myfunc, "abcd", "AB").constraint == "max_length"
+    assert _failed(myfunc, "abc", "ab").constraint == "pattern"
+
+
+def test_numpy_columns_and_arrays():
+    numpy = pytest.importorskip("numpy")
+    validator = ParameterValidator((float, False, Constraints(finite=True)))
+    report = validator.validate_columns([numpy.array([1.0, numpy.nan, 2.0, numpy.inf])])
+    assert report.failed_indices == [1, 3]
+
+    myfunc = ParameterValidator((numpy.ndarray, False, Items((float, False, Constraints(ge=0.0)))))(lambda values: values)
+    myfunc(numpy.array([0.0, 1.0]))
+    assert str(_failed(myfunc, numpy.array([[0.0, 1.0], [-1.0, 2.0]])).param) == "1[2]"
@@ -0,0 +1,206 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests validate once mode, which skips validation within a validated call."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from paramvalidator import ParameterValidator, in_validated_call, stats, enable_stats, disable_stats
+from paramvalidator.exceptions import ParameterTypeValidationException
+
+
+validate_once = ParameterValidator((int, False)).with_validate_once()
+validate_once_strict = ParameterValidator((int, False)).with_validate_once(strict=True)
+
+
+@validate_once
+def inner(num):
+    return in_validated_call()
+
+
+@validate_once_strict
+def strict_inner(num):
+    return num
+
+
+@validate_once
+def outer(num, call=None):
+    return call() if call else inner("not validated")
+
+
+validate_pair_once = ParameterValidator((int, False), (int, False)).with_validate_once()
+
+
+@validate_pair_once
+def countdown(num, remaining):
+    if remaining == 0:
+        return num
+    # Only the outermost call validates
+    return countdown(str(num), remaining - 1)
+
+
+def test_inner_calls_skip_validation():
+    assert outer(1) is True
+    assert not in_validated_call()
+    with pytest.raises(ParameterTypeValidationException):
+        inner("validated")
+    with pytest.raises(ParameterTypeValidationException):
+        outer("validated")
+
+
+def test_strict_calls_validate():
+    with pytest.raises(ParameterTypeValidationException):
+        outer(1, lambda: strict_inner("validated"))
+    assert outer(1, lambda: strict_inner(2)) == 2
+
+
+def test_recursion_validates_once():
+    assert countdown(5, 3) == "5"
+    with pytest.raises(ParameterTypeValidationException):
+        countdown("5", 3)
+
+
+def test_mark_is_cleared_on_exception():
+    def fail():
+        raise KeyError("failed")
+
+    with pytest.raises(KeyError):
+        outer(1, fail)
+    assert not in_validated_call()
+    with pytest.raises(ParameterTypeValidationException):
+        inner("validated")
+
+
+def test_plain_decorators_always_validate():
+    @ParameterValidator((int, False))
+    def plain(num):
+        return num
+
+    with pytest.raises(ParameterTypeValidationException):
+        outer(1, lambda: plain("validated"))
+
+
+def test_other_threads_validate():
+    results = []
+
+    def in_pool():
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            future = pool.submit(inner, "validated")
+            with pytest.raises(ParameterTypeValidationException):
+                future.result()
+        return inner("not validated")
+
+    def run():
+        results.append(outer(1, in_pool))
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [True] * 4
+
+
+@validate_once
+async def async_inner(num):
+    await asyncio.sleep(0)
+    return in_validated_call()
+
+
+@validate_once
+async def async_outer(num, spawn=False):
+    if spawn:
+        # Outlives this call
+        return asyncio.ensure_future(async_inner("validated"))
+    return await async_inner("not validated")
+
+
+@validate_once
+async def async_items(num):
+    yield num
+
+
+def test_asyncio_tasks():
+    async def main():
+        assert await async_outer(1) is True
+        # Concurrent tasks are marked independently
+        with pytest.raises(ParameterTypeValidationException):
+            await asyncio.gather(async_outer(1), async_inner("validated"))
+        task = await async_outer(1, spawn=True)
+        with pytest.raises(ParameterTypeValidationException):
+            await task
+
+    asyncio.run(main())
+
+
+def test_async_generators_skip_but_do_not_mark():
+    async def collect(num):
+        return [value async for value in async_items(num)]
+
+    @validate_once
+    async def consume(num):
+        return await collect("not validated")
+
+    async def main():
+        assert await consume(1) == ["not validated"]
+        with pytest.raises(ParameterTypeValidationException):
+            await collect("validated")
+
+    asyncio.run(main())
+
+
+def test_skipped_calls_are_not_counted():
+    enable_stats()
+    try:
+        @ParameterValidator((int, False))
+        def counted(num):
+            return num
+
+        @ParameterValidator((int, False))
+        def caller(num):
+            return counted(num)
+    finally:
+        disable_stats()
+    previous = ParameterValidator.set_validate_once(False)
+    assert previous is False
+    try:
+        ParameterValidator.set_validate_once(True)
+
+        instrumented = ParameterValidator((int, False)).with_stats()
+
+        @instrumented
+        def counted_once(num):
+            return num
+
+        @ParameterValidator((int, False))
+        def caller_once(num):
+            return counted_once(num)
+    finally:
+        ParameterValidator.set_validate_once(previous)
+
+    caller(1)
+    caller_once(1)
+    prefix = __name__ + ".test_skipped_calls_are_not_counted.<locals>."
+    assert stats(prefix + "counted").calls == 1
+    assert stats(prefix + "counted_once").calls == 0
+    counted_once(1)
+    assert stats(prefix + "counted_once").calls == 1
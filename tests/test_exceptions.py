@@ -0,0 +1,72 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests the structured, lazily rendered validation exceptions."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+
+from paramvalidator import ParameterValidator, ParameterValidationException
+from paramvalidator.exceptions import (
+    ParameterNoneValidationException,
+    ParameterTypeValidationException,
+    ParameterKwargValidationException,
+    ParameterCountValidationException,
+    ParameterRangeValidationException
+)
+
+
+def target(num, name):
+    pass
+
+
+def test_structured_fields():
+    @ParameterValidator((int, False, (0, 10)), (str, False))
+    def myfunc(num, name):
+        pass
+
+    try:
+        myfunc(11, "name")
+        assert False
+    except ParameterRangeValidationException as ex:
+        assert ex._message is None
+        assert ex.func.__name__ == "myfunc"
+        assert ex.param == 1
+        assert ex.value_range == (0, 10)
+        assert ex.value == 11
+        # Rendered on first access, then reused.
+        assert ex.message is str(ex)
+        assert "value 11 not in range (0, 10)" in ex.message
+
+
+def test_messages():
+    module = target.__module__
+    expected = [
+        (ParameterNoneValidationException(target, 1),
+         "Unexpected None value found in func target in module {}, parameter 1.".format(module)),
+        (ParameterTypeValidationException(target, 2, int, str),
+         "Arg type mismatch in func target in module {}, parameter 2 type does not match expected {} != {}.".format(module, int, str)),
+        (ParameterRangeValidationException(target, 1, (1, 2), 3),
+         "Out of range parameter 1 in func target in module {} , value 3 not in range (1, 2).".format(module)),
+        (ParameterKwargValidationException(target, "age"),
+         "Missing required kwarg - age - in func target in module {}.".format(module)),
+        (ParameterCountValidationException(target, 3),
+         "Expected 2 args in func target in module {} but 3 were given.".format(module)),
+        (ParameterValidationException("plain message"), "plain message"),
+    ]
+    for exception, message in expected:
+        assert str(exception) == message
+        assert exception.message == message
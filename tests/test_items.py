@@ -0,0 +1,112 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests element-wise validation of container arguments with Items."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+
+import array
+import pytest
+from paramvalidator import ParameterValidator, Items
+from paramvalidator.exceptions import (
+    ParameterNoneValidationException,
+    ParameterTypeValidationException,
+    ParameterRangeValidationException
+)
+
+
+def test_list_tuple_set_elements():
+    @ParameterValidator((list, False, Items((int, False, (0, 10)))), (set, True, Items((str, False))))
+    def myfunc(numbers, names):
+        return len(numbers)
+
+    assert myfunc([1, 2, 3], {"a"}) == 3
+    assert myfunc([], None) == 0
+
+    with pytest.raises(ParameterRangeValidationException) as info:
+        myfunc([1, 20, 3], None)
+    assert str(info.value.param) == "1[1]"
+    assert "parameter 1[1] in func" in str(info.value)
+
+    with pytest.raises(ParameterNoneValidationException):
+        myfunc([1, None], None)
+
+    with pytest.raises(ParameterTypeValidationException) as info:
+        myfunc([1], {"a", 2})
+    # Set iteration order is arbitrary, only the parameter is known.
+    assert info.value.param.param == 2
+
+
+def test_dict_and_nested_elements():
+    @ParameterValidator(addresses=(dict, False, Items((list, False, Items((str, False))), keys=(str, False))))
+    def myfunc(**kwargs):
+        return True
+
+    assert myfunc(addresses={"home": ["main st"], "work": []})
+
+    with pytest.raises(ParameterTypeValidationException) as info:
+        myfunc(addresses={"home": ["main st", 5]})
+    assert str(info.value.param) == "addresses['home'][1]"
+
+    with pytest.raises(ParameterTypeValidationException) as info:
+        myfunc(addresses={1: []})
+    assert str(info.value.param) == "addresses[key 1]"
+
+
+def test_cost_strategies():
+    values = list(range(100)) + ["bad"]
+
+    first = ParameterValidator((list, False, Items((int, False), first=10)))(lambda items: True)
+    assert first(values)
+
+    full = ParameterValidator((list, False, Items((int, False))))(lambda items: True)
+    with pytest.raises(ParameterTypeValidationException):
+        full(values)
+
+    sampled = ParameterValidator((list, False, Items((int, False), sample=101)))(lambda items: True)
+    with pytest.raises(ParameterTypeValidationException):
+        sampled(values)
+
+    with pytest.raises(ValueError):
+        Items((int, False), first=1, sample=1)
+
+
+def test_homogeneous_arrays():
+    @ParameterValidator((array.array, False, Items((int, False, (0, 10)))))
+    def myfunc(values):
+        return True
+
+    assert myfunc(array.array("i", [1, 2, 3]))
+    with pytest.raises(ParameterRangeValidationException) as info:
+        myfunc(array.array("i", [1, 20]))
+    assert str(info.value.param) == "1[1]"
+    with pytest.raises(ParameterTypeValidationException) as info:
+        myfunc(array.array("d", [1.0]))
+    assert str(info.value.param) == "1[*]"
+
+    numpy = pytest.importorskip("numpy")
+
+    @ParameterValidator((numpy.ndarray, False, Items((float, False, (0.0, 1.0)))))
+    def myarrayfunc(values):
+        return True
+
+    assert myarrayfunc(numpy.zeros(1000))
+    with pytest.raises(ParameterRangeValidationException) as info:
+        myarrayfunc(numpy.array([0.5, 2.0]))
+    assert info.value.value == 2.0
+    with pytest.raises(ParameterTypeValidationException):
+        myarrayfunc(numpy.zeros(10, dtype=numpy.int32))
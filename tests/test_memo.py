@@ -0,0 +1,204 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests the memo cache of accepted arguments."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+
+
+import gc
+import threading
+import weakref
+import pytest
+from paramvalidator import ParameterValidator, Items, memo_stats, clear_memo
+from paramvalidator.memo import memo_key, MAX_LENGTH, MAX_BYTES
+from paramvalidator.exceptions import (
+    ParameterValidationException,
+    ParameterRangeValidationException,
+    ParameterTypeValidationException
+)
+
+
+def _name(qualname):
+    return __name__ + "." + qualname
+
+
+SPECS = ((tuple, False, Items((int, False, (0, 10)))), (str, False, frozenset({"fast", "slow"})))
+KWARG_SPECS = dict(levels=(frozenset, True, Items((int, False, (1, 3)))))
+memoizing = ParameterValidator(*SPECS, **KWARG_SPECS).with_memo(maxsize=4)
+
+
+@memoizing
+def memoized(nums, speed, **kwargs):
+    return nums
+
+
+def test_hits_and_misses():
+    clear_memo()
+    for _ in range(3):
+        assert memoized((5, 6), "fast", levels=frozenset({2})) == (5, 6)
+    stats = memo_stats(_name("memoized"))
+    # nums and levels are memoized, speed only has a membership check
+    assert (stats.misses, stats.hits, stats.size, stats.maxsize) == (2, 4, 2, 8)
+    clear_memo()
+    assert memo_stats(_name("memoized")) == (0, 0, 0, 8)
+
+
+def test_failures_are_never_cached():
+    clear_memo()
+    for _ in range(2):
+        with pytest.raises(ParameterRangeValidationException):
+            memoized((1, 11), "fast")
+        with pytest.raises(ParameterRangeValidationException):
+            memoized((1,), "medium")
+        with pytest.raises(ParameterRangeValidationException):
+            memoized((1,), "fast", levels=frozenset({4}))
+    assert memo_stats(_name("memoized")).size == 1
+
+
+def test_failures_name_the_same_parameter():
+    @ParameterValidator(*SPECS, **KWARG_SPECS)
+    def plain(nums, speed, **kwargs):
+        return nums
+
+    # Cacheable and uncacheable values, memoized or not, report the same parameter
+    for (levels, param) in ((frozenset({4}), "levels[0]"), (frozenset({4, (1,) * (MAX_LENGTH + 1)}), None)):
+        failures = []
+        for func in (memoized, plain):
+            with pytest.raises(ParameterValidationException) as info:
+                func((1,), "fast", levels=levels)
+            failures.append((str(info.value.param), info.value.to_dict()))
+        assert failures[0] == failures[1]
+        assert param is None or failures[0][0] == param
+
+
+def test_type_is_part_of_the_key():
+    memoizing_flags = ParameterValidator((tuple, False, Items((bool, False, (0, 1))))).with_memo()
+
+    @memoizing_flags
+    def typed(flags):
+        pass
+
+    typed((True, False))
+    # Equal to (True, False), but not bools
+    with pytest.raises(ParameterTypeValidationException):
+        typed((1, 0))
+    typed(((True,),)[0])
+    with pytest.raises(ParameterTypeValidationException):
+        typed((1.0,))
+
+
+def test_eviction_is_bounded():
+    clear_memo()
+    for num in range(10):
+        memoized((num,), "slow")
+    stats = memo_stats(_name("memoized"))
+    assert stats.size <= stats.maxsize
+
+
+def test_cheap_checks_are_not_memoized():
+    nested = Items((tuple, False, Items((int, False, (0, 1)))))
+
+    memoizing_plain = ParameterValidator((tuple, False, Items((str, False))), (tuple, False), (tuple, False, nested)).with_memo()
+
+    @memoizing_plain
+    def plain(names, values, pairs):
+        pass
+
+    plain(("a",), (), ((0, 1),))
+    with pytest.raises(KeyError):
+        memo_stats(_name("test_cheap_checks_are_not_memoized.<locals>.plain"))
+
+
+def test_mutable_and_unhashable_values_are_not_cached():
+    assert memo_key([1]) is None
+    assert memo_key((1, [2])) is None
+    assert memo_key({"a": 1}) is None
+    assert memo_key(tuple(range(MAX_LENGTH + 1))) is None
+    assert memo_key(("x" * (MAX_BYTES + 1),)) is None
+    assert memo_key((((((1,),),),),)) is None
+    assert memo_key((1, "a")) == (tuple, (1, "a"), frozenset((int, str)))
+    assert memo_key((1, True)) == (tuple, (1, True), (int, bool))
+    assert memo_key((1, True)) != memo_key((True, 1))
+    assert memo_key(((1,), None)) == (tuple, ((1,), None), ((tuple, (1,), frozenset((int,))), (type(None), None)))
+
+    memoizing_lists = ParameterValidator((list, False, Items((int, False, (0, 10))))).with_memo()
+
+    @memoizing_lists
+    def listed(values):
+        pass
+
+    values = [1]
+    listed(values)
+    values.append("2")
+    with pytest.raises(ParameterTypeValidationException):
+        listed(values)
+    assert memo_stats(_name("test_mutable_and_unhashable_values_are_not_cached.<locals>.listed")).size == 0
+
+
+def test_memo_is_thread_safe():
+    clear_memo()
+    errors = []
+
+    def run():
+        try:
+            for num in range(200):
+                memoized((num % 11,), "fast", levels=frozenset({num % 3 + 1}))
+        except Exception as ex:  # pragma: no cover - reported below
+            errors.append(ex)
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    stats = memo_stats(_name("memoized"))
+    assert stats.hits + stats.misses == 8 * 200 * 2
+
+
+def test_with_memo_rejects_negative_size():
+    with pytest.raises(ValueError):
+        ParameterValidator((int, False)).with_memo(-1)
+    assert ParameterValidator((int, False)).with_memo(0).memo is None
+
+
+def test_each_decoration_has_its_own_cache():
+    def decorate():
+        @memoizing
+        def redecorated(nums, speed, **kwargs):
+            return nums
+
+        redecorated((1,), "fast")
+        return redecorated
+
+    first = decorate()
+    name = _name("test_each_decoration_has_its_own_cache.<locals>.decorate.<locals>.redecorated")
+    assert memo_stats(name) == (0, 1, 1, 8)
+    second = decorate()
+    assert memo_stats(name) == (0, 2, 2, 16)
+
+    # Decorated again, the caches of the previous wrapper are freed with it
+    freed = weakref.ref(first)
+    del first
+    gc.collect()
+    assert freed() is None
+    assert memo_stats(name) == (0, 1, 1, 8)
+    del second
+    gc.collect()
+    with pytest.raises(KeyError):
+        memo_stats(name)
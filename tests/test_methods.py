@@ -0,0 +1,177 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests that compiled validation tuples behave like the interpreted path."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+
+import functools
+from paramvalidator import ParameterValidator, ParameterValidationException
+from paramvalidator.exceptions import (
+    ParameterTypeValidationException,
+    ParameterRangeValidationException
+)
+
+
+class Base:
+    @ParameterValidator((int, False, (1, 10)))
+    def method(self, num):
+        return num
+
+    @classmethod
+    @ParameterValidator((str, False))
+    def from_name(cls, name):
+        return cls, name
+
+    @staticmethod
+    @ParameterValidator((int, False))
+    def static_wrapped(num):
+        return num
+
+    @ParameterValidator((int, False))
+    @staticmethod
+    def static_inner(num):
+        return num
+
+    class Nested:
+        @ParameterValidator((str, False))
+        def method(self, name):
+            return name
+
+
+class Receivers:
+    @staticmethod
+    @ParameterValidator((int, False))
+    def static_default(x, y=0):
+        return x
+
+    @ParameterValidator((int, False))
+    def this_method(this, num):
+        return num
+
+    @ParameterValidator((int, False))
+    def shifted(this, num, more=0):
+        return num
+
+
+def logged(func):
+    @functools.wraps(func)
+    def logging_wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
+    return logging_wrapper
+
+
+class Wrapped:
+    @ParameterValidator((int, False))
+    @logged
+    def method(self, num):
+        return num
+
+    @ParameterValidator((int, False))
+    def unwrapped_args(*args):
+        return args[-1]
+
+
+class Derived(Base):
+    pass
+
+
+class Bas:
+    """Class whose name is a prefix of Base."""
+    pass
+
+
+def test_method_receivers():
+    """
+    The receiver is never validated regardless of the class of the instance.
+    """
+    assert Base().method(3) == 3
+    assert Derived().method(3) == 3
+    assert Base.Nested().method("name") == "name"
+    assert Derived.from_name("x") == (Derived, "x")
+    assert Base.static_wrapped(4) == 4
+    assert Base.static_inner(5) == 5
+
+    try:
+        Derived().method(30)
+        assert False
+    except ParameterValidationException as ex:
+        assert isinstance(ex, ParameterRangeValidationException)
+
+    try:
+        Derived.from_name(1)
+        assert False
+    except ParameterValidationException as ex:
+        assert isinstance(ex, ParameterTypeValidationException)
+
+
+def test_function_with_prefix_named_instance():
+    """
+    A standalone function is never treated as a method, even when called with
+    an instance whose class name is a prefix of the function's qualname.
+    """
+    @ParameterValidator((Bas, False), (int, False))
+    def Base_helper(obj, num):
+        return num
+
+    assert Base_helper(Bas(), 1) == 1
+    try:
+        Base_helper(Bas(), "1")
+        assert False
+    except ParameterValidationException as ex:
+        assert isinstance(ex, ParameterTypeValidationException)
+
+
+def test_receiver_decided_by_binding():
+    """
+    A function in a class body whose first parameter is neither self nor cls
+    has a receiver when bound, and none when staticmethod() calls it directly.
+    """
+    assert Receivers.static_default(1, 1) == 1
+    assert Receivers().static_default(2) == 2
+    try:
+        Receivers.static_default("bad", 1)
+        assert False
+    except ParameterValidationException as ex:
+        assert isinstance(ex, ParameterTypeValidationException)
+
+    receivers = Receivers()
+    assert receivers.this_method(3) == 3
+    assert receivers.shifted(4) == 4
+    assert Receivers.shifted(receivers, 5, 1) == 5
+    for call in (lambda: receivers.this_method("3"), lambda: receivers.shifted("4", 1), lambda: Receivers.shifted(receivers, "5")):
+        try:
+            call()
+            assert False
+        except ParameterValidationException as ex:
+            assert isinstance(ex, ParameterTypeValidationException)
+
+
+def test_receiver_of_wrapped_methods():
+    """
+    The receiver is decided from the signature of the wrapped function, a
+    wrapper taking *args, **kwargs is decided by binding.
+    """
+    wrapped = Wrapped()
+    assert wrapped.method(1) == 1
+    assert wrapped.unwrapped_args(2) == 2
+    for call in (lambda: wrapped.method("1"), lambda: wrapped.unwrapped_args("2")):
+        try:
+            call()
+            assert False
+        except ParameterValidationException as ex:
+            assert isinstance(ex, ParameterTypeValidationException)
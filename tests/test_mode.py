@@ -0,0 +1,67 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests the always, never and sample validation modes."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+
+import pytest
+from paramvalidator import ParameterValidator, ParameterValidationException, ValidationMode, sample
+
+
+def target(num):
+    return num
+
+
+def test_parse():
+    assert ValidationMode.parse("always") == ValidationMode("always")
+    assert ValidationMode.parse(" NEVER ").name == "never"
+    assert ValidationMode.parse("sample(0.25)") == sample(0.25)
+    assert ValidationMode.parse(sample(0.5)) == sample(0.5)
+    for bad in ("sometimes", "sample()", "sample(2)"):
+        with pytest.raises(ValueError):
+            ValidationMode.parse(bad)
+
+
+def test_never_returns_original():
+    assert ParameterValidator((int, False)).with_mode("never")(target) is target
+    assert ParameterValidator((int, False)).with_mode(sample(0.0))(target) is target
+
+    previous = ParameterValidator.set_mode("never")
+    try:
+        assert ParameterValidator((int, False))(target) is target
+        # The instance mode overrides the global mode.
+        wrapped = ParameterValidator((int, False)).with_mode("always")(target)
+        assert wrapped is not target
+        with pytest.raises(ParameterValidationException):
+            wrapped("1")
+    finally:
+        ParameterValidator.set_mode(previous)
+    assert ParameterValidator.get_mode() == previous
+
+
+def test_sample():
+    wrapped = ParameterValidator((int, False)).with_mode("sample(0.5)")(target)
+    assert wrapped(3) == 3
+
+    failures = 0
+    for _ in range(2000):
+        try:
+            wrapped("1")
+        except ParameterValidationException:
+            failures += 1
+    assert 700 < failures < 1300
@@ -0,0 +1,150 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests the cost ordering of the checks of a call."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+
+
+import itertools
+import pytest
+from paramvalidator import ParameterValidator, Items, Constraints
+from paramvalidator.planner import check_cost, COST_TYPE, COST_VALUE, COST_CUSTOM, COST_CONTAINER
+from paramvalidator.exceptions import (
+    ParameterValidationException,
+    ParameterKwargValidationException,
+    ParameterNoneValidationException,
+    ParameterTypeValidationException
+)
+
+SPECS = ((list, False, Items((int, False, (0, 10)))), (int, False, (0, 10)), (str, True))
+
+
+def _failure(func, *args, **kwargs):
+    try:
+        func(*args, **kwargs)
+    except ParameterValidationException as ex:
+        return (type(ex).__name__, str(ex.param))
+    return None
+
+
+def test_costs():
+    assert check_cost((int, False)) == COST_TYPE
+    assert check_cost((int, False, (0, 1))) == COST_VALUE
+    assert check_cost((str, False, frozenset({"a"}))) == COST_VALUE
+    assert check_cost((str, False, Constraints(pattern="a+"))) == COST_CUSTOM
+    assert check_cost((list, False, Items((int, False)))) == COST_CONTAINER
+
+
+def test_cheapest_check_fails_first():
+    calls = []
+
+    def counted(values):
+        calls.append(values)
+        return True
+
+    specs = ((list, False, Constraints(predicate=counted)), (int, False))
+    cheapest_first = ParameterValidator(*specs).with_check_order()
+    in_declaration_order = ParameterValidator(*specs).with_check_order("declared")
+
+    @cheapest_first
+    def planned(values, count):
+        return count
+
+    @in_declaration_order
+    def declared(values, count):
+        return count
+
+    assert planned([1], 2) == 2 and len(calls) == 1
+    assert _failure(planned, [1], "2") == ("ParameterTypeValidationException", "2")
+    assert len(calls) == 1
+    assert _failure(declared, [1], "2") == ("ParameterTypeValidationException", "2")
+    assert len(calls) == 2
+
+
+def test_presence_and_none_first():
+    cheapest_first = ParameterValidator((list, False, Items((int, False))), (str, False), key=(str, False)).with_check_order("cost")
+
+    @cheapest_first
+    def myfunc(values, name, **kwargs):
+        return name
+
+    assert myfunc([1], "a", key="k") == "a"
+    with pytest.raises(ParameterKwargValidationException):
+        myfunc(["bad"], None)
+    with pytest.raises(ParameterNoneValidationException) as info:
+        myfunc(["bad"], None, key="k")
+    assert info.value.param == 2
+    with pytest.raises(ParameterTypeValidationException) as info:
+        myfunc(["bad"], "a", key="k")
+    assert str(info.value.param) == "1[0]"
+
+
+def test_single_failures_are_reported_alike():
+    valid = ([1, 2], 5, "a")
+    invalid = ([1, 20], None, 5)
+    functions = [ParameterValidator(*SPECS).with_check_order(order)(lambda values, count, name: count)
+                 for order in ("declared", "cost")]
+    for _ in range(3):
+        for position, bad in itertools.product(range(3), invalid):
+            arguments = list(valid)
+            arguments[position] = bad if bad is not None or position < 2 else None
+            outcomes = {_failure(func, *arguments) for func in functions}
+            assert len(outcomes) == 1
+
+
+def test_unknown_orders_are_rejected():
+    with pytest.raises(ValueError):
+        ParameterValidator((int, False)).with_check_order("adaptive")
+
+
+def test_other_calls_in_declaration_order():
+    cheapest_first = ParameterValidator((list, False, Items((int, False))), (int, False), (int, False)).with_check_order()
+
+    @cheapest_first
+    def myfunc(values, count, limit=3):
+        return count + limit
+
+    assert myfunc([1], 2) == 5
+    assert myfunc([1], count=2, limit=1) == 3
+    with pytest.raises(ParameterTypeValidationException) as info:
+        myfunc(["a"], "b")
+    assert str(info.value.param) == "1[0]"
+
+
+def test_methods_and_settings():
+    cheapest_first = ParameterValidator((list, False, Items((int, False))), (int, False)).with_check_order()
+
+    class Shapes:
+        @cheapest_first
+        def scale(self, values, factor):
+            return [value * factor for value in values]
+
+    assert Shapes().scale([1, 2], 2) == [2, 4]
+    with pytest.raises(ParameterTypeValidationException) as info:
+        Shapes().scale(["a"], "b")
+    assert info.value.param == 2
+
+    with pytest.raises(ValueError):
+        ParameterValidator((int, False)).with_check_order("fastest")
+    previous = ParameterValidator.set_check_order(" Cost ")
+    try:
+        assert ParameterValidator.get_check_order() == "cost"
+        assert ParameterValidator((int, False))(lambda value: value).settings.order == "cost"
+    finally:
+        ParameterValidator.set_check_order(previous)
+    assert ParameterValidator((int, False))(lambda value: value).settings.order == previous
@@ -0,0 +1,117 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests the interned Spec and Schema objects."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+
+import gc
+import pickle
+import weakref
+import pytest
+from paramvalidator import ParameterValidator, Spec, Schema, Constraints
+from paramvalidator.compiler import get_checker
+from paramvalidator.exceptions import ParameterRangeValidationException
+
+
+def test_spec_interning():
+    spec = Spec(int, False, (0, 10))
+    assert spec is Spec(int, False, (0, 10))
+    assert spec == (int, False, (0, 10))
+    assert spec.expected_type is int and spec.allow_none is False and spec.constraint == (0, 10)
+    assert Spec(str, False).constraint is None
+    # Equal but rendered differently, kept apart
+    assert Spec(int, False, (0, 1)) is not Spec(int, False, (0.0, 1.0))
+    assert get_checker(spec) is get_checker(Spec(int, False, (0, 10)))
+    assert pickle.loads(pickle.dumps(spec)) is spec
+    with pytest.raises(AttributeError):
+        spec.expected_type = str
+
+
+def test_schema_interning():
+    schema = Schema((str, False), (int, False, (0, 65535)), timeout=(float, True))
+    assert schema is Schema((str, False), (int, False, (0, 65535)), timeout=(float, True))
+    assert schema is not Schema((str, False), (int, False, (0, 65535)))
+    assert schema.args[0] is Spec(str, False)
+    assert schema.kwargs["timeout"] is Spec(float, True)
+    assert hash(schema) == hash(Schema((str, False), (int, False, (0, 65535)), timeout=(float, True)))
+    assert pickle.loads(pickle.dumps(schema)) is schema
+    with pytest.raises(AttributeError):
+        schema.args = ()
+    with pytest.raises(TypeError):
+        schema.kwargs["timeout"] = (int, True)
+
+    # Identical decorators share the schema
+    first = ParameterValidator((str, False), (int, False, (0, 65535)), timeout=(float, True))
+    assert first.schema is schema
+    assert first.validation_args is schema.args
+
+
+def test_validator_accepts_schema():
+    port = Schema((str, False), (int, False, (0, 65535)))
+
+    @ParameterValidator(port)
+    def connect(host, port):
+        return port
+
+    @ParameterValidator(port)
+    def listen(host, port):
+        return port
+
+    assert connect("localhost", 80) == 80
+    assert listen("localhost", 443) == 443
+    with pytest.raises(ParameterRangeValidationException):
+        connect("localhost", 70000)
+    assert port.compiled_args() is port.compiled_args()
+
+
+def test_specs_tied_to_objects_are_not_retained():
+    def build():
+        predicate = lambda value: value > 0
+        validator = ParameterValidator(x=(int, False, Constraints(predicate=predicate)))
+        assert type(validator.schema.kwargs["x"]) is not Spec
+        assert validator.schema is not ParameterValidator(x=(int, False, Constraints(predicate=predicate))).schema
+        assert list(validator.validate_stream([{"x": 1}, {"x": 0}]))[1][1]
+        return weakref.ref(predicate)
+
+    predicate = build()
+    gc.collect()
+    assert predicate() is None
+    # Built-in functions are identified by value
+    assert Spec(int, False, Constraints(predicate=callable)) is Spec(int, False, Constraints(predicate=callable))
+
+
+def test_specs_of_local_classes_are_not_retained():
+    def build():
+        class Local:
+            pass
+
+        validator = ParameterValidator((Local, False))
+        assert type(validator.schema.args[0]) is not Spec
+
+        @validator
+        def use(value):
+            return value
+
+        assert isinstance(use(Local()), Local)
+        return weakref.ref(Local)
+
+    local = build()
+    gc.collect()
+    assert local() is None
+    # Classes reachable by module and qualified name are interned
+    assert Spec(ParameterValidator, False) is Spec(ParameterValidator, False)
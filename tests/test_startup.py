@@ -0,0 +1,184 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests lazy loading and lazy compilation, which keep import and decoration cheap."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+
+
+import asyncio
+import functools
+import inspect
+import subprocess
+import pytest
+import paramvalidator
+import paramvalidator.exceptions
+from paramvalidator import ParameterValidator
+from paramvalidator.binding import Binding, _signature_layout
+from paramvalidator.exceptions import ParameterTypeValidationException, ParameterCountValidationException
+
+
+def _imported_after(statement):
+    src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+    script = "import sys; sys.path.insert(0, {!r}); {}; print(sorted(sys.modules))".format(src, statement)
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return set(eval(output.stdout))
+
+
+def test_import_is_lazy():
+    modules = _imported_after("import paramvalidator")
+    assert "paramvalidator.validator" not in modules
+    assert "numpy" not in modules
+
+
+def test_decorating_imports_only_what_is_used():
+    modules = _imported_after(
+        "from paramvalidator import ParameterValidator; ParameterValidator((int, False))(lambda a: a)(1)")
+    for name in ("numpy", "inspect", "paramvalidator.batch", "paramvalidator.annotations",
+                 "paramvalidator.asyncwrappers", "paramvalidator.exceptions.aggregate_validation_exception"):
+        assert name not in modules
+
+
+def test_lazy_decoration_defers_imports_and_interning():
+    modules = _imported_after(
+        "from paramvalidator import ParameterValidator; ParameterValidator.set_lazy_compile(True); "
+        "f = ParameterValidator((int, False), name=(str, True))(lambda a, **kwargs: a); "
+        "assert f.__wrapped__(1) == 1; import paramvalidator.schema as schema; assert not schema._schemas")
+    for name in ("paramvalidator.compiler", "paramvalidator.memo", "paramvalidator.telemetry",
+                 "paramvalidator.exceptions.validation_exception"):
+        assert name not in modules
+
+
+def test_lazy_exports():
+    assert paramvalidator.Schema is paramvalidator.schema.Schema
+    assert "ParameterValidator" in dir(paramvalidator)
+    assert "ParameterAggregateValidationException" in dir(paramvalidator.exceptions)
+    with pytest.raises(AttributeError):
+        paramvalidator.Missing
+    with pytest.raises(AttributeError):
+        paramvalidator.exceptions.ParameterMissingException
+
+
+def _binding_layout(func, has_receiver):
+    binding = Binding(func, has_receiver)
+    return binding.names, binding.has_default, binding.var_positional
+
+
+def _signature_binding(func, has_receiver):
+    names, has_default, var_positional = _signature_layout(func)
+    skip = 1 if has_receiver else 0
+    return names[skip:], has_default[skip:], var_positional
+
+
+def test_binding_matches_signature():
+    def plain(a, b, c=1, *args, d, e=2, **kwargs):
+        pass
+
+    def method(self, a, b=None):
+        pass
+
+    funcs = [(plain, False), (method, True), (lambda: None, False)]
+    if sys.version_info >= (3, 8):
+        # Positional only parameters are a syntax error before 3.8
+        namespace = {}
+        exec("def positional_only(a, b=1, /, c=2):\n    pass", namespace)
+        funcs.append((namespace["positional_only"], False))
+    for (func, has_receiver) in funcs:
+        assert _binding_layout(func, has_receiver) == _signature_binding(func, has_receiver)
+
+
+def test_binding_follows_wrapped():
+    def inner(a, b=1):
+        pass
+
+    @functools.wraps(inner)
+    def outer(*args, **kwargs):
+        return inner(*args, **kwargs)
+
+    assert _binding_layout(outer, False) == (("a", "b"), (False, True), False)
+
+
+class Counting(ParameterValidator):
+    builds = 0
+
+    def _build_wrapper(self, *args):
+        Counting.builds += 1
+        return super()._build_wrapper(*args)
+
+
+def test_lazy_compile_defers_to_first_call():
+    Counting.builds = 0
+
+    lazy = Counting((int, False), (str, False)).with_lazy_compile()
+
+    @lazy
+    def myfunc(num, name):
+        return name * num
+
+    assert Counting.builds == 0
+    assert myfunc(2, "a") == "aa"
+    assert myfunc(1, "b") == "b"
+    assert Counting.builds == 1
+    with pytest.raises(ParameterTypeValidationException):
+        myfunc("2", "a")
+    with pytest.raises(ParameterCountValidationException):
+        myfunc(1, "a", 3)
+
+
+def test_global_lazy_compile():
+    previous = ParameterValidator.set_lazy_compile(True)
+    try:
+        assert ParameterValidator.get_lazy_compile()
+
+        class Shape:
+            @ParameterValidator((int, False))
+            def scale(self, factor):
+                return factor
+
+            @ParameterValidator((int, False))
+            @staticmethod
+            def parse(value):
+                return value
+
+            @ParameterValidator((int, False))
+            @classmethod
+            def create(cls, value):
+                return (cls, value)
+
+        shape = Shape()
+        assert shape.scale(2) == 2
+        assert Shape.parse(3) == 3
+        assert Shape.create(4) == (Shape, 4)
+        for call in (lambda: shape.scale("2"), lambda: Shape.parse("3"), lambda: Shape.create("4")):
+            with pytest.raises(ParameterTypeValidationException):
+                call()
+    finally:
+        ParameterValidator.set_lazy_compile(previous)
+    assert not ParameterValidator.get_lazy_compile()
+
+
+def test_lazy_compile_async_is_built_on_decoration():
+    lazy = ParameterValidator((int, False)).with_lazy_compile()
+
+    @lazy
+    async def fetch(num):
+        return num
+
+    assert inspect.iscoroutinefunction(fetch)
+    assert asyncio.run(fetch(5)) == 5
+    with pytest.raises(ParameterTypeValidationException):
+        asyncio.run(fetch("5"))
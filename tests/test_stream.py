@@ -0,0 +1,117 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests validating streams of payload dicts."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+
+
+import itertools
+import json
+import pickle
+import pytest
+from paramvalidator import ParameterValidator, Items
+from paramvalidator.stream import validate_stream
+from paramvalidator.exceptions import (
+    ParameterKwargValidationException,
+    ParameterRangeValidationException,
+    ParameterTypeValidationException
+)
+
+VALIDATOR = ParameterValidator(
+    id=(int, False, (0, 1000)),
+    name=(str, False),
+    tags=(list, True, Items((str, False))))
+
+LINES = [
+    '{"id": 1, "name": "a", "tags": ["x"]}',
+    '{"id": 2000, "tags": [1]}',
+    '{"id": 3, "name": "c"}',
+    '[1, 2]',
+]
+
+
+def _describe(errors):
+    return [(type(ex).__name__, getattr(ex, "param", getattr(ex, "expected", None))) for ex in errors]
+
+
+def test_pairs_report_every_failure():
+    results = list(VALIDATOR.validate_stream(map(json.loads, LINES)))
+    assert [record for (record, _) in results] == [json.loads(line) for line in LINES]
+    errors = [_describe(errors) for (_, errors) in results]
+    assert errors[0] == [] and errors[2] == []
+    assert errors[1][0] == ("ParameterRangeValidationException", "id")
+    assert errors[1][1] == ("ParameterKwargValidationException", "name")
+    assert errors[1][2][0] == "ParameterTypeValidationException"
+    assert str(errors[1][2][1]) == "tags[0]"
+    assert errors[3] == [("ParameterTypeValidationException", "record")]
+    assert results[1][1][0].func is validate_stream
+
+
+def test_only_valid_and_chunked():
+    records = [json.loads(line) for line in LINES]
+    assert list(VALIDATOR.validate_stream(records, only_valid=True)) == [records[0], records[2]]
+    chunks = list(VALIDATOR.validate_stream(records, only_valid=True, chunk_size=2, chunked=True))
+    assert chunks == [[records[0]], [records[2]]]
+    with pytest.raises(ValueError):
+        VALIDATOR.validate_stream(records, chunk_size=0)
+
+
+def _counting_stream(pulled):
+    for index in itertools.count():
+        pulled[0] = index + 1
+        yield {"id": index % 1500, "name": "n"}
+
+
+def test_stream_is_lazy():
+    pulled = [0]
+    results = VALIDATOR.validate_stream(_counting_stream(pulled), chunk_size=10)
+    assert pulled[0] == 0
+    first = list(itertools.islice(results, 15))
+    assert len(first) == 15
+    assert pulled[0] <= 20
+
+
+def test_process_pool_matches_in_process():
+    records = [{"id": index % 1500, "name": str(index), "tags": ["t"] if index % 3 else [index]}
+               for index in range(500)]
+    local = [(record, _describe(errors)) for (record, errors) in VALIDATOR.validate_stream(records, chunk_size=50)]
+    pooled = [(record, _describe(errors))
+              for (record, errors) in VALIDATOR.validate_stream(iter(records), chunk_size=50, processes=2)]
+    assert [str(errors) for (_, errors) in pooled] == [str(errors) for (_, errors) in local]
+    assert [record for (record, _) in pooled] == records
+
+
+def test_process_pool_reads_ahead_bounded():
+    pulled = [0]
+    results = VALIDATOR.validate_stream(_counting_stream(pulled), chunk_size=10, processes=2, only_valid=True)
+    assert len(list(itertools.islice(results, 5))) == 5
+    # At most 2 * processes chunks in flight, plus the chunk being read
+    assert pulled[0] <= 10 * (2 * 2 + 1)
+    results.close()
+
+
+def test_stream_exceptions_pickle():
+    (_, errors), = VALIDATOR.validate_stream([{"id": -1, "tags": [None]}])
+    for ex in errors:
+        copy = pickle.loads(pickle.dumps(ex))
+        assert str(copy) == str(ex)
+    assert isinstance(errors[0], ParameterRangeValidationException)
+    assert isinstance(errors[1], ParameterKwargValidationException)
+    assert pickle.loads(pickle.dumps(Items((int, False), first=2))) == Items((int, False), first=2)
+    with pytest.raises(ParameterTypeValidationException):
+        raise pickle.loads(pickle.dumps(ParameterTypeValidationException(validate_stream, "record", list, dict)))
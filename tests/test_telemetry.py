@@ -0,0 +1,127 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests the opt-in validation telemetry."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+
+import gc
+import threading
+import paramvalidator
+from paramvalidator.telemetry import _registry
+from paramvalidator import ParameterValidator, ParameterValidationException
+
+
+def test_stats_counts():
+    instrumented = ParameterValidator((int, False, (0, 10)), name=(str, False)).with_stats()
+
+    @instrumented
+    def counted(num, **kwargs):
+        return num
+
+    key = __name__ + ".test_stats_counts.<locals>.counted"
+    assert counted(1, name="a") == 1
+    for bad in ((11, dict(name="a")), (None, dict(name="a")), (1, dict()), (12, dict(name="a"))):
+        try:
+            counted(bad[0], **bad[1])
+            assert False
+        except ParameterValidationException:
+            pass
+
+    result = paramvalidator.stats(key)
+    assert result.calls == 5
+    assert result.validation_ns == 0
+    assert result.failures == {
+        ("ParameterRangeValidationException", 1): 2,
+        ("ParameterNoneValidationException", 1): 1,
+        ("ParameterKwargValidationException", "name"): 1,
+    }
+    assert key in paramvalidator.stats()
+
+    paramvalidator.reset_stats()
+    assert paramvalidator.stats(key) == (0, {}, 0)
+
+
+def test_stats_timing_hooks_and_threads():
+    events = []
+
+    def hook(name, exception, elapsed_ns):
+        events.append((type(exception).__name__, elapsed_ns))
+
+    paramvalidator.enable_stats(timing=True)
+    try:
+        class Timed:
+            @ParameterValidator((int, False))
+            def method(self, num):
+                return num
+    finally:
+        paramvalidator.disable_stats()
+
+    key = __name__ + ".test_stats_timing_hooks_and_threads.<locals>.Timed.method"
+    paramvalidator.add_hook(hook)
+    try:
+        instance = Timed()
+        assert instance.method(3) == 3
+        try:
+            instance.method("3")
+        except ParameterValidationException:
+            pass
+    finally:
+        paramvalidator.remove_hook(hook)
+
+    assert [name for (name, _) in events] == ["NoneType", "ParameterTypeValidationException"]
+    assert all(elapsed >= 0 for (_, elapsed) in events)
+
+    threads = [threading.Thread(target=lambda: [instance.method(1) for _ in range(1000)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    result = paramvalidator.stats(key)
+    assert result.calls == 4002
+    assert result.validation_ns > 0
+
+
+def test_ended_threads_are_retired():
+    instrumented = ParameterValidator((int, False)).with_stats()
+
+    @instrumented
+    def per_request(num):
+        return num
+
+    key = __name__ + ".test_ended_threads_are_retired.<locals>.per_request"
+    for _ in range(50):
+        threads = [threading.Thread(target=per_request, args=(1,)) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    gc.collect()
+    assert len(_registry[key]._shards) <= 1
+    assert paramvalidator.stats(key).calls == 200
+    paramvalidator.reset_stats()
+    assert paramvalidator.stats(key).calls == 0
+
+
+def test_stats_disabled_by_default():
+    def plain(num):
+        return num
+
+    wrapped = ParameterValidator((int, False))(plain)
+    wrapped(1)
+    assert "{}.{}".format(plain.__module__, plain.__qualname__) not in paramvalidator.stats()
@@ -0,0 +1,109 @@
+#
+#(c) Microsoft. All rights reserved.
+#
+"""This file tests the metadata and pickling of decorated functions, and calling them in worker processes."""
+import sys
+import os
+
+attempts=1
+found=False
+cur_path = os.getcwd()
+
+while not found:
+    if os.path.exists(os.path.join(cur_path, 'src')):
+        sys.path.append(os.path.join(cur_path, 'src'))
+        found = True
+    cur_path = os.path.split(cur_path)[0]
+    if attempts >= 3:
+        break
+    attempts += 1
+
+
+
+import concurrent.futures
+import inspect
+import pickle
+import pytest
+from paramvalidator import ParameterValidator, ValidatedFunction
+from paramvalidator.exceptions import ParameterTypeValidationException
+
+
+@ParameterValidator((int, False), (str, True))
+def repeat(count, text=None):
+    """Repeats text count times."""
+    return (text or "x") * count
+
+
+def plain(count):
+    return count * 2
+
+
+class Shapes:
+    @ParameterValidator((int, False))
+    def scale(self, factor):
+        return factor
+
+    @ParameterValidator((int, False))
+    @staticmethod
+    def area(side):
+        return side * side
+
+    @ParameterValidator((int, False))
+    @classmethod
+    def named(cls, side):
+        return cls.__name__, side
+
+
+def test_metadata():
+    assert isinstance(repeat, ValidatedFunction)
+    assert repeat.__name__ == "repeat" and repeat.__qualname__ == "repeat"
+    assert repeat.__module__ == __name__
+    assert repeat.__doc__ == "Repeats text count times."
+    assert repeat.__wrapped__.__code__.co_varnames[:2] == ("count", "text")
+    assert str(inspect.signature(repeat)) == "(count, text=None)"
+    assert repeat(2, "ab") == "abab"
+
+    assert Shapes.scale.__qualname__ == "Shapes.scale"
+    assert str(inspect.signature(Shapes.scale)) == "(self, factor)"
+    assert Shapes().scale(3) == 3
+    assert Shapes.area.__name__ == "area" and Shapes.area(3) == 9
+    assert Shapes.named(2) == ("Shapes", 2)
+
+
+def test_pickles_by_name():
+    for func in (repeat, Shapes.scale, Shapes.area):
+        assert pickle.loads(pickle.dumps(func)) is func
+    assert pickle.loads(pickle.dumps(Shapes.named))(4) == ("Shapes", 4)
+    assert pickle.loads(pickle.dumps(Shapes().scale))(5) == 5
+
+
+def test_pickles_by_value_and_rebuilds():
+    doubled = ParameterValidator((int, False)).with_lazy_compile().with_stats()(plain)
+    copy = pickle.loads(pickle.dumps(doubled))
+    assert copy is not doubled
+    assert copy.__wrapped__ is plain and copy.schema is doubled.schema
+    assert copy.settings == doubled.settings
+    assert copy(3) == 6
+    with pytest.raises(ParameterTypeValidationException):
+        copy("3")
+
+    local = ParameterValidator((int, False))(lambda value: value)
+    with pytest.raises((pickle.PicklingError, AttributeError)):
+        pickle.dumps(local)
+
+
+def test_exceptions_pickle_the_original_function():
+    with pytest.raises(ParameterTypeValidationException) as info:
+        repeat("2")
+    ex = pickle.loads(pickle.dumps(info.value))
+    assert ex.func is repeat.__wrapped__
+    assert str(ex) == str(info.value)
+
+
+def test_process_pool():
+    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as pool:
+        assert list(pool.map(repeat, [1, 2, 3], ["a", "b", "c"])) == ["a", "bb", "ccc"]
+        assert pool.submit(Shapes.area, 4).result() == 16
+        with pytest.raises(ParameterTypeValidationException) as info:
+            pool.submit(repeat, "1").result()
+    assert info.value.func is repeat.__wrapped__ and info.value.param == 1